@@ -15,10 +15,6 @@ from __future__ import (absolute_import, division, print_function,
 if __name__ == "__main__":
     __package__ = str("myplotspec")
     import myplotspec
-import h5py
-import numpy as np
-import pandas as pd
-from IPython import embed
 from . import sformat, wiprint
 ################################### CLASSES ###################################
 class Dataset(object):
@@ -41,6 +37,9 @@ class Dataset(object):
 
         Arguments:
           infile (str): Path to infile
+          usecols (list): Columns to read; if provided, included in key
+            (sorted, without duplicates), since :meth:`__init__` and
+            :meth:`read` read only these columns
           kwargs (dict): Additional keyword arguments
 
         Returns:
@@ -61,8 +60,32 @@ class Dataset(object):
             if isinstance(value, list):
                 value = tuple(value)
             read_csv_kw.append((key, value))
+        usecols = kwargs.get("usecols")
+        if usecols is not None:
+            if not isinstance(usecols, (list, tuple)):
+                usecols = [usecols]
+            return (cls, expandvars(infile), tuple(read_csv_kw),
+                tuple(sorted(set(usecols), key=str)))
         return (cls, expandvars(infile), tuple(read_csv_kw))
 
+    @staticmethod
+    def get_cache_usecols(cache_key):
+        """
+        Determines the columns read by the dataset stored with a key.
+
+        Used by :func:`~myplotspec.load_dataset` to check that a dataset
+        loaded from the cache using ``loose`` includes the columns that
+        are requested.
+
+        Arguments:
+          cache_key (tuple): Cache key, as returned by
+            :meth:`get_cache_key`
+
+        Returns:
+          tuple: Columns read; None if all columns were read
+        """
+        return cache_key[3] if len(cache_key) > 3 else None
+
     @classmethod
     def main(cls):
         """
@@ -104,6 +127,9 @@ class Dataset(object):
             be used
           kde_kw (dict, optional): Keyword arguments passed to
             :function:`sklearn.neighbors.KernelDensity`
+          draft (bool, optional): Calculate a quick approximation, using
+            a default grid of 100 points and no more than 10000 samples
+            of each column
           verbose (int): Level of verbose output
           kwargs (dict): Additional keyword arguments
 
@@ -118,10 +144,14 @@ class Dataset(object):
         """
         from collections import OrderedDict
         import six
+        import numpy as np
+        import pandas as pd
         from sklearn.neighbors import KernelDensity
+        from .profiler import span
 
         # Process arguments
         verbose = kwargs.get("verbose", 1)
+        draft = kwargs.get("draft", False)
         if verbose >= 1:
             wiprint("""Calculating probability distribution over DataFrame""")
         if columns is None:
@@ -169,7 +199,8 @@ class Dataset(object):
                     grid[column] = all_grid
                 else:
                     grid[column] = np.linspace(series.min() - 3 * series.std(),
-                      series.max() + 3 * series.std(), 1000)
+                      series.max() + 3 * series.std(),
+                      100 if draft else 1000)
 
             # Calculate probability distributions
             kde_kw = kwargs.get("kde_kw", {})
@@ -181,8 +212,13 @@ class Dataset(object):
                             "{0} using a kernel density estimate".format(
                       column))
                 kde = KernelDensity(bandwidth=bandwidth[column], **kde_kw)
-                kde.fit(series.dropna()[:, np.newaxis])
-                pdf = np.exp(kde.score_samples(grid[column][:, np.newaxis]))
+                samples = series.dropna()
+                if draft and samples.size > 10000:
+                    samples = samples[::int(np.ceil(samples.size / 10000))]
+                with span("calc_pdist", column=column, size=samples.size):
+                    kde.fit(samples.values[:, np.newaxis])
+                    pdf = np.exp(kde.score_samples(
+                        grid[column][:, np.newaxis]))
                 pdf /= pdf.sum()
                 series_pdist = pd.DataFrame(pdf, index=grid[column],
                   columns=["probability"])
@@ -391,6 +427,8 @@ class Dataset(object):
             pandas.DataFrame(...) (hdf5 only)
           read_csv_kw (dict): Keyword arguments passed to
             pandas.read_csv(...) (text only)
+          usecols (list): Columns to read, if not all columns are
+            needed; see :meth:`read`
           verbose (int): Level of verbose output
           debug (int): Level of debug output
           kwargs (dict): Additional keyword arguments
@@ -401,6 +439,8 @@ class Dataset(object):
           - Implement 'targets' other than pandas DataFrame?
         """
         from os.path import expandvars
+        import numpy as np
+        import pandas as pd
 
         # Process arguments
         verbose = kwargs.get("verbose", 1)
@@ -415,18 +455,16 @@ class Dataset(object):
             if infile.endswith("h5") or infile.endswith("hdf5"):
                 h5_mode = "h5py"
                 if h5_mode == "h5py":
-
                     dataframe_kw = kwargs.get("dataframe_kw", {})
-                    with h5py.File(expandvars(infile)) as h5_file:
+                    with HDF5FileHolder.open(expandvars(infile)) as h5_file:
                         if address is None:
                             address = sorted(list(h5_file.keys()))[0]
                         if "slice" in kwargs:
                             slc = kwargs.pop("slice")
                             if not isinstance(slc, slice):
-                                slc = slice(*kwargs["slice"])
-                            data = np.array(h5_file[address][slc])
+                                slc = slice(*slc)
                         else:
-                            data = np.array(h5_file[address])
+                            slc = slice(None)
                         attrs = dict(h5_file[address].attrs)
                         if "fields" in dataframe_kw:
                             dataframe_kw["columns"] = dataframe_kw.pop(
@@ -437,6 +475,16 @@ class Dataset(object):
                             dataframe_kw["columns"] = list(attrs["fields"])
                         elif "columns" in attrs:
                             dataframe_kw["columns"] = list(attrs["columns"])
+                        positions = self._get_usecols_positions(
+                          h5_file[address], dataframe_kw.get("columns"),
+                          kwargs.get("usecols"))
+                        if positions is None:
+                            data = np.array(h5_file[address][slc])
+                        else:
+                            data = self._read_hdf5_columns(
+                              h5_file[address], positions, slc)
+                            dataframe_kw["columns"] = [
+                              dataframe_kw["columns"][i] for i in positions]
                         self.dataframe = pd.DataFrame(data=data,
                           **dataframe_kw)
                 else:
@@ -448,6 +496,8 @@ class Dataset(object):
                           "delimiter" in read_csv_kw and "delim_whitespace"
                   in read_csv_kw):
                     del (read_csv_kw["delimiter"])
+                self._set_usecols_kw(expandvars(infile), read_csv_kw,
+                  kwargs.get("usecols"))
                 self.dataframe = pd.read_csv(expandvars(infile), **read_csv_kw)
                 if (
                           self.dataframe.index.name is not None and
@@ -468,6 +518,10 @@ class Dataset(object):
             environment variables
           dataframe_kw (dict): Keyword arguments passed to
             :class:`DataFrame<pandas:pandas.DataFrame>`
+          usecols (list): Columns to read; only these columns of the
+            values are read from the file, if the values are
+            two-dimensional and their columns are named; columns not
+            present are ignored
           verbose (int): Level of verbose output
           kwargs (dict): Additional keyword arguments
 
@@ -476,6 +530,9 @@ class Dataset(object):
         """
         from os.path import expandvars
         import re
+        import h5py
+        import numpy as np
+        import pandas as pd
 
         # Process arguments
         verbose = kwargs.get("verbose", 1)
@@ -489,7 +546,7 @@ class Dataset(object):
         dataframe_kw = kwargs.get("dataframe_kw", {})
 
         # Read DataFrame
-        with h5py.File(path) as h5_file:
+        with HDF5FileHolder.open(path) as h5_file:
 
             # Determine address
             if address is None:
@@ -507,14 +564,14 @@ class Dataset(object):
 
             # Determine address of values and index
             if isinstance(h5_file[address], h5py._hl.dataset.Dataset):
-                values = np.array(h5_file[address])
+                values = h5_file[address]
                 index = np.arange(values.shape[0])
             elif isinstance(h5_file[address], h5py._hl.group.Group):
                 if address + "/values" in h5_file:
-                    values = np.array(h5_file[address + "/values"])
+                    values = h5_file[address + "/values"]
                 elif len(h5_file[address].keys() == 1):
-                    values = np.array(
-                      h5_file[address + "/" + h5_file[address].keys()[0]])
+                    values = h5_file[address + "/" +
+                      h5_file[address].keys()[0]]
                 if address + "/index" in h5_file:
                     index = np.array(h5_file[address + "/index"])
                 else:
@@ -543,6 +600,17 @@ class Dataset(object):
                     columns = pd.MultiIndex.from_tuples(columns)
                 dataframe_kw["columns"] = columns
 
+            # Read values; if only some columns are used, read only
+            # those columns (in the order in which they are stored)
+            positions = self._get_usecols_positions(values,
+                dataframe_kw.get("columns"), kwargs.get("usecols"))
+            if positions is None:
+                values = np.array(values)
+            else:
+                values = self._read_hdf5_columns(values, positions)
+                dataframe_kw["columns"] = [dataframe_kw["columns"][i] for i in
+                    positions]
+
             if len(index.shape) == 1:
                 df = pd.DataFrame(data=values, index=index, **dataframe_kw)
                 if "index_name" in attrs:
@@ -564,6 +632,9 @@ class Dataset(object):
             variables
           read_csv_kw (dict): Keyword arguments passed to
             :func:`read_csv<pandas.read_csv>`
+          usecols (list): Columns to read, in addition to the index;
+            only these columns are parsed, unless *read_csv_kw* provides
+            'usecols'; columns not present are ignored
           verbose (int): Level of verbose output
           kwargs (dict): Additional keyword arguments
 
@@ -572,6 +643,7 @@ class Dataset(object):
         """
         from os.path import expandvars
         import warnings
+        import pandas as pd
 
         # Process arguments
         verbose = kwargs.get("verbose", 1)
@@ -586,12 +658,98 @@ class Dataset(object):
             wiprint("""Reading DataFrame from '{0}' """.format(infile))
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
+
+            self._set_usecols_kw(infile, read_csv_kw, kwargs.get("usecols"))
             df = pd.read_csv(infile, **read_csv_kw)
         if (df.index.name is not None and df.index.name.startswith("#")):
             df.index.name = df.index.name.lstrip("#")
 
         return df
 
+    @staticmethod
+    def _set_usecols_kw(infile, read_csv_kw, usecols):
+        """
+        Restricts the columns parsed from a text file to those used.
+
+        Reads the header of the file to identify the index and the used
+        columns, and sets 'usecols' (and, by name, 'index_col') of
+        *read_csv_kw* accordingly; columns not present are ignored.
+
+        Arguments:
+          infile (str): Path to input file
+          read_csv_kw (dict): Keyword arguments passed to
+            :func:`read_csv<pandas.read_csv>`; modified in place, unless
+            it already provides 'usecols'
+          usecols (list): Columns to read; if None, all are read
+        """
+        import pandas as pd
+
+        if usecols is None or "usecols" in read_csv_kw:
+            return
+        if not isinstance(usecols, (list, tuple)):
+            usecols = [usecols]
+        header = pd.read_csv(infile, nrows=0, **read_csv_kw)
+        index_col = read_csv_kw.get("index_col")
+        if index_col is None or index_col is False:
+            index_names = []
+        else:
+            index_names = list(header.index.names)
+        if None in index_names:
+            return
+        read_csv_kw["usecols"] = index_names + [c for c in header.columns if
+            c in usecols]
+        if len(index_names) == 1:
+            read_csv_kw["index_col"] = index_names[0]
+        elif len(index_names) > 1:
+            read_csv_kw["index_col"] = index_names
+
+    @staticmethod
+    def _get_usecols_positions(values, columns, usecols):
+        """
+        Determines the positions of used columns within hdf5 values.
+
+        Arguments:
+          values (Dataset): hdf5 dataset of values
+          columns (list): Names of columns of values, or None
+          usecols (list): Columns to read; if None, all are read
+
+        Returns:
+          list: Positions of used columns, in the order in which they
+          are stored; None if all columns are to be read, or if columns
+          cannot be selected because values are not two-dimensional or
+          columns are not named by a flat list
+        """
+        import numpy as np
+
+        if (usecols is None or columns is None or len(values.shape) != 2
+          or len(columns) != values.shape[1] or np.array(
+          [isinstance(c, (tuple, np.ndarray)) for c in columns]).any()):
+            return None
+        if not isinstance(usecols, (list, tuple)):
+            usecols = [usecols]
+        return [i for i, c in enumerate(columns) if c in usecols or
+            (isinstance(c, bytes) and c.decode("utf-8") in usecols)]
+
+    @staticmethod
+    def _read_hdf5_columns(values, positions, slc=slice(None)):
+        """
+        Reads selected columns of hdf5 values.
+
+        Arguments:
+          values (Dataset): hdf5 dataset of values
+          positions (list): Positions of columns, in increasing order
+          slc (slice): Rows to read
+
+        Returns:
+          ndarray: Values of selected columns
+        """
+        import numpy as np
+
+        if len(positions) == 0:
+            n_rows = len(range(*slc.indices(values.shape[0])))
+            return np.zeros((n_rows, 0), values.dtype)
+        return values[slc, positions]
+
     def _write_hdf5(self, outfile, **kwargs):
         """
         Writes DataFrame to hdf5.
@@ -610,6 +768,8 @@ class Dataset(object):
         from os.path import expandvars
         import re
         import six
+        import h5py
+        import numpy as np
         from . import multi_get
 
         # Process arguments
@@ -724,16 +884,24 @@ class Dataset(object):
             or name of class in form of 'package.module.class'; if None,
             will be set to self.__class__; if '__nocls_',
             function will return None
+          lazy (bool): Defer loading until data are first accessed; see
+            :func:`~myplotspec.load_dataset`
 
         Returns:
-          object: Dataset, either newly initialized or copied from cache
+          object: Dataset, either newly initialized or copied from cache,
+          or, if *lazy*, a :class:`DatasetProxy` that loads it when its
+          data are first accessed
         """
         from . import load_dataset
+        from .profiler import span
 
         if cls is None:
             cls = type(self)
-        return load_dataset(cls=cls, dataset_cache=self.dataset_cache,
-          **kwargs)
+        if kwargs.pop("lazy", False):
+            return DatasetProxy(self.load_dataset, cls=cls, **kwargs)
+        with span("load_dataset", infile=kwargs.get("infile")):
+            return load_dataset(cls=cls, dataset_cache=self.dataset_cache,
+              **kwargs)
 
     def read(self, **kwargs):
         """
@@ -771,6 +939,9 @@ class Dataset(object):
             :class:`DataFrame<pandas.DataFrame>` (hdf5 only)
           read_csv_kw (dict): Keyword arguments passed to
             :func:`read_csv<pandas.read_csv>` (text only)
+          usecols (list): Columns to read, if not all columns are
+            needed; only these columns are parsed from text files, and
+            read from hdf5 files
           indexfile (str): Path to index file; may contain environment
             variables
           verbose (int): Level of verbose output
@@ -856,6 +1027,162 @@ class Dataset(object):
             self._write_text(outfile=outfile, **kwargs)
 
 
+class DatasetProxy(object):
+    """
+    Stands in for a dataset until its data are first accessed.
+
+    Records the function and keyword arguments with which a dataset is
+    to be loaded; the dataset is loaded (typically through a dataset
+    cache) on first access to any of its attributes (e.g.
+    ``dataframe``), and all attribute access is thereafter passed on to
+    it. This allows datasets to be requested when a figure is
+    configured, but loaded only if they are drawn.
+
+    Since the proxy is not itself a dataset, ``isinstance`` and ``type``
+    report :class:`DatasetProxy`; :meth:`materialize` returns the
+    dataset itself.
+    """
+    __slots__ = ("_load", "_kwargs", "_dataset", "_lock")
+
+    def __init__(self, load, **kwargs):
+        """
+        Initializes.
+
+        Arguments:
+          load (function): Function that loads dataset, called with
+            *kwargs*
+          kwargs (dict): Keyword arguments with which to load dataset
+        """
+        from threading import Lock
+
+        object.__setattr__(self, "_load", load)
+        object.__setattr__(self, "_kwargs", kwargs)
+        object.__setattr__(self, "_dataset", None)
+        object.__setattr__(self, "_lock", Lock())
+
+    def __getattr__(self, name):
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.materialize(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self.materialize(), name)
+
+    def __repr__(self):
+        if self._dataset is None:
+            return "<DatasetProxy of '{0}' (not loaded)>".format(
+                self._kwargs.get("infile", self._kwargs.get("infiles")))
+        return "<DatasetProxy of {0!r}>".format(self._dataset)
+
+    def materialize(self):
+        """
+        Loads dataset, if not already loaded.
+
+        Returns:
+          object: Dataset
+        """
+        if self._dataset is None:
+            with self._lock:
+                if self._dataset is None:
+                    object.__setattr__(self, "_dataset",
+                        self._load(**self._kwargs))
+        return self._dataset
+
+
+class HDF5FileHolder(object):
+    """
+    Holds hdf5 files open for reading on the current thread.
+
+    Within a ``with`` block of a holder, each hdf5 file read by
+    :meth:`Dataset.read` (using :meth:`open`) on the same thread is
+    opened only once, and remains open until the block exits; this
+    allows many datasets to be read from different addresses within
+    the same file without reopening it for each. Outside of such a
+    block, each read opens and closes the file.
+
+    Attributes:
+      files (dict): Open files, keyed by path
+    """
+    _local = None
+
+    def __init__(self):
+        """
+        Initializes.
+        """
+        self.files = {}
+
+    def __enter__(self):
+        from threading import local
+
+        if HDF5FileHolder._local is None:
+            HDF5FileHolder._local = local()
+        holders = getattr(HDF5FileHolder._local, "holders", None)
+        if holders is None:
+            holders = HDF5FileHolder._local.holders = []
+        holders.append(self)
+        return self
+
+    def __exit__(self, *args):
+        HDF5FileHolder._local.holders.remove(self)
+        for h5_file in self.files.values():
+            h5_file.close()
+        self.files = {}
+        return False
+
+    def get(self, path):
+        """
+        Opens a file for reading, or returns it if it is already open.
+
+        Arguments:
+          path (str): Path to hdf5 file
+
+        Returns:
+          File: Open file
+        """
+        import h5py
+
+        if path not in self.files:
+            self.files[path] = h5py.File(path, "r")
+        return self.files[path]
+
+    @classmethod
+    def open(cls, path):
+        """
+        Opens a file for reading within a ``with`` statement.
+
+        Arguments:
+          path (str): Path to hdf5 file
+
+        Returns:
+          Context manager that returns the open file; if a holder is
+          active on the current thread, the file is held open by the
+          holder, and is not closed when the ``with`` statement exits
+        """
+        import h5py
+
+        holders = getattr(cls._local, "holders", None)
+        if holders:
+            return _HeldFile(holders[-1].get(path))
+        return h5py.File(path)
+
+
+class _HeldFile(object):
+    """
+    Returns a file held open by a :class:`HDF5FileHolder` within a
+    ``with`` statement, without closing it.
+    """
+
+    def __init__(self, h5_file):
+        self.h5_file = h5_file
+
+    def __enter__(self):
+        return self.h5_file
+
+    def __exit__(self, *args):
+        return False
+
+
 #################################### MAIN #####################################
 if __name__ == "__main__":
     Dataset.main()
@@ -87,6 +87,14 @@ class FigureManager(object):
         This may be passed on from :meth:`draw_dataset` to the dataset
         classes' __init__ methods, which may in turn add their own
         datasets to it.
+      dataset_column_args (list): Arguments of :meth:`draw_dataset`
+        that name the columns of its dataset that it draws (e.g.
+        ``['x_column', 'y_column']``); see :meth:`get_dataset_kw`
+      draft_dpi (int): Resolution of figures drawn in draft mode; see
+        :meth:`draw_report`
+      prefetcher (DatasetPrefetcher): Loads datasets into
+        :attr:`dataset_cache` ahead of drawing, while
+        :meth:`draw_report` is drawing with ``prefetch``; otherwise None
 
     .. todo:
       - MAJOR REWRITE: specification will be stored in an instance variable and
@@ -119,6 +127,9 @@ class FigureManager(object):
     from .manage_kwargs import manage_kwargs
     from .manage_output import manage_output
 
+    draft_dpi = 50
+    dataset_column_args = []
+
     available_presets = """
       letter:
         class: target
@@ -309,23 +320,38 @@ class FigureManager(object):
 
     def __init__(self, *args, **kwargs):
         """
+        Defaults and presets are stored read-only in :attr:`defaults` and
+        :attr:`available_presets`, so that they may be compiled once for
+        each method by :class:`~.manage_defaults_presets.
+        manage_defaults_presets`; to change them, assign new values.
+
         Arguments:
           defaults (string, dict, optional): Default arguments; may be a
             yaml string, path to a yaml file, or a dictionary; if not
             provided pulled from self.defaults
+          available_presets (string, dict, optional): Available presets;
+            see :meth:`initialize_presets`
+          dataset_cache (dict, optional): Cache of previously-loaded
+            datasets; may be any mapping, such as a
+            :class:`~myplotspec.shared_cache.SharedDatasetCache` shared
+            with other processes; if not provided, an empty dict
           args (tuple): Additional positional arguments
           kwargs (dict): Additional keyword arguments
         """
-        from . import get_yaml
+        from . import get_read_only, get_yaml
 
+        dataset_cache = kwargs.pop("dataset_cache", None)
         defaults = get_yaml(kwargs.get("defaults",
-            self.defaults if hasattr(self, "defaults") else {}))
+            self.defaults if hasattr(self, "defaults") else {}),
+            read_only=True)
         self.defaults = defaults
 
         available_presets = self.initialize_presets(*args, **kwargs)
-        self.available_presets = available_presets
+        self.available_presets = get_read_only(available_presets)
 
-        self.dataset_cache = {}
+        self.dataset_cache = dataset_cache if dataset_cache is not None \
+            else {}
+        self.prefetcher = None
 
         super(FigureManager, self).__init__(*args, **kwargs)
 
@@ -370,96 +396,284 @@ class FigureManager(object):
         """
         When called as a function, calls :meth:`draw_report`.
 
+        If ``plan_cache`` is True, the plan is first obtained from
+        :meth:`compile_report`, and passed to :meth:`draw_report`
+        alongside the yaml spec stored with it, so that a plan loaded
+        from cache is drawn without loading the yaml file.
+
         Arguments:
           args (tuple): Passed to :meth:`draw_report`
           kwargs (dict): Passed to :meth:`draw_report`
+
+        Returns:
+          Return value of :meth:`draw_report`
         """
-        self.draw_report(*args, **kwargs)
+        if kwargs.pop("plan_cache", False) and "plan" not in kwargs:
+            plan = self.compile_report(plan_cache=True, **kwargs)
+            kwargs["plan"] = plan
+            kwargs["yaml_spec"] = plan.yaml_spec
+        return self.draw_report(*args, **kwargs)
 
-    @manage_defaults_presets()
-    @manage_kwargs()
-    def draw_report(self, verbose=1, debug=0, **kwargs):
+    def compile_report(self, plan_cache=False, **kwargs):
         """
-        Draws one or more figures based on provided specifications.
+        Compiles the specification of a report into a render plan.
 
-        Figure specs are provided in a dict structured as follows::
+        Resolves the arguments of :meth:`draw_report`, and of
+        :meth:`draw_figure`, :meth:`draw_subplot`, and
+        :meth:`draw_dataset` for each figure, subplot, and dataset, in
+        the same manner as they are resolved while drawing, but without
+        loading data or drawing anything. The resulting plan may be
+        inspected, and then passed to :meth:`draw_report`.
 
-            figures = {
-                'all': {
-                    'shared_xlabel': 'Time',
-                    'shared_ylabel': 'Measurement',
-                    'shared_legend': True,
-                    ...
-                },
-                '0': {
-                    'title': 'Trial 1',
-                    'subplots': {
-                        ...
-                    },
-                    ...
-                },
-                '1': {
-                    'title': 'Trial 2',
-                    'subplots': {
-                        ...
-                    },
-                    ...
-                },
-                '2': {
-                    'title': 'Trial 3',
-                    'subplots': {
-                        ...
-                    },
-                    ...
-                },
-                ...
-            }
+        If ``draft`` is True, each figure, subplot, and dataset is
+        resolved with ``draft`` True, and the output of each figure is
+        adjusted using :meth:`set_draft_output`.
 
-        The values stored at each (0-indexed) integer key provide the
-        arguments to be passed to :meth:`draw_figure` for each of a
-        series of figures. Values stored at 'all' are passed to each
-        figure, but overridden by values specific to that figure.
+        Arguments are resolved by calling each method with
+        ``resolve_only``, which is handled by
+        :class:`~.manage_kwargs.manage_kwargs`; each of the four
+        methods must therefore be wrapped by it, including when
+        overridden by a subclass (see :meth:`get_unwrapped_methods`).
+
+        Arguments:
+          plan_cache (bool): Load plan from, and store plan in, a cache
+            file alongside the yaml file; see :meth:`get_plan_cache`
+          kwargs (dict): Arguments accepted by :meth:`draw_report`
+
+        Returns:
+          RenderPlan: Resolved arguments of each figure, subplot, and
+          dataset
+
+        Raises:
+          TypeError: :meth:`draw_report`, :meth:`draw_figure`,
+            :meth:`draw_subplot`, or :meth:`draw_dataset` is not wrapped
+            by :class:`~.manage_kwargs.manage_kwargs`
+        """
+        from collections import OrderedDict
+        from warnings import warn
+        from .RenderPlan import RenderPlan, RenderPlanNode
+
+        # Check that each method resolves its arguments without drawing
+        for name in self.get_unwrapped_methods():
+            raise TypeError("{0}.{1} is not wrapped by manage_kwargs, "
+                "and so cannot resolve its arguments without drawing; "
+                "decorate it with @manage_kwargs() to compile "
+                "reports".format(type(self).__name__, name))
+
+        # Load plan from cache
+        if plan_cache:
+            cache_file, cache_key = self.get_plan_cache(**kwargs)
+            if cache_file is not None:
+                plan = RenderPlan.load(cache_file, cache_key)
+                if plan is not None:
+                    if kwargs.get("verbose", 1) >= 1:
+                        print("Render plan loaded from '{0}'.".format(
+                            cache_file))
+                    return plan
+
+        report_kw = self.draw_report(resolve_only=True, **kwargs)
+        draft = report_kw.get("draft", False)
+        nodes = []
+
+        figure_kws = OrderedDict()
+        for i, figure_spec in self.get_figure_specs(**report_kw).items():
+            if draft:
+                figure_spec["draft"] = True
+            figure_kws[i] = self.draw_figure(resolve_only=True, **figure_spec)
+        if draft:
+            self.set_draft_output(figure_kws)
+
+        for i, figure_kw in figure_kws.items():
+            figure_node = len(nodes)
+            nodes.append(RenderPlanNode.from_kwargs("figure", (i,), None,
+                figure_kw))
+
+            for j, subplot_spec in self.get_subplot_specs(
+              **figure_kw).items():
+                if draft:
+                    subplot_spec["draft"] = True
+                subplot_kw = self.draw_subplot(resolve_only=True,
+                    **subplot_spec)
+                subplot_node = len(nodes)
+                nodes.append(RenderPlanNode.from_kwargs("subplot", (i, j),
+                    figure_node, subplot_kw))
+
+                for k, dataset_spec in self.get_dataset_specs(
+                  **subplot_kw).items():
+                    if draft:
+                        dataset_spec["draft"] = True
+                    dataset_kw = self.draw_dataset(resolve_only=True,
+                        **dataset_spec)
+                    nodes.append(RenderPlanNode.from_kwargs("dataset",
+                        (i, j, k), subplot_node, dataset_kw))
+        plan = RenderPlan(nodes, yaml_spec=report_kw.get("yaml_spec"))
+
+        # Store plan in cache
+        if plan_cache and cache_file is not None:
+            try:
+                plan.dump(cache_file, cache_key)
+            except (IOError, OSError) as error:
+                warn("Render plan could not be stored in '{0}': {1}".format(
+                    cache_file, error))
+
+        return plan
+
+    def get_unwrapped_methods(self):
+        """
+        Lists the drawing methods that cannot resolve their arguments
+        without drawing.
+
+        Returns:
+          list: Names of those of :meth:`draw_report`,
+          :meth:`draw_figure`, :meth:`draw_subplot`, and
+          :meth:`draw_dataset` that are not wrapped by
+          :class:`~.manage_kwargs.manage_kwargs` (e.g. because they are
+          overridden by a subclass without it)
+        """
+        return [name for name in ["draw_report", "draw_figure",
+            "draw_subplot", "draw_dataset"] if not getattr(
+            getattr(self, name), "_mps_manage_kwargs", False)]
+
+    def set_draft_output(self, figure_kws):
+        """
+        Adjusts the output of figures to be drawn in draft mode.
+
+        Each figure is saved as png at :attr:`draft_dpi`, alongside its
+        outfiles; 'figure.pdf' is saved as 'figure.draft.png'. Figures
+        that share a multi-page pdf outfile are instead saved as
+        'figure.draft.1.png', 'figure.draft.2.png', etc. Since only the
+        resolution is changed, the layout of each figure is unchanged.
+
+        Arguments:
+          figure_kws (OrderedDict): Resolved arguments of each figure,
+            keyed by figure index; modified in place
+        """
+        from os.path import expandvars, splitext
+        import six
+        from . import get_writable
+
+        def get_outfiles(figure_kw):
+            outfile = figure_kw.get("outfile",
+                self.manage_output.default_outfile)
+            if not isinstance(outfile, list):
+                outfile = [outfile]
+            return [expandvars(of) for of in outfile if isinstance(of,
+                six.string_types)]
+
+        n_pages = {}
+        for figure_kw in figure_kws.values():
+            for outfile in get_outfiles(figure_kw):
+                if outfile.endswith("pdf"):
+                    n_pages[outfile] = n_pages.get(outfile, 0) + 1
+
+        pages = {}
+        for figure_kw in figure_kws.values():
+            draft_outfiles = []
+            for outfile in get_outfiles(figure_kw):
+                draft_outfile = splitext(outfile)[0] + ".draft"
+                if n_pages.get(outfile, 0) > 1:
+                    pages[outfile] = pages.get(outfile, 0) + 1
+                    draft_outfile += ".{0}".format(pages[outfile])
+                draft_outfile += ".png"
+                if draft_outfile not in draft_outfiles:
+                    draft_outfiles.append(draft_outfile)
+            figure_kw["outfile"] = draft_outfiles
+
+            savefig_kw = get_writable(figure_kw.get("savefig_kw", {}))
+            savefig_kw.pop("format", None)
+            savefig_kw["dpi"] = self.draft_dpi
+            figure_kw["savefig_kw"] = savefig_kw
+
+    def get_plan_cache(self, **kwargs):
+        """
+        Determines the cache file and key of a report's render plan.
+
+        The cache file is stored alongside the yaml file, with the
+        extension '.plan'. The key reflects the yaml file (path,
+        modification time, and size), this manager's defaults and
+        presets, the remaining arguments, and the version of the code
+        that resolves them (modification time and size of the modules
+        of this class and its bases, and of myplotspec's decorators and
+        render plan),
+        so that a change to any of these causes the plan to be compiled
+        again.
+
+        Arguments:
+          yaml_spec (str): Path to yaml file
+          kwargs (dict): Additional arguments accepted by
+            :meth:`draw_report`
+
+        Returns:
+          (str, str): Path to cache file and key; (None, None) if
+          yaml_spec is not the path to a yaml file
+        """
+        from inspect import getmodule
+        from os import stat
+        from os.path import abspath, isfile
+        import sys
+        import six
+        from . import get_digest
+        from .manage_defaults_presets import manage_defaults_presets
+        from .manage_kwargs import manage_kwargs
+        from .RenderPlan import RenderPlan
+
+        yaml_spec = kwargs.get("yaml_spec")
+        if (not isinstance(yaml_spec, six.string_types) or "\n" in yaml_spec
+          or not isfile(yaml_spec)):
+            return None, None
+
+        modules = [getmodule(cls) for cls in type(self).__mro__ if cls is not
+            object] + [getmodule(manage_defaults_presets),
+            getmodule(manage_kwargs), getmodule(RenderPlan),
+            sys.modules[__package__]]
+        version = [tuple(sys.version_info[:2])]
+        for path in sorted(set([getattr(m, "__file__", None) for m in
+          modules])):
+            if path is not None and isfile(path):
+                info = stat(path)
+                version.append((path, info.st_mtime, info.st_size))
+
+        info = stat(yaml_spec)
+        source = (abspath(yaml_spec), info.st_mtime, info.st_size)
+        arguments = dict([(k, v) for k, v in kwargs.items() if k not in
+            ("yaml_spec", "plan_cache")])
+
+        return "{0}.plan".format(yaml_spec), get_digest(
+            [version, source, self.defaults, self.available_presets,
+                arguments])
+
+    def get_figure_specs(self, verbose=1, debug=0, **kwargs):
+        """
+        Prepares the arguments with which to draw each figure of a report.
 
         Arguments:
           figure[s] (dict): Figure specifications
           preset[s] (str, list, optional): Selected preset(s); presets
             loaded from figure specification will take precedence over
             those passed as arguments
-          yaml_spec (str, dict, optional): Argument data structure; may
-            be string path to yaml file, yaml-format string, or
-            dictionary
+          yaml_spec (dict, optional): Argument data structure
           verbose (int): Level of verbose output
           debug (int): Level of debug output
           kwargs (dict): Additional keyword arguments
 
-        Note:
-          This function is one of two responsible for managing the
-          output of figures to pdf files, if specified. While other
-          output formats are single-page, pdf files may be multi-page.
-          In order to allow multiple figures to be output to multiple
-          pdfs, this function maintains a dict outfiles containing
-          references to a PdfPages object for each specified pdf
-          outfile. :meth:`draw_figure`'s decorator
-          :class:`~.manage_output.manage_output` adds new PdfPages
-          objects as requested, or adds pages to existing ones. Once all
-          figures have been drawn, this function closes each PdfPages.
-
-        .. todo:
-          - Support slicing for passage of arguments to multiple figures
-          - Move preset handling to another function, alongside support
-            for mutual exclusivity
+        Returns:
+          OrderedDict: Arguments to be passed to :meth:`draw_figure`,
+          keyed by figure index
         """
+        from collections import OrderedDict
         from copy import deepcopy
         import six
         from . import multi_get_copy, multi_pop
 
-        # Load spec and prepare outfiles
+        # Load spec
         figure_specs = multi_pop(["figures", "figure"], kwargs, {})
+        if figure_specs is None:
+            figure_specs = {}
         figure_indexes = sorted(
             [int(i) for i in figure_specs.keys() if str(i).isdigit()])
-        outfiles = {}
+        figure_specs_out = OrderedDict()
 
-        # Configure and plot figures
+        # Configure figures
         for i in figure_indexes:
 
             # Load the spec for this figure
@@ -469,9 +683,8 @@ class FigureManager(object):
                 figure_spec = {}
             else:
                 raise TypeError("Figure {0} specification".format(
-                    i) + "loaded as {0} ".format(
-                    figure_spec.__class__.__name__) + "rather than expected "
-                                                      "dict.")
+                    i) + "loaded as {0} ".format(figure_specs[
+                    i].__class__.__name__) + "rather than expected dict.")
 
             # Output settings from spec override inherited settings
             if "verbose" not in figure_spec:
@@ -499,130 +712,44 @@ class FigureManager(object):
             figure_spec["yaml_spec"] = kwargs.get("yaml_spec", {})
             figure_spec["yaml_keys"] = [["figures", "all"], ["figures", i]]
 
-            figure_spec["outfiles"] = outfiles
-            self.draw_figure(**figure_spec)
-        # Clean up
-        for outfile in outfiles.values():
-            outfile.close()
-
-    @manage_defaults_presets()
-    @manage_kwargs()
-    @manage_output()
-    def draw_figure(self, shared_legend=False, multiplot=False, verbose=1,
-            debug=0, **kwargs):
-        """
-        Draws a figure.
-
-        Figure will typically contain one or more subplots, whose
-        specifications are provided in a dict structured as follows::
-
-            subplots = {
-                'all': {
-                    'legend': True,
-                    ...
-                },
-                '0': {
-                    'title':    'Subplot 1',
-                    'datasets': {
-                        ...
-                    },
-                    ...
-                },
-                '1': {
-                    'title':    'Subplot 2',
-                    'datasets': {
-                        ...
-                    },
-                    ...
-                },
-                '2': {
-                    'title':    'Subplot 3',
-                    'datasets': {
-                        ...
-                    },
-                    ...
-                },
-                ...
-            }
+            figure_specs_out[i] = figure_spec
 
-        The values stored at each integer key (0-indexed) provide the
-        arguments to be passed to :meth:`draw_subplot` for each of a
-        series of subplots. Values stored at 'all' are passed to each
-        subplot, but overridden by values specific to that subplot.
+        return figure_specs_out
 
-        Figure may be annotated by drawing a title, shared x axis label,
-        shared y axis label, or shared legend. Title and shared axis
-        labels are (by default) centered on all subplots present on the
-        figure, Shared legend is drawn on an additional subplot created
-        after those specified in subplots, using the arguments provided
-        in 'shared_legend'.
+    def get_subplot_specs(self, multiplot=False, verbose=1, debug=0,
+            **kwargs):
+        """
+        Prepares the arguments with which to draw each subplot of a figure.
 
         Arguments:
-          outfile (str): Output filename
           subplot[s] (dict): Subplot specifications
           preset[s] (str, list, optional): Selected preset(s); presets
-            loaded from figure specification will take precedence over
+            loaded from subplot specification will take precedence over
             those passed as arguments
-          nrows (int, optional): Number of rows of subplots
-          ncols (int, optional): Number of columns of subplots
-          nsubplots (int, optional): Number of subplots
-          title (str, optional): Figure title
-          [shared_][x]label (str, optional): X label to be shared among
-            subplots
-          [shared_][y]label (str, optional): Y label to be shared among
-            subplots
-          shared_legend (bool, optional): Generate a legend shared 
-            between subplots
           multiplot (bool, optional): Subplots in specification are a
-            small multiple set; x and y labels and ticklabels are
-            omitted for plots other than those along the left side and
-            bottom
-          multi_xticklabels (list, optional): x tick labels to be
-            assigned to subplots along bottom; only necessary with
-            multiplot
-          multi_yticklabels (list, optional): y tick labels to be
-            assigned to subplots along left side; only necessary with
-            multiplot
-          multi_tick_kw (dict, optional): tick params to be assigned to
-            multiple subplots
+            small multiple set; see :meth:`draw_figure`
+          yaml_spec (dict, optional): Argument data structure
+          yaml_keys (list): Keys of figure within yaml_spec
           verbose (int): Level of verbose output
           debug (int): Level of debug output
           kwargs (dict): Additional keyword arguments
 
         Returns:
-          (figure): Figure
+          OrderedDict: Arguments to be passed to :meth:`draw_subplot`,
+          keyed by subplot index
         """
         from collections import OrderedDict
         from copy import deepcopy
-        from warnings import warn
         import six
-        from . import (get_figure_subplots, multi_get_copy, multi_pop)
-        from .legend import set_shared_legend
-        from .text import (set_title, set_shared_xlabel, set_shared_ylabel)
+        from . import multi_get_copy, multi_pop
 
-        # Load spec and prepare figure and subplots
+        # Load spec
         subplot_specs = multi_pop(["subplots", "subplot"], kwargs, {})
         if subplot_specs is None:
             subplot_specs = {}
         subplot_indexes = sorted(
             [int(i) for i in subplot_specs.keys() if str(i).isdigit()])
-        figure, subplots = get_figure_subplots(verbose=verbose, debug=debug,
-            **kwargs)
-
-        # Format Figure
-        set_title(figure, verbose=verbose, debug=debug, **kwargs)
-        set_shared_xlabel(figure, verbose=verbose, debug=debug, **kwargs)
-        set_shared_ylabel(figure, verbose=verbose, debug=debug, **kwargs)
-        if shared_legend:
-            shared_legend_kw = multi_get_copy("shared_legend_kw", kwargs, {})
-            if isinstance(shared_legend_kw, dict):
-                handles = shared_legend_kw.pop("handles", OrderedDict())
-            elif (isinstance(shared_legend_kw, list) and len(
-                shared_legend_kw) >= 1 and isinstance(shared_legend_kw[0],
-                dict)):
-                handles = shared_legend_kw[0].pop("handles", OrderedDict())
-            else:
-                raise Exception()
+        subplot_specs_out = OrderedDict()
 
         # Load multiplot variables
         if multiplot:
@@ -633,39 +760,16 @@ class FigureManager(object):
             multi_yticklabels = kwargs.get("multi_yticklabels")
             multi_tick_params = kwargs.get("multi_tick_params")
 
-        # Configure and plot subplots
+        # Configure subplots
         for i in subplot_indexes:
-            # Load the subplot and spec
-            if i in subplots:
-                subplot = subplots[i]
-            elif (isinstance(subplot_specs[i], dict) and "subplot_dim" in
-                subplot_specs[i]):
-                get_figure_subplots(figure=figure, subplots=subplots,
-                    verbose=verbose, debug=debug,
-                    **subplot_specs[i]["subplot_dim"])
-                subplot = subplots[i]
-            else:
-                warn("Specs provided for subplot {0}, ".format(
-                    i) + "but only subplot indexes {0} ".format(
-                    subplots.keys()) + "were created; check that nrows, "
-                                       "ncols, and nsubplots "
-                                       "are appropriate; skipping subplots {"
-                                       "0}.".format(
-                    i))
-                continue
             if isinstance(subplot_specs[i], dict):
                 subplot_spec = deepcopy(subplot_specs[i])
             elif subplot_specs[i] is None:
                 subplot_spec = {}
             else:
                 raise TypeError("Subplot {0} specification".format(
-                    i) + "loaded as {0} ".format(
-                    subplot_spec.__class__.__name__) + "rather than expected "
-                                                       "dict.")
-
-            # Include reference to figure and subplots
-            subplot_spec["figure"] = figure
-            subplot_spec["subplots"] = subplots
+                    i) + "loaded as {0} ".format(subplot_specs[
+                    i].__class__.__name__) + "rather than expected dict.")
 
             # Output settings from spec override inherited settings
             if "verbose" not in subplot_spec:
@@ -695,10 +799,6 @@ class FigureManager(object):
                 [[key3 + ["subplots", "all"], key3 + ["subplots", i]] for key3
                     in kwargs.get("yaml_keys")] for key in key2]
 
-            # Pass dict of handles for shared legend
-            if shared_legend:
-                subplot_spec["handles"] = handles
-
             # Manage multiplot x and y labels
             if multiplot:
                 if multi_xticklabels is not None:
@@ -766,31 +866,634 @@ class FigureManager(object):
                         else:
                             ytick_params["top"] = inner
 
-            self.draw_subplot(subplot, **subplot_spec)
+            subplot_specs_out[i] = subplot_spec
 
-        # Draw legend
-        if shared_legend:
-            if not isinstance(shared_legend_kw, list):
-                shared_legend_kw = [shared_legend_kw]
-            shared_legend_kw[0]["handles"] = handles
-            for s_l_kw in shared_legend_kw:
-                set_shared_legend(figure, subplots, **s_l_kw)
+        return subplot_specs_out
 
-        # Return results
-        return figure
+    def get_dataset_specs(self, verbose=1, debug=0, **kwargs):
+        """
+        Prepares the arguments with which to draw each dataset of a
+        subplot.
 
-    @manage_defaults_presets()
-    @manage_kwargs()
-    def draw_subplot(self, subplot, title=None, partner_subplot=False,
-            handles=None, visible=True, legend=None, draw_label=False,
-            verbose=1, debug=0, **kwargs):
+        Arguments:
+          dataset[s] (dict): Dataset specifications
+          preset[s] (str, list, optional): Selected preset(s); presets
+            loaded from dataset specification will take precedence over
+            those passed as arguments
+          yaml_spec (dict, optional): Argument data structure
+          yaml_keys (list): Keys of subplot within yaml_spec
+          verbose (int): Level of verbose output
+          debug (int): Level of debug output
+          kwargs (dict): Additional keyword arguments
+
+        Returns:
+          OrderedDict: Arguments to be passed to :meth:`draw_dataset`,
+          keyed by dataset index
         """
-        Draws a subplot.
+        from collections import OrderedDict
+        from copy import deepcopy
+        import six
+        from . import multi_get, multi_get_copy, multi_pop
 
-        Subplot will typically plot one or more datasets, whose
-        specifications are provided in a dict structured as follows::
+        # Load spec
+        dataset_specs = multi_get(["datasets", "dataset"], kwargs, {})
+        if dataset_specs is None:
+            dataset_specs = {}
+        dataset_indexes = sorted(
+            [int(i) for i in dataset_specs.keys() if str(i).isdigit()])
+        dataset_specs_out = OrderedDict()
 
-            datasets = {
+        # Configure datasets
+        for i in dataset_indexes:
+
+            # Load the spec for this dataset
+            if isinstance(dataset_specs[i], dict):
+                dataset_spec = deepcopy(dataset_specs[i])
+            elif dataset_specs[i] is None:
+                continue
+            else:
+                raise TypeError("Dataset {0} specification".format(
+                    i) + "loaded as {0} ".format(dataset_specs[
+                    i].__class__.__name__) + "rather than expected dict.")
+
+            # Output settings from spec override inherited settings
+            if "verbose" not in dataset_spec:
+                dataset_spec["verbose"] = verbose
+            if "debug" not in dataset_spec:
+                dataset_spec["debug"] = debug
+
+            # Presets from spec have priority over inherited presets
+            spec_presets = multi_pop(["presets", "preset"], dataset_spec, [])
+            if isinstance(spec_presets, six.string_types):
+                spec_presets = [spec_presets]
+            elif spec_presets is None:
+                spec_presets = []
+            arg_presets = multi_get_copy(["presets", "preset"], kwargs, [])
+            if isinstance(arg_presets, six.string_types):
+                arg_presets = [arg_presets]
+            elif arg_presets is None:
+                arg_presets = []
+            for arg_preset in reversed(arg_presets):
+                if not arg_preset in spec_presets:
+                    spec_presets.insert(0, arg_preset)
+            dataset_spec["presets"] = spec_presets
+
+            # Build list of keys from which to load from spec dict
+            dataset_spec["yaml_spec"] = kwargs.get("yaml_spec", {})
+            dataset_spec["yaml_keys"] = [key for key2 in
+                [[key3 + ["datasets", "all"], key3 + ["datasets", i]] for key3
+                    in kwargs.get("yaml_keys")] for key in key2]
+
+            dataset_specs_out[i] = dataset_spec
+
+        return dataset_specs_out
+
+    @manage_defaults_presets()
+    @manage_kwargs()
+    def draw_report(self, verbose=1, debug=0, keep_figures=False,
+            save_threads=0, in_memory=False, draft=False, profile=False,
+            trace=None, memory=False, preload=0, prefetch=0,
+            prefetch_lookahead=8, **kwargs):
+        """
+        Draws one or more figures based on provided specifications.
+
+        Figure specs are provided in a dict structured as follows::
+
+            figures = {
+                'all': {
+                    'shared_xlabel': 'Time',
+                    'shared_ylabel': 'Measurement',
+                    'shared_legend': True,
+                    ...
+                },
+                '0': {
+                    'title': 'Trial 1',
+                    'subplots': {
+                        ...
+                    },
+                    ...
+                },
+                '1': {
+                    'title': 'Trial 2',
+                    'subplots': {
+                        ...
+                    },
+                    ...
+                },
+                '2': {
+                    'title': 'Trial 3',
+                    'subplots': {
+                        ...
+                    },
+                    ...
+                },
+                ...
+            }
+
+        The values stored at each (0-indexed) integer key provide the
+        arguments to be passed to :meth:`draw_figure` for each of a
+        series of figures. Values stored at 'all' are passed to each
+        figure, but overridden by values specific to that figure.
+
+        Arguments:
+          figure[s] (dict): Figure specifications
+          preset[s] (str, list, optional): Selected preset(s); presets
+            loaded from figure specification will take precedence over
+            those passed as arguments
+          yaml_spec (str, dict, optional): Argument data structure; may
+            be string path to yaml file, yaml-format string, or
+            dictionary
+          plan (RenderPlan, optional): Plan to draw; if omitted, plan is
+            compiled from the remaining arguments using
+            :meth:`compile_report`. If any drawing method is not wrapped
+            by :class:`~.manage_kwargs.manage_kwargs` (see
+            :meth:`get_unwrapped_methods`), no plan is compiled;
+            instead, the arguments of each figure, subplot, and dataset
+            are resolved as it is drawn, and *draft*, *preload*, and
+            *prefetch* are not supported
+          keep_figures (bool): Do not close figures once they have been
+            saved, so that they remain available from pyplot (e.g. for
+            display in an interactive session); may be overridden by
+            figure specifications
+          save_threads (int): Number of threads with which to save
+            figures in the background while the next figure is drawn;
+            if 0, each figure is saved before the next is drawn; saving
+            is not isolated from changes to matplotlib's global
+            ``rcParams`` (e.g. within ``rc_context()``) made while later
+            figures are drawn, so settings that affect output should be
+            passed in ``savefig_kw`` rather than through ``rcParams``
+          in_memory (bool): Render each figure in memory in the formats
+            of its outfiles, rather than writing outfiles
+          draft (bool): Draw a quick preview of each figure, with the
+            same layout but at low resolution (:attr:`draft_dpi`), saved
+            as png (see :meth:`set_draft_output`); ``draft`` is passed
+            to :meth:`draw_figure`, :meth:`draw_subplot`, and
+            :meth:`draw_dataset`, which should decimate large datasets
+            and skip expensive artists (e.g. shaded kernel density
+            estimates) when it is True
+          profile (bool): Record the time spent in each stage of
+            drawing, and print a summary once all figures have been
+            drawn (see :class:`~myplotspec.profiler.Profiler`)
+          trace (str): Path to which to write a timeline of drawing
+            each figure, subplot, and dataset, loading each dataset, and
+            saving each outfile, in Chrome's Trace Event Format (see
+            :meth:`~myplotspec.profiler.Profiler.write_trace`)
+          memory (bool): Record the peak memory allocated while drawing
+            each figure, the number of figures left open once each is
+            saved, and the memory used by each cached dataset, and print
+            a summary once all figures have been drawn (see
+            :class:`~myplotspec.memory.MemoryReport`)
+          preload (int): Number of threads with which to load all
+            datasets into :attr:`dataset_cache` before drawing, using
+            the arguments given by :meth:`get_dataset_kw`; each dataset
+            is loaded once, and each hdf5 file is opened once (see
+            :func:`~myplotspec.prefetch.preload_datasets`); if 0, each
+            dataset is loaded when it is drawn
+          prefetch (int): Number of threads with which to load datasets
+            into :attr:`dataset_cache` ahead of drawing them, using the
+            arguments given by :meth:`get_dataset_kw`; if 0, each
+            dataset is loaded when it is drawn
+          prefetch_lookahead (int): Maximum number of datasets loaded
+            ahead of the dataset being drawn
+          verbose (int): Level of verbose output
+          debug (int): Level of debug output
+          kwargs (dict): Additional keyword arguments
+
+        Returns:
+          OrderedDict: If *in_memory*, bytes of each figure keyed by
+          figure index and then by outfile as specified (e.g. ``{0:
+          {'fig.png': b'...', 'fig.pdf': b'...'}}``); otherwise None
+
+        Note:
+          This function is one of two responsible for managing the
+          output of figures to pdf files, if specified. While other
+          output formats are single-page, pdf files may be multi-page.
+          In order to allow multiple figures to be output to multiple
+          pdfs, this function maintains a dict outfiles containing
+          references to a PdfPages object for each specified pdf
+          outfile. :meth:`draw_figure`'s decorator
+          :class:`~.manage_output.manage_output` adds new PdfPages
+          objects as requested, or adds pages to existing ones. Once all
+          figures have been drawn (and, if saved in the background,
+          written), or if drawing fails, this function closes each
+          PdfPages (see :meth:`finish_report`).
+
+          Each figure is drawn by :meth:`draw_report_figure`, between
+          :meth:`prepare_report` and :meth:`finish_report`, which are
+          also used by :func:`~myplotspec.asynchronous.iter_report_async`.
+
+        .. todo:
+          - Support slicing for passage of arguments to multiple figures
+          - Move preset handling to another function, alongside support
+            for mutual exclusivity
+        """
+        report = self.prepare_report(verbose=verbose, debug=debug,
+            keep_figures=keep_figures, save_threads=save_threads,
+            in_memory=in_memory, draft=draft, profile=profile, trace=trace,
+            memory=memory, preload=preload, prefetch=prefetch,
+            prefetch_lookahead=prefetch_lookahead, **kwargs)
+        complete = False
+        try:
+            for i in report["figure_specs"]:
+                self.draw_report_figure(report, i)
+            complete = True
+        finally:
+            self.finish_report(report, complete=complete)
+
+        if in_memory:
+            return report["buffers"]
+
+    def prepare_report(self, verbose=1, debug=0, keep_figures=False,
+            save_threads=0, in_memory=False, draft=False, profile=False,
+            trace=None, memory=False, preload=0, prefetch=0,
+            prefetch_lookahead=8, **kwargs):
+        """
+        Prepares to draw the figures of a report.
+
+        Starts the profiler and memory report, if requested, compiles
+        the plan (if not provided), loads datasets or begins loading
+        them in the background, and prepares the arguments of each
+        figure. Each figure is then drawn by :meth:`draw_report_figure`,
+        and the report is finished by :meth:`finish_report`, which must
+        be called even if drawing fails. If preparation itself fails,
+        the report is finished before the exception is raised.
+
+        Arguments:
+          kwargs (dict): Arguments accepted by :meth:`draw_report`
+
+        Returns:
+          dict: State of report, including the arguments of each figure
+          keyed by figure index ('figure_specs'), open pdf outfiles
+          keyed by path ('outfiles'), the writer saving figures in the
+          background ('writer'; None unless *save_threads*), and the
+          bytes of each figure rendered in memory ('buffers'; empty
+          unless *in_memory*)
+        """
+        from collections import OrderedDict
+        from time import time
+        from warnings import warn
+        from . import load_dataset
+        from .manage_output import FigureWriter
+        from .memory import MemoryReport, get_memory_report
+        from .prefetch import DatasetPrefetcher, preload_datasets
+        from .profiler import Profiler, get_profiler, span
+
+        # Start profiler and memory report
+        report = dict(figure_specs=OrderedDict(), outfiles={}, writer=None,
+            buffers=OrderedDict(), profiler=None, memory_report=None,
+            profile=profile, trace=trace, verbose=verbose)
+        if (profile or trace is not None) and get_profiler() is None:
+            report["profiler"] = Profiler(trace=trace is not None).start()
+        if memory and get_memory_report() is None:
+            report["memory_report"] = MemoryReport().start()
+
+        try:
+            with span("draw_report"):
+                # Compile plan; if methods cannot resolve their arguments
+                # without drawing, resolve them while drawing instead
+                plan = kwargs.pop("plan", None)
+                unwrapped = self.get_unwrapped_methods()
+                if plan is None and len(unwrapped) == 0:
+                    plan = self.compile_report(verbose=verbose, debug=debug,
+                        draft=draft, **kwargs)
+                if plan is not None:
+                    figure_specs = plan.get_child_specs()
+                else:
+                    if draft or preload > 0 or prefetch > 0:
+                        warn("Render plan cannot be compiled, since methods "
+                             "{0} are not wrapped by manage_kwargs; draft, "
+                             "preload, and prefetch are ignored".format(
+                            unwrapped))
+                        preload = prefetch = 0
+                    figure_specs = self.get_figure_specs(verbose=verbose,
+                        debug=debug, **kwargs)
+
+                # Prepare outfiles
+                if save_threads > 0:
+                    report["writer"] = FigureWriter(save_threads)
+                for i, figure_spec in figure_specs.items():
+                    figure_spec["outfiles"] = report["outfiles"]
+                    if "keep_figures" not in figure_spec:
+                        figure_spec["keep_figures"] = keep_figures
+                    if report["writer"] is not None:
+                        figure_spec["writer"] = report["writer"]
+                    if in_memory:
+                        figure_spec["buffers"] = report["buffers"][i] = {}
+                    report["figure_specs"][i] = figure_spec
+
+                # Load datasets before drawing, or begin loading them in
+                # the background
+                def load_in_background(**dataset_kw):
+                    with span("load_dataset", infile=dataset_kw.get("infile"),
+                      prefetch=True):
+                        load_dataset(dataset_cache=self.dataset_cache,
+                            **dataset_kw)
+
+                if preload > 0 or prefetch > 0:
+                    requests = self.get_dataset_requests(plan)
+                if preload > 0:
+                    start = time()
+                    n_loaded, n_hdf5 = preload_datasets(load_in_background,
+                        requests, n_threads=preload)
+                    if verbose >= 1:
+                        print("Loaded {0} datasets ({1} hdf5 files) in "
+                              "{2:.3f} s.".format(n_loaded, n_hdf5,
+                            time() - start))
+                if prefetch > 0:
+                    self.prefetcher = DatasetPrefetcher(load_in_background,
+                        requests, n_threads=prefetch,
+                        lookahead=prefetch_lookahead)
+        except BaseException:
+            self.finish_report(report, complete=False)
+            raise
+
+        return report
+
+    def draw_report_figure(self, report, i):
+        """
+        Draws a figure of a report.
+
+        Arguments:
+          report (dict): State of report, as returned by
+            :meth:`prepare_report`
+          i (int): Index of figure
+        """
+        from .profiler import span
+
+        figure_spec = report["figure_specs"][i]
+        memory_report = report["memory_report"]
+        if memory_report is not None:
+            memory_report.begin_figure(i)
+        with span("draw_figure", figure=i,
+          outfile=list(figure_spec["plan_node"].outfiles) if
+          "plan_node" in figure_spec else None):
+            self.draw_figure(**figure_spec)
+        if memory_report is not None:
+            memory_report.end_figure(i)
+
+    def finish_report(self, report, complete=True):
+        """
+        Finishes a report.
+
+        Waits for figures being saved in the background and closes pdf
+        outfiles (see :meth:`close_outfiles`), stops loading datasets in
+        the background, and stops the profiler and memory report. If
+        the report is complete, their summaries are then printed, and
+        the trace is written.
+
+        Arguments:
+          report (dict): State of report, as returned by
+            :meth:`prepare_report`
+          complete (bool): All figures were drawn; if False, drawing
+            failed or was stopped early, and outfiles are closed without
+            summarizing
+        """
+        from .profiler import span
+
+        profiler = report["profiler"]
+        memory_report = report["memory_report"]
+        verbose = report["verbose"]
+
+        # Finish saving and close outfiles, even if drawing failed, so
+        # that queued figures are saved and pdfs are not truncated
+        try:
+            if complete and memory_report is not None:
+                memory_report.record_datasets(self.dataset_cache)
+            with span("draw_report"):
+                self.close_outfiles(report["writer"], report["outfiles"],
+                    verbose=verbose)
+        finally:
+            if self.prefetcher is not None:
+                self.prefetcher.close()
+                self.prefetcher = None
+            if profiler is not None:
+                profiler.stop()
+            if memory_report is not None:
+                memory_report.stop()
+        if not complete:
+            return
+        if profiler is not None and report["profile"]:
+            profiler.print_summary()
+        if profiler is not None and report["trace"] is not None:
+            profiler.write_trace(report["trace"])
+            if verbose >= 1:
+                print("Trace written to '{0}'.".format(report["trace"]))
+        if memory_report is not None:
+            memory_report.print_summary()
+
+    def close_outfiles(self, writer, outfiles, verbose=1, **kwargs):
+        """
+        Waits for figures being saved in the background, and closes pdf
+        outfiles.
+
+        Outfiles are closed even if saving fails; once closed, they are
+        removed from *outfiles*, so that this method may be called again.
+
+        Arguments:
+          writer (FigureWriter): Writer saving figures in the background,
+            or None
+          outfiles (dict): Open PdfPages, keyed by path
+          verbose (int): Level of verbose output
+          kwargs (dict): Additional keyword arguments
+
+        Raises:
+          Exception: First exception raised while saving, if any
+        """
+        from os.path import getsize
+
+        try:
+            if writer is not None:
+                writer.close()
+        finally:
+            while len(outfiles) > 0:
+                path = next(iter(outfiles))
+                outfiles.pop(path).close()
+                if verbose >= 2:
+                    print("Closed '{0}' ({1:.0f} kB).".format(path,
+                        getsize(path) / 1024))
+
+    @manage_defaults_presets()
+    @manage_kwargs()
+    @manage_output()
+    def draw_figure(self, shared_legend=False, multiplot=False, verbose=1,
+            debug=0, **kwargs):
+        """
+        Draws a figure.
+
+        Figure will typically contain one or more subplots, whose
+        specifications are provided in a dict structured as follows::
+
+            subplots = {
+                'all': {
+                    'legend': True,
+                    ...
+                },
+                '0': {
+                    'title':    'Subplot 1',
+                    'datasets': {
+                        ...
+                    },
+                    ...
+                },
+                '1': {
+                    'title':    'Subplot 2',
+                    'datasets': {
+                        ...
+                    },
+                    ...
+                },
+                '2': {
+                    'title':    'Subplot 3',
+                    'datasets': {
+                        ...
+                    },
+                    ...
+                },
+                ...
+            }
+
+        The values stored at each integer key (0-indexed) provide the
+        arguments to be passed to :meth:`draw_subplot` for each of a
+        series of subplots. Values stored at 'all' are passed to each
+        subplot, but overridden by values specific to that subplot.
+
+        Figure may be annotated by drawing a title, shared x axis label,
+        shared y axis label, or shared legend. Title and shared axis
+        labels are (by default) centered on all subplots present on the
+        figure, Shared legend is drawn on an additional subplot created
+        after those specified in subplots, using the arguments provided
+        in 'shared_legend'.
+
+        Arguments:
+          outfile (str): Output filename
+          keep_figures (bool, optional): Do not close figure once it
+            has been saved
+          buffers (dict, optional): Render figure in memory in the
+            format of each outfile rather than writing outfiles, and
+            store the bytes of each in this dict, keyed by outfile
+          rasterize_threshold (int, optional): Rasterize artists with
+            more than this number of points in vector outfiles
+          subplot[s] (dict): Subplot specifications
+          preset[s] (str, list, optional): Selected preset(s); presets
+            loaded from figure specification will take precedence over
+            those passed as arguments
+          nrows (int, optional): Number of rows of subplots
+          ncols (int, optional): Number of columns of subplots
+          nsubplots (int, optional): Number of subplots
+          title (str, optional): Figure title
+          [shared_][x]label (str, optional): X label to be shared among
+            subplots
+          [shared_][y]label (str, optional): Y label to be shared among
+            subplots
+          shared_legend (bool, optional): Generate a legend shared 
+            between subplots
+          multiplot (bool, optional): Subplots in specification are a
+            small multiple set; x and y labels and ticklabels are
+            omitted for plots other than those along the left side and
+            bottom
+          multi_xticklabels (list, optional): x tick labels to be
+            assigned to subplots along bottom; only necessary with
+            multiplot
+          multi_yticklabels (list, optional): y tick labels to be
+            assigned to subplots along left side; only necessary with
+            multiplot
+          multi_tick_kw (dict, optional): tick params to be assigned to
+            multiple subplots
+          verbose (int): Level of verbose output
+          debug (int): Level of debug output
+          kwargs (dict): Additional keyword arguments
+
+        Returns:
+          (figure): Figure
+        """
+        from collections import OrderedDict
+        from warnings import warn
+        from . import (get_figure_subplots, multi_get_copy, multi_pop)
+        from .legend import set_shared_legend
+        from .profiler import span
+        from .text import (set_title, set_shared_xlabel, set_shared_ylabel)
+
+        # Load spec and prepare figure and subplots
+        plan = kwargs.pop("plan", None)
+        plan_node = kwargs.pop("plan_node", None)
+        if plan_node is None:
+            subplot_specs = self.get_subplot_specs(multiplot=multiplot,
+                verbose=verbose, debug=debug, **kwargs)
+        else:
+            subplot_specs = plan.get_child_specs(plan_node)
+        multi_pop(["subplots", "subplot"], kwargs)
+        figure, subplots = get_figure_subplots(verbose=verbose, debug=debug,
+            **kwargs)
+
+        # Format Figure
+        set_title(figure, verbose=verbose, debug=debug, **kwargs)
+        set_shared_xlabel(figure, verbose=verbose, debug=debug, **kwargs)
+        set_shared_ylabel(figure, verbose=verbose, debug=debug, **kwargs)
+        if shared_legend:
+            shared_legend_kw = multi_get_copy("shared_legend_kw", kwargs, {})
+            if isinstance(shared_legend_kw, dict):
+                handles = shared_legend_kw.pop("handles", OrderedDict())
+            elif (isinstance(shared_legend_kw, list) and len(
+                shared_legend_kw) >= 1 and isinstance(shared_legend_kw[0],
+                dict)):
+                handles = shared_legend_kw[0].pop("handles", OrderedDict())
+            else:
+                raise Exception()
+
+        # Configure and plot subplots
+        for i, subplot_spec in subplot_specs.items():
+            # Load the subplot
+            if i in subplots:
+                subplot = subplots[i]
+            elif "subplot_dim" in subplot_spec:
+                get_figure_subplots(figure=figure, subplots=subplots,
+                    verbose=verbose, debug=debug,
+                    **subplot_spec["subplot_dim"])
+                subplot = subplots[i]
+            else:
+                warn("Specs provided for subplot {0}, ".format(
+                    i) + "but only subplot indexes {0} ".format(
+                    subplots.keys()) + "were created; check that nrows, "
+                                       "ncols, and nsubplots "
+                                       "are appropriate; skipping subplots {"
+                                       "0}.".format(
+                    i))
+                continue
+
+            # Include reference to figure and subplots
+            subplot_spec["figure"] = figure
+            subplot_spec["subplots"] = subplots
+
+            # Pass dict of handles for shared legend
+            if shared_legend:
+                subplot_spec["handles"] = handles
+
+            with span("draw_subplot", subplot=i):
+                self.draw_subplot(subplot, **subplot_spec)
+
+        # Draw legend
+        if shared_legend:
+            if not isinstance(shared_legend_kw, list):
+                shared_legend_kw = [shared_legend_kw]
+            shared_legend_kw[0]["handles"] = handles
+            for s_l_kw in shared_legend_kw:
+                set_shared_legend(figure, subplots, **s_l_kw)
+
+        # Return results
+        return figure
+
+    @manage_defaults_presets()
+    @manage_kwargs()
+    def draw_subplot(self, subplot, title=None, partner_subplot=False,
+            handles=None, visible=True, legend=None, draw_label=False,
+            verbose=1, debug=0, **kwargs):
+        """
+        Draws a subplot.
+
+        Subplot will typically plot one or more datasets, whose
+        specifications are provided in a dict structured as follows::
+
+            datasets = {
                 'all': {
                     'lw': 2,
                     ...
@@ -842,11 +1545,10 @@ class FigureManager(object):
           kwargs (dict): Additional keyword arguments
         """
         from collections import OrderedDict
-        from copy import deepcopy
-        import six
-        from . import multi_get, multi_get_copy, multi_pop
+        from . import multi_get_copy, multi_pop
         from .axes import set_xaxis, set_yaxis, add_partner_subplot
         from .legend import set_legend
+        from .profiler import span
         from .text import set_title
 
         # Format subplot
@@ -856,60 +1558,29 @@ class FigureManager(object):
             add_partner_subplot(subplot, **kwargs)
 
         # Load spec
-        dataset_specs = multi_get(["datasets", "dataset"], kwargs, {})
-        if dataset_specs is None:
-            dataset_specs = {}
-        dataset_indexes = sorted(
-            [int(i) for i in dataset_specs.keys() if str(i).isdigit()])
+        plan = kwargs.pop("plan", None)
+        plan_node = kwargs.pop("plan_node", None)
+        if plan_node is None:
+            dataset_specs = self.get_dataset_specs(verbose=verbose,
+                debug=debug, **kwargs)
+        else:
+            dataset_specs = plan.get_child_specs(plan_node)
         if handles is None:
             handles = OrderedDict()
 
         # Configure and plot datasets
-        for i in dataset_indexes:
-
-            # Load the spec for this dataset
-            if isinstance(dataset_specs[i], dict):
-                dataset_spec = deepcopy(dataset_specs[i])
-            elif dataset_specs[i] is None:
-                continue
-            else:
-                raise TypeError("Dataset {0} specification".format(
-                    i) + "loaded as {0} ".format(dataset_specs[
-                    i].__class__.__name__) + "rather than expected dict.")
+        for i, dataset_spec in dataset_specs.items():
 
             # Include reference to figure and subplots
+            dataset_spec.pop("plan", None)
+            dataset_spec.pop("plan_node", None)
             dataset_spec["figure"] = kwargs["figure"]
             dataset_spec["subplots"] = kwargs["subplots"]
 
-            # Output settings from spec override inherited settings
-            if "verbose" not in dataset_spec:
-                dataset_spec["verbose"] = verbose
-            if "debug" not in dataset_spec:
-                dataset_spec["debug"] = debug
-
-            # Presets from spec have priority over inherited presets
-            spec_presets = multi_pop(["presets", "preset"], dataset_spec, [])
-            if isinstance(spec_presets, six.string_types):
-                spec_presets = [spec_presets]
-            elif spec_presets is None:
-                spec_presets = []
-            arg_presets = multi_get_copy(["presets", "preset"], kwargs, [])
-            if isinstance(arg_presets, six.string_types):
-                arg_presets = [arg_presets]
-            elif arg_presets is None:
-                arg_presets = []
-            for arg_preset in reversed(arg_presets):
-                if not arg_preset in spec_presets:
-                    spec_presets.insert(0, arg_preset)
-            dataset_spec["presets"] = spec_presets
-
-            # Build list of keys from which to load from spec dict
-            dataset_spec["yaml_spec"] = kwargs.get("yaml_spec", {})
-            dataset_spec["yaml_keys"] = [key for key2 in
-                [[key3 + ["datasets", "all"], key3 + ["datasets", i]] for key3
-                    in kwargs.get("yaml_keys")] for key in key2]
-
-            self.draw_dataset(subplot=subplot, handles=handles, **dataset_spec)
+            with span("draw_dataset", dataset=i,
+              infile=dataset_spec.get("infile")):
+                self.draw_dataset(subplot=subplot, handles=handles,
+                    **dataset_spec)
 
         # Format subplot
         set_xaxis(subplot, **kwargs)
@@ -965,11 +1636,23 @@ class FigureManager(object):
             to subplot.plot()
           handles (OrderedDict, optional): Nascent OrderedDict of
             [labels]: handles on subplot
+          decimate (bool, str, optional): Decimate dataset before
+            drawing, using :func:`~myplotspec.get_decimated` with one
+            column per pixel of subplot width; may be 'minmax' (default
+            if True) or 'lttb'
+          decimate_kw (dict, optional): Settings of decimation; 'dpi'
+            is the resolution at which the figure will be saved, by
+            default matplotlib's rcParam 'savefig.dpi'
+          draft (bool, optional): Decimate dataset at :attr:`draft_dpi`,
+            regardless of *decimate*
           verbose (int): Level of verbose output
           debug (int): Level of debug output
           kwargs (dict): Additional keyword arguments
         """
-        from . import get_color
+        import six
+        import matplotlib
+        from . import get_color, get_decimated
+        from .profiler import span
         import numpy as np
 
         # Configure plot settings
@@ -982,22 +1665,136 @@ class FigureManager(object):
             plot_kw["label"] = label
 
         # Load data
-        dataset = np.loadtxt(infile)
+        with span("load_dataset", infile=infile):
+            dataset = np.loadtxt(infile, usecols=(0, 1))
         x = dataset[:, 0]
         y = dataset[:, 1]
 
+        # Decimate data
+        decimate = kwargs.get("decimate", False)
+        decimate_kw = kwargs.get("decimate_kw", {})
+        if kwargs.get("draft", False):
+            decimate = decimate if decimate else True
+            dpi = self.draft_dpi
+        else:
+            dpi = decimate_kw.get("dpi", matplotlib.rcParams["savefig.dpi"])
+        if decimate:
+            if dpi == "figure":
+                dpi = subplot.figure.dpi
+            n_columns = (subplot.get_position().width *
+                subplot.figure.get_figwidth() * dpi)
+            x, y = get_decimated(x, y, n_columns, mode=decimate if
+                isinstance(decimate, six.string_types) else "minmax")
+
         # Plot
         handle = subplot.plot(x, y, **plot_kw)[0]
         if handles is not None and label is not None:
             handles[label] = handle
 
+    def get_dataset_requests(self, plan):
+        """
+        Lists the datasets that will be loaded while drawing a plan.
+
+        Arguments:
+          plan (RenderPlan): Plan
+
+        Returns:
+          list: (cache key, keyword arguments passed to
+          :meth:`load_dataset`) of each dataset node for which
+          :meth:`get_dataset_kw` provides arguments, in the order in
+          which they are drawn; arguments are quiet (``verbose=0``);
+          datasets loaded with ``lazy`` are omitted, since they may not
+          be needed
+        """
+        from .prefetch import get_cache_key
+
+        requests = []
+        for node in plan.nodes:
+            if node.kind != "dataset":
+                continue
+            dataset_kw = self.get_dataset_kw(**node.kwargs)
+            if dataset_kw is not None and not dataset_kw.get("lazy", False):
+                dataset_kw["verbose"] = 0
+                requests.append((get_cache_key(**dataset_kw), dataset_kw))
+        return requests
+
+    def get_dataset_kw(self, **kwargs):
+        """
+        Determines the arguments with which :meth:`draw_dataset` will
+        load its dataset using :meth:`load_dataset`, so that the dataset
+        may be loaded ahead of drawing (see :meth:`draw_report`).
+
+        By default, these are the contents of ``dataset_kw``, with
+        ``infile`` if it is provided; if ``dataset_kw`` is not provided,
+        or provides no infile, None is returned. If ``dataset_kw`` does
+        not provide ``usecols``, the columns named by the arguments of
+        :meth:`draw_dataset` listed in :attr:`dataset_column_args` are
+        provided as ``usecols``, so that only those columns are read.
+        Subclasses whose :meth:`draw_dataset` loads datasets differently
+        should override this method; datasets loaded using arguments
+        other than those with which :meth:`draw_dataset` loads them will
+        not be used. Subclasses that list :attr:`dataset_column_args`
+        should load their datasets using the arguments returned by this
+        method, so that they are read with the same ``usecols``.
+
+        Arguments:
+          kwargs (dict): Resolved arguments of :meth:`draw_dataset`
+
+        Returns:
+          dict: Keyword arguments passed to :meth:`load_dataset`, or
+          None
+        """
+        from . import get_writable
+
+        dataset_kw = kwargs.get("dataset_kw")
+        if not isinstance(dataset_kw, dict):
+            return None
+        dataset_kw = get_writable(dataset_kw)
+        if "infile" in kwargs:
+            dataset_kw["infile"] = kwargs["infile"]
+        if "infile" not in dataset_kw and "infiles" not in dataset_kw:
+            return None
+        if len(self.dataset_column_args) > 0 and "usecols" not in dataset_kw:
+            usecols = []
+            for arg in self.dataset_column_args:
+                value = kwargs.get(arg)
+                for column in value if isinstance(value, list) else [value]:
+                    if column is not None and column not in usecols:
+                        usecols.append(column)
+            if len(usecols) > 0:
+                dataset_kw["usecols"] = usecols
+        return dataset_kw
+
     def load_dataset(self, **kwargs):
         """
         Loads a dataset, or reloads a previously-loaded dataset from cache.
+
+        If the dataset is being loaded in the background by
+        :attr:`prefetcher`, waits for it to be loaded.
+
+        Arguments:
+          lazy (bool): Defer loading until data are first accessed, e.g.
+            by a subplot that may not be drawn; see
+            :func:`~myplotspec.load_dataset`
+          kwargs (dict): Keyword arguments passed to
+            :func:`~myplotspec.load_dataset`
+
+        Returns:
+          object: Dataset, or, if *lazy*, a
+          :class:`~myplotspec.Dataset.DatasetProxy` that loads it when
+          its data are first accessed
         """
         from . import load_dataset
+        from .Dataset import DatasetProxy
+        from .prefetch import get_cache_key
+        from .profiler import span
 
-        return load_dataset(dataset_cache=self.dataset_cache, **kwargs)
+        if kwargs.pop("lazy", False):
+            return DatasetProxy(self.load_dataset, **kwargs)
+        if self.prefetcher is not None:
+            self.prefetcher.wait(get_cache_key(**kwargs))
+        with span("load_dataset", infile=kwargs.get("infile")):
+            return load_dataset(dataset_cache=self.dataset_cache, **kwargs)
 
     def main(self, parser=None):
         """
@@ -1104,6 +1901,40 @@ class FigureManager(object):
         parser.add_argument("-d", "--debug", action="count", default=0,
             help="Enable debug output, may be specified more than once")
 
+        parser.add_argument("--draft", action="store_true",
+            help="Draw quick low-resolution png previews of each figure, "
+                 "with decimated data")
+
+        parser.add_argument("--save-threads", type=int, default=0,
+            dest="save_threads", metavar="N",
+            help="Save figures using N background threads while the next "
+                 "figure is drawn")
+
+        parser.add_argument("--preload", type=int, default=0, metavar="N",
+            help="Load all datasets using N threads before drawing, "
+                 "opening each file once")
+
+        parser.add_argument("--prefetch", type=int, default=0, metavar="N",
+            help="Load datasets using N background threads ahead of "
+                 "drawing them")
+
+        parser.add_argument("--profile", action="store_true",
+            help="Print the time spent in each stage of drawing, and in "
+                 "each figure")
+
+        parser.add_argument("--trace", type=str, metavar="/PATH/TO/TRACE.json",
+            help="Write a timeline of drawing and saving each figure, "
+                 "viewable in chrome://tracing or Perfetto")
+
+        parser.add_argument("--memory", action="store_true",
+            help="Print the peak memory allocated while drawing each "
+                 "figure, and the memory used by each cached dataset")
+
+        parser.add_argument("--plan-cache", action="store_true",
+            dest="plan_cache", help="Load resolved specification from, and "
+                                    "store it in, a cache file alongside "
+                                    "YAML configuration file")
+
         arguments = vars(parser.parse_args())
 
         if arguments["seaborn"] == 2:
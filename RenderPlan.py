@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+#   myplotspec.RenderPlan.py
+#
+#   Copyright (C) 2015-2017 Karl T Debiec
+#   All rights reserved.
+#
+#   This software may be modified and distributed under the terms of the
+#   BSD license. See the LICENSE file for details.
+"""
+Represents the resolved specification of a report.
+"""
+################################### MODULES ###################################
+from __future__ import (absolute_import, division, print_function,
+    unicode_literals)
+if __name__ == "__main__":
+    __package__ = str("myplotspec")
+    import myplotspec
+from collections import namedtuple
+
+
+################################### CLASSES ###################################
+class RenderPlanNode(namedtuple(str("RenderPlanNode"),
+  [str("kind"), str("path"), str("parent"), str("kwargs"), str("infiles"),
+      str("outfiles")])):
+    """
+    Resolved arguments of a single figure, subplot, or dataset.
+
+    Attributes:
+      kind (str): 'figure', 'subplot', or 'dataset'
+      path (tuple): Index of figure, (figure, subplot), or (figure,
+        subplot, dataset)
+      parent (int): Position of parent node within
+        :attr:`RenderPlan.nodes`; None for figures
+      kwargs (ReadOnlyDict): Resolved keyword arguments
+      infiles (tuple): Paths to infiles used by this node
+      outfiles (tuple): Paths to outfiles written by this node
+    """
+    __slots__ = ()
+
+    #: Keys of resolved arguments whose contents are represented by
+    #: child nodes, or which are shared by all nodes; omitted from
+    #: :attr:`kwargs`
+    omitted_keys = ["subplots", "subplot", "datasets", "dataset",
+        "yaml_spec", "resolve_only"]
+
+    @classmethod
+    def from_kwargs(cls, kind, path, parent, kwargs):
+        """
+        Generates a node from resolved keyword arguments.
+
+        Arguments:
+          kind (str): 'figure', 'subplot', or 'dataset'
+          path (tuple): Index of node
+          parent (int): Position of parent node
+          kwargs (dict): Resolved keyword arguments, as returned by
+            :class:`~.manage_kwargs.manage_kwargs` with
+            ``resolve_only=True``
+
+        Returns:
+          RenderPlanNode: Node
+        """
+        import six
+        from . import get_read_only, multi_get_merged
+        from .manage_output import manage_output
+
+        kwargs = dict([(k, v) for k, v in kwargs.items() if k not in
+            cls.omitted_keys])
+
+        infiles = multi_get_merged(["infile", "infiles"], kwargs)
+        dataset_kw = kwargs.get("dataset_kw")
+        if isinstance(dataset_kw, dict):
+            infiles += multi_get_merged(["infile", "infiles"], dataset_kw)
+        infiles = [i for i in infiles if isinstance(i, six.string_types)]
+
+        if kind == "figure":
+            outfiles = kwargs.get("outfile", manage_output.default_outfile)
+            if isinstance(outfiles, six.string_types):
+                outfiles = [outfiles]
+        else:
+            outfiles = []
+
+        return cls(kind, tuple(path), parent, get_read_only(kwargs),
+            tuple(infiles), tuple(outfiles))
+
+
+class RenderPlan(object):
+    """
+    Resolved specification of a report.
+
+    Generated by :meth:`FigureManager.compile_report
+    <myplotspec.FigureManager.FigureManager.compile_report>`, which
+    resolves the arguments of each figure, subplot, and dataset before
+    anything is drawn, and executed by :meth:`FigureManager.draw_report
+    <myplotspec.FigureManager.FigureManager.draw_report>`. Nodes are
+    stored in a flat tuple, in the order in which they are drawn; each
+    node refers to its parent by position.
+
+    May be inspected (e.g. to list the infiles and outfiles of a report
+    before any data is loaded), compared to another plan, written to
+    and read from yaml, or stored in a binary cache file so that it
+    need not be compiled again.
+
+    Attributes:
+      nodes (tuple): :class:`RenderPlanNode` of each figure, subplot,
+        and dataset
+      yaml_spec (dict): Specification from which plan was compiled;
+        passed to the drawing functions alongside each node's arguments
+        but not included when plan is written
+    """
+
+    def __init__(self, nodes, yaml_spec=None):
+        """
+        Initializes.
+
+        Arguments:
+          nodes (list): :class:`RenderPlanNode` of each figure, subplot,
+            and dataset
+          yaml_spec (dict, optional): Specification from which plan was
+            compiled
+        """
+        self.nodes = tuple(nodes)
+        self.yaml_spec = yaml_spec if yaml_spec is not None else {}
+
+        self._positions = {}
+        children = {}
+        for position, node in enumerate(self.nodes):
+            self._positions[node.path] = position
+            children.setdefault(node.parent, []).append(position)
+        self._children = dict([(k, tuple(v)) for k, v in children.items()])
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __eq__(self, other):
+        if not isinstance(other, RenderPlan):
+            return NotImplemented
+        return self.nodes == other.nodes
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "{0}({1} figures, {2} nodes)".format(self.__class__.__name__,
+            len(self.get_children()), len(self.nodes))
+
+    @property
+    def infiles(self):
+        """
+        list: Paths to all infiles, in the order in which they are first
+        used
+        """
+        infiles = []
+        seen = set()
+        for node in self.nodes:
+            for infile in node.infiles:
+                if infile not in seen:
+                    seen.add(infile)
+                    infiles.append(infile)
+        return infiles
+
+    @property
+    def outfiles(self):
+        """
+        list: Paths to all outfiles, in the order in which they are first
+        written
+        """
+        outfiles = []
+        seen = set()
+        for node in self.nodes:
+            for outfile in node.outfiles:
+                if outfile not in seen:
+                    seen.add(outfile)
+                    outfiles.append(outfile)
+        return outfiles
+
+    def get_children(self, node=None):
+        """
+        Lists the children of a node.
+
+        Arguments:
+          node (RenderPlanNode, optional): Parent node; if None, the
+            figure nodes are returned
+
+        Returns:
+          list: Child nodes, in the order in which they are drawn
+        """
+        if node is None:
+            parent = None
+        else:
+            parent = self._positions[node.path]
+        return [self.nodes[i] for i in self._children.get(parent, ())]
+
+    def get_child_specs(self, node=None):
+        """
+        Prepares the arguments with which to draw the children of a node.
+
+        Arguments:
+          node (RenderPlanNode, optional): Parent node; if None, the
+            figure nodes are prepared
+
+        Returns:
+          OrderedDict: Writable copy of the resolved arguments of each
+          child, keyed by index, including ``yaml_spec`` and references
+          to this plan and the child node
+        """
+        from collections import OrderedDict
+        from . import LayeredDict
+
+        child_specs = OrderedDict()
+        for child in self.get_children(node):
+            child_spec = LayeredDict([child.kwargs])
+            child_spec["yaml_spec"] = self.yaml_spec
+            child_spec["plan"] = self
+            child_spec["plan_node"] = child
+            child_specs[child.path[-1]] = child_spec
+        return child_specs
+
+    def get_missing_infiles(self):
+        """
+        Lists infiles that do not exist.
+
+        Environment variables are expanded, and hdf5 addresses following
+        ':' are ignored.
+
+        Returns:
+          list: Paths to infiles that were not found
+        """
+        from os.path import expandvars, isfile
+
+        missing = []
+        for infile in self.infiles:
+            path = expandvars(infile)
+            if isfile(path):
+                continue
+            if ":" in path and isfile(path.rsplit(":", 1)[0]):
+                continue
+            missing.append(infile)
+        return missing
+
+    def diff(self, other):
+        """
+        Compares this plan to another.
+
+        Arguments:
+          other (RenderPlan): Plan to compare
+
+        Returns:
+          list: Paths of nodes that are present in only one plan, or
+          whose arguments, infiles, or outfiles differ
+        """
+        nodes = dict([(n.path, n) for n in self.nodes])
+        other_nodes = dict([(n.path, n) for n in other.nodes])
+        paths = sorted(set(nodes.keys()) | set(other_nodes.keys()))
+
+        different = []
+        for path in paths:
+            node = nodes.get(path)
+            other_node = other_nodes.get(path)
+            if node is None or other_node is None:
+                different.append(path)
+            elif (node.kind, node.kwargs, node.infiles, node.outfiles) != (
+              other_node.kind, other_node.kwargs, other_node.infiles,
+              other_node.outfiles):
+                different.append(path)
+        return different
+
+    @classmethod
+    def load(cls, infile, key=None):
+        """
+        Loads a plan stored using :meth:`dump`.
+
+        Arguments:
+          infile (str): Path to infile
+          key (str, optional): Key with which plan must have been
+            stored
+
+        Returns:
+          RenderPlan: Plan, or None if infile is not present, cannot be
+          read, or was stored with a different key
+
+        Note:
+          Plans are stored using pickle, and should only be loaded from
+          trusted locations
+        """
+        from os.path import isfile
+        from six.moves import cPickle as pickle
+
+        if not isfile(infile):
+            return None
+        try:
+            with open(infile, "rb") as plan_file:
+                stored = pickle.load(plan_file)
+        except Exception:
+            return None
+        if not isinstance(stored, dict) or stored.get("key") != key:
+            return None
+        return stored.get("plan")
+
+    def dump(self, outfile, key=None):
+        """
+        Stores plan, including :attr:`yaml_spec`, in a binary file.
+
+        Arguments:
+          outfile (str): Path to outfile
+          key (str, optional): Key with which to store plan
+        """
+        from os import remove, rename
+        from six.moves import cPickle as pickle
+
+        temp_outfile = "{0}.{1}.tmp".format(outfile, id(self))
+        with open(temp_outfile, "wb") as plan_file:
+            pickle.dump(dict(key=key, plan=self), plan_file,
+                pickle.HIGHEST_PROTOCOL)
+        try:
+            rename(temp_outfile, outfile)
+        except OSError:
+            remove(outfile)
+            rename(temp_outfile, outfile)
+
+    def to_dict(self):
+        """
+        Converts plan to a data structure of dicts and lists.
+
+        Returns:
+          dict: Plan, omitting :attr:`yaml_spec`
+        """
+        from . import get_writable
+
+        return dict(nodes=[dict(kind=n.kind, path=list(n.path),
+            parent=n.parent, kwargs=get_writable(n.kwargs),
+            infiles=list(n.infiles), outfiles=list(n.outfiles)) for n in
+            self.nodes])
+
+    @classmethod
+    def from_dict(cls, data, yaml_spec=None):
+        """
+        Generates a plan from a data structure of dicts and lists.
+
+        Arguments:
+          data (dict): Plan, as generated by :meth:`to_dict`
+          yaml_spec (dict, optional): Specification from which plan was
+            compiled
+
+        Returns:
+          RenderPlan: Plan
+        """
+        from . import get_read_only
+
+        return cls([RenderPlanNode(n["kind"], tuple(n["path"]), n["parent"],
+            get_read_only(n["kwargs"]), tuple(n["infiles"]),
+            tuple(n["outfiles"])) for n in data["nodes"]], yaml_spec=yaml_spec)
+
+    def to_yaml(self, outfile=None):
+        """
+        Writes plan in yaml format.
+
+        Arguments:
+          outfile (str, optional): Path to outfile; if None, yaml is
+            returned as a string
+
+        Returns:
+          str: Plan in yaml format, if *outfile* is None
+        """
+        import yaml
+
+        if outfile is None:
+            return yaml.safe_dump(self.to_dict(), default_flow_style=False)
+        with open(outfile, "w") as out:
+            yaml.safe_dump(self.to_dict(), out, default_flow_style=False)
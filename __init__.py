@@ -19,6 +19,27 @@ from __future__ import (absolute_import, division, print_function,
 
 ################################## VARIABLES ##################################
 FP_KEYS = ["fp", "font_properties", "fontproperties", "prop"]
+_yaml_cache = {}
+_palettes = dict(
+  default=dict(black=(0.000, 0.000, 0.000), blue=(0.298, 0.447, 0.690),
+    green=(0.333, 0.659, 0.408), red=(0.769, 0.306, 0.321),
+    purple=(0.506, 0.447, 0.698), yellow=(0.800, 0.725, 0.455),
+    cyan=(0.392, 0.710, 0.804)),
+  pastel=dict(blue=(0.573, 0.776, 1.000), green=(0.592, 0.941, 0.667),
+    red=(1.000, 0.624, 0.604), purple=(0.816, 0.733, 1.000),
+    yellow=(1.000, 0.996, 0.639), cyan=(0.690, 0.878, 0.902)),
+  muted=dict(blue=(0.282, 0.471, 0.812), green=(0.416, 0.800, 0.396),
+    red=(0.839, 0.373, 0.373), purple=(0.706, 0.486, 0.780),
+    yellow=(0.769, 0.678, 0.400), cyan=(0.467, 0.745, 0.859)),
+  deep=dict(blue=(0.298, 0.447, 0.690), green=(0.333, 0.659, 0.408),
+    red=(0.769, 0.306, 0.322), purple=(0.506, 0.447, 0.698),
+    yellow=(0.800, 0.725, 0.455), cyan=(0.392, 0.710, 0.804)),
+  dark=dict(blue=(0.000, 0.110, 0.498), green=(0.004, 0.459, 0.090),
+    red=(0.549, 0.035, 0.000), purple=(0.463, 0.000, 0.631),
+    yellow=(0.722, 0.525, 0.043), cyan=(0.000, 0.388, 0.455)))
+_style_cache = dict(font={}, cmap={})
+_style_cache_counts = dict(font=dict(hits=0, misses=0),
+    cmap=dict(hits=0, misses=0))
 
 
 ################################## FUNCTIONS ##################################
@@ -56,7 +77,8 @@ def sformat(text, **kwargs):
     return (re.sub(r"\s+", " ", text))
 
 
-def load_dataset(cls=None, dataset_cache=None, loose=False, **kwargs):
+def load_dataset(cls=None, dataset_cache=None, loose=False, lazy=False,
+  **kwargs):
     """
     Loads a dataset, or reloads a previously-loaded dataset from a
     cache.
@@ -78,6 +100,13 @@ def load_dataset(cls=None, dataset_cache=None, loose=False, **kwargs):
     :meth:`Dataset.Dataset.get_cache_message` which returns a message to
     display when the dataset is loaded from the cache.
 
+    If `lazy` is True and the dataset is not already in the cache, a
+    :class:`Dataset.DatasetProxy` is returned in place of the dataset;
+    the dataset is loaded, and stored in the cache, only once an
+    attribute of the proxy (e.g. `dataframe`) is first accessed. Datasets
+    that are requested but never drawn (e.g. those of hidden subplots)
+    are then never loaded.
+
     Arguments:
       cls (class, str): Dataset class; may be either class object itself:
         or name of class in form of 'package.module.class'; if None,
@@ -87,14 +116,20 @@ def load_dataset(cls=None, dataset_cache=None, loose=False, **kwargs):
         datasets
       loose (bool): Check only `infile` when reloading from cache; this
         may be used to reload a previously-loaded dataset without
-        specifiying every argument every time.
+        specifiying every argument every time. A dataset that was
+        loaded with only some columns (``usecols``) is reloaded only if
+        it includes every column requested (see
+        :meth:`Dataset.Dataset.get_cache_usecols`).
+      lazy (bool): Return a proxy that loads the dataset when its data
+        are first accessed
       verbose (int): Level of verbose output
       kwargs (dict): Keyword arguments passed to
         :meth:`Dataset.Dataset.get_cache_key` and
         :meth:`Dataset.Dataset.cls`
 
     Returns:
-      object: Dataset, either newly initialized or copied from cache
+      object: Dataset, either newly initialized or copied from cache,
+      or a :class:`Dataset.DatasetProxy` of dataset if *lazy*
 
     .. todo:
       - Handling of errors remains extremely frustrating in python
@@ -104,16 +139,27 @@ def load_dataset(cls=None, dataset_cache=None, loose=False, **kwargs):
         may be recapitulated; this may help with 'loose'
     """
     from os.path import expandvars
-    import six
 
     # Process arguments
     verbose = kwargs.get("verbose", 1)
 
     # Enable 'loose' loading of previously-loaded datasets using
-    # infile path only
+    # infile path only; datasets that include only some columns are used
+    # only if they include the requested columns
     if loose:
         if dataset_cache is not None:
-            loose_keys = {key[1]: key for key in dataset_cache.keys()}
+            usecols = kwargs.get("usecols")
+            if usecols is not None and not isinstance(usecols,
+              (list, tuple)):
+                usecols = [usecols]
+            loose_keys = {}
+            for key in dataset_cache.keys():
+                if hasattr(key[0], "get_cache_usecols"):
+                    key_usecols = key[0].get_cache_usecols(key)
+                    if key_usecols is not None and (usecols is None
+                      or not set(usecols).issubset(key_usecols)):
+                        continue
+                loose_keys[key[1]] = key
             infile = kwargs.get("infile")
             if infile is not None:
                 if isinstance(infile, str):
@@ -128,16 +174,20 @@ def load_dataset(cls=None, dataset_cache=None, loose=False, **kwargs):
                             wiprint("Previously loaded")
                         return dataset
 
-    if cls == "__noclass__":
-        return None
+    cls = get_dataset_class(cls)
     if cls is None:
-        from .Dataset import Dataset
-        cls = Dataset
-    elif isinstance(cls, six.string_types):
-        mod_name = ".".join(cls.split(".")[:-1])
-        clsname = cls.split(".")[-1]
-        mod = __import__(mod_name, fromlist=[str(clsname)])
-        cls = getattr(mod, clsname)
+        return None
+
+    if lazy:
+        from .Dataset import DatasetProxy
+
+        if dataset_cache is not None and hasattr(cls, "get_cache_key"):
+            cache_key = cls.get_cache_key(**kwargs)
+            if cache_key is not None and cache_key in dataset_cache:
+                return load_dataset(cls=cls, dataset_cache=dataset_cache,
+                    **kwargs)
+        return DatasetProxy(load_dataset, cls=cls,
+            dataset_cache=dataset_cache, loose=loose, **kwargs)
 
     if dataset_cache is not None and hasattr(cls, "get_cache_key"):
         cache_key = cls.get_cache_key(**kwargs)
@@ -158,36 +208,89 @@ def load_dataset(cls=None, dataset_cache=None, loose=False, **kwargs):
         return cls(**kwargs)
 
 
-def get_cmap(color, **kwargs):
+def get_dataset_class(cls=None):
+    """
+    Determines the class of a dataset.
+
+    Arguments:
+      cls (class, str): Dataset class; may be either class object itself
+        or name of class in form of 'package.module.class'; if None,
+        :class:`Dataset.Dataset` is returned; if '__noclass__', None is
+        returned
+
+    Returns:
+      class: Dataset class
+    """
+    import six
+
+    if cls == "__noclass__":
+        return None
+    if cls is None:
+        from .Dataset import Dataset
+        cls = Dataset
+    elif isinstance(cls, six.string_types):
+        mod_name = ".".join(cls.split(".")[:-1])
+        clsname = cls.split(".")[-1]
+        mod = __import__(mod_name, fromlist=[str(clsname)])
+        cls = getattr(mod, clsname)
+    return cls
+
+
+def get_cmap(color, cache=True, **kwargs):
     """
     Generates a colormap of uniform `color`.
 
+    Colormaps are interned by color (see :func:`get_style_cache_info`);
+    the same colormap is returned for each request for the same color,
+    and should be copied before it is modified (e.g. using
+    :meth:`set_bad`).
+
     Arguments:
       color (str, list, ndarray, float): Color; passed through
         :func:`get_color`
+      cache (bool): Load from and store in cache
 
     Returns:
       LinearSegmentedColormap: Color map
     """
-    from matplotlib.colors import LinearSegmentedColormap
     from . import get_color
 
-    r, g, b = get_color(color)
+    def generate_cmap():
+        from matplotlib.colors import LinearSegmentedColormap
 
-    cdict = {"red": ((0, r, r), (1, r, r)), "green": ((0, g, g), (1, g, g)),
-        "blue": ((0, b, b), (1, b, b))}
-    return LinearSegmentedColormap("cmap", cdict, 256)
+        cdict = {"red": ((0, r, r), (1, r, r)),
+            "green": ((0, g, g), (1, g, g)), "blue": ((0, b, b), (1, b, b))}
+        return LinearSegmentedColormap("cmap", cdict, 256)
 
+    r, g, b = [float(c) for c in get_color(color)]
 
-def get_yaml(input):
+    return _get_interned("cmap", (r, g, b), generate_cmap, cache)
+
+
+def get_yaml(input, cache=True, read_only=False):
     """
     Generates a data structure from yaml input. 
 
+    Yaml is parsed using PyYAML's safe loader, backed by LibYAML if
+    available. Since the same yaml is typically loaded many times (e.g.
+    defaults and presets, by each decorated method), data structures
+    loaded from yaml are cached; files are cached by path, modification
+    time, and size, and strings by content. Each caller receives a
+    writable copy of the cached data structure, unless *read_only* is
+    True.
+
     Arguments:
       input (str, dict): yaml input; if str, tests whether or not it is
         a path to a yaml file. If it is, the file is loaded using yaml;
         if it is not a file, the string itself is loaded using yaml. If
         dict, returned without modification
+      cache (bool): Load from and store in cache
+      read_only (bool): Return the cached data structure itself, which
+        is read-only (see :func:`get_read_only`), rather than a writable
+        copy, and return dicts as read-only copies; used by
+        :class:`~myplotspec.manage_kwargs.manage_kwargs` and
+        :class:`~myplotspec.manage_defaults_presets.
+        manage_defaults_presets`, which share the result among calls
 
     Returns:
       output: Data structure specified by input
@@ -203,31 +306,51 @@ def get_yaml(input):
       - Should this bounce back other input types (e.g. list) as it does
         dict?
     """
-    from os.path import isfile
+    from os import stat
+    from os.path import abspath, isfile
     from warnings import warn
     import yaml
     import six
 
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
     if six.PY2:
         open_yaml = file
     else:
         open_yaml = open
 
     if isinstance(input, dict):
-        return input
+        return get_read_only(input) if read_only else input
     elif isinstance(input, six.string_types):
-        if isfile(input):
+        # Multi-line strings are yaml rather than paths
+        if "\n" not in input and isfile(input):
+            info = stat(input)
+            key = ("file", abspath(input), info.st_mtime, info.st_size)
+            if cache and key in _yaml_cache:
+                output = _yaml_cache[key]
+                return output if read_only else get_writable(output)
             with open_yaml(input, "r") as infile:
-                return yaml.load(infile)
+                output = get_read_only(yaml.load(infile, Loader=Loader))
         else:
-            output = yaml.load(input)
+            key = ("string", input)
+            if cache and key in _yaml_cache:
+                output = _yaml_cache[key]
+                return output if read_only else get_writable(output)
+            output = get_read_only(yaml.load(input, Loader=Loader))
             if isinstance(output, str):
                 warn("myplotspec.get_yaml() has loaded input "
                      "'{0}' as a string rather than a dictionary ".format(
                   input) + "or other data structure; if input was intended "
                            "as an "
                            "infile it was not found.")
-            return output
+        if cache:
+            if len(_yaml_cache) >= 256:
+                _yaml_cache.clear()
+            _yaml_cache[key] = output
+        return output if read_only else get_writable(output)
     elif input is None:
         warn("myplotspec.get_yaml() has been asked to load input 'None', and "
              "will return an empty dictionary.")
@@ -255,6 +378,12 @@ def merge_dicts(dict_1, dict_2):
     Raises:
       AttributeError: Either `dict_1` or `dict_2` lacks 'keys' function
 
+    Note:
+      Values that are :class:`ReadOnlyDict` or :class:`ReadOnlyList`
+      are converted into writable dicts and lists, so that the merged
+      dictionary may be modified without affecting its sources'
+      read-only contents.
+
     .. todo:
       - Consider options to override, concatenate, or merge list
         values within dictionaries
@@ -278,11 +407,11 @@ def merge_dicts(dict_1, dict_2):
                   dict)):
                     yield (key, dict(merge(dict_1[key], dict_2[key])))
                 else:
-                    yield (key, dict_2[key])
+                    yield (key, get_writable(dict_2[key]))
             elif key in dict_1:
-                yield (key, dict_1[key])
+                yield (key, get_writable(dict_1[key]))
             else:
-                yield (key, dict_2[key])
+                yield (key, get_writable(dict_2[key]))
 
     if not isinstance(dict_1, dict) or not isinstance(dict_2, dict):
         raise AttributeError(
@@ -296,6 +425,103 @@ def merge_dicts(dict_1, dict_2):
     return dict(merge(dict_1, dict_2))
 
 
+def get_read_only(value):
+    """
+    Generates a read-only view of a nested dictionary.
+
+    Arguments:
+      value: Value to make read-only; if dict or list, it and all dicts
+        and lists nested within it are converted to
+        :class:`ReadOnlyDict` and :class:`ReadOnlyList`; other types
+        are returned without modification
+
+    Returns:
+      value: Read-only version of *value*
+    """
+    if isinstance(value, (ReadOnlyDict, ReadOnlyList)):
+        return value
+    elif isinstance(value, dict):
+        return ReadOnlyDict(
+          [(k, get_read_only(v)) for k, v in dict.items(value)])
+    elif isinstance(value, list):
+        return ReadOnlyList([get_read_only(v) for v in value])
+    return value
+
+
+def get_writable(value):
+    """
+    Generates a writable copy of a read-only nested dictionary.
+
+    Arguments:
+      value: Value to make writable; if :class:`ReadOnlyDict`,
+        :class:`ReadOnlyList`, or :class:`LayeredDict`, it and all
+        such dicts and lists nested within it are copied into dicts and
+        lists; other types are returned without modification
+
+    Returns:
+      value: Writable version of *value*
+    """
+    if isinstance(value, (ReadOnlyDict, LayeredDict)):
+        return dict([(k, get_writable(v)) for k, v in dict.items(value)])
+    elif isinstance(value, ReadOnlyList):
+        return [get_writable(v) for v in value]
+    return value
+
+
+def get_lazy_copy(value):
+    """
+    Generates a copy of a nested dictionary, deferring copies of its
+    read-only contents.
+
+    Dicts are copied into :class:`LayeredDict`, which shares read-only
+    dicts and lists nested within them until they are accessed; other
+    dicts and lists nested within them are copied recursively.
+
+    Arguments:
+      value: Value to copy
+
+    Returns:
+      value: Copy of *value*
+    """
+    from copy import deepcopy
+
+    if isinstance(value, (ReadOnlyDict, LayeredDict)) or type(value) is dict:
+        return LayeredDict([dict([(k, v if isinstance(v,
+          (ReadOnlyDict, ReadOnlyList)) else get_lazy_copy(v)) for k, v in
+            dict.items(value)])])
+    elif isinstance(value, ReadOnlyList) or type(value) is list:
+        return [get_lazy_copy(v) for v in value]
+    return deepcopy(value)
+
+
+def get_digest(value):
+    """
+    Generates a digest of a nested data structure.
+
+    The digest is independent of the order of dict keys, and so may be
+    used to compare data structures loaded at different times (e.g. as
+    the key of a cache stored on disk).
+
+    Arguments:
+      value: Data structure of dicts, lists, tuples, and other types
+        whose repr is stable
+
+    Returns:
+      str: Hexadecimal SHA-1 digest
+    """
+    from hashlib import sha1
+
+    def canonical(value):
+        if isinstance(value, dict):
+            return "{" + ",".join(sorted([repr(k) + ":" + canonical(v) for
+                k, v in dict.items(value)])) + "}"
+        elif isinstance(value, (list, tuple)):
+            return "[" + ",".join([canonical(v) for v in value]) + "]"
+        return repr(value)
+
+    return sha1(canonical(value).encode("utf-8")).hexdigest()
+
+
 def get_color(color):
     """
     Converts color from a format understood by myplotspec to a format
@@ -313,7 +539,7 @@ def get_color(color):
       color (str, list, ndarray, float): color
 
     Returns:
-      (list): [red, green, blue] on interval 0.0-1.0
+      (tuple): (red, green, blue) on interval 0.0-1.0
 
     .. todo:
         - Useful error messages
@@ -322,24 +548,6 @@ def get_color(color):
     """
     import numpy as np
 
-    colors = dict(
-      default=dict(black=[0.000, 0.000, 0.000], blue=[0.298, 0.447, 0.690],
-        green=[0.333, 0.659, 0.408], red=[0.769, 0.306, 0.321],
-        purple=[0.506, 0.447, 0.698], yellow=[0.800, 0.725, 0.455],
-        cyan=[0.392, 0.710, 0.804]),
-      pastel=dict(blue=[0.573, 0.776, 1.000], green=[0.592, 0.941, 0.667],
-        red=[1.000, 0.624, 0.604], purple=[0.816, 0.733, 1.000],
-        yellow=[1.000, 0.996, 0.639], cyan=[0.690, 0.878, 0.902]),
-      muted=dict(blue=[0.282, 0.471, 0.812], green=[0.416, 0.800, 0.396],
-        red=[0.839, 0.373, 0.373], purple=[0.706, 0.486, 0.780],
-        yellow=[0.769, 0.678, 0.400], cyan=[0.467, 0.745, 0.859]),
-      deep=dict(blue=[0.298, 0.447, 0.690], green=[0.333, 0.659, 0.408],
-        red=[0.769, 0.306, 0.322], purple=[0.506, 0.447, 0.698],
-        yellow=[0.800, 0.725, 0.455], cyan=[0.392, 0.710, 0.804]),
-      dark=dict(blue=[0.000, 0.110, 0.498], green=[0.004, 0.459, 0.090],
-        red=[0.549, 0.035, 0.000], purple=[0.463, 0.000, 0.631],
-        yellow=[0.722, 0.525, 0.043], cyan=[0.000, 0.388, 0.455]))
-
     if isinstance(color, str):
         if color.startswith("#"):
             from matplotlib.colors import hex2color
@@ -351,14 +559,14 @@ def get_color(color):
             pass
         if "." in color:
             palette, color = color.split(".")
-            return colors[palette][color]
-        elif color in colors["default"]:
-            return colors["default"][color]
+            return _palettes[palette][color]
+        elif color in _palettes["default"]:
+            return _palettes["default"][color]
         else:
             return color
     elif (isinstance(color, list) or isinstance(color,
       np.ndarray) or isinstance(color, tuple)):
-        color = np.array(color, dtype=np.float)
+        color = np.array(color, dtype=float)
         if np.any(color[0] > 1):
             color /= 255
         return tuple(color)
@@ -488,6 +696,9 @@ def multi_get_copy(*args, **kwargs):
     """
     Scans dict for keys; returns copy of first value.
 
+    Dicts and lists are copied using :func:`get_lazy_copy`, so that
+    read-only contents are copied only if accessed.
+
     Arguments:
       keys (str, list): Acceptable key(s) in order of decreasing
         priority
@@ -538,7 +749,6 @@ def _multi_get_pop(keys, dictionary, value=None, pop=False, copy=False):
       - Smoothly support optional plurality
       - Support merging of dict or list values
     """
-    from copy import deepcopy
     import six
 
     if isinstance(keys, six.string_types):
@@ -559,7 +769,7 @@ def _multi_get_pop(keys, dictionary, value=None, pop=False, copy=False):
     for key in [key for key in keys if key in dictionary]:
         if not found:
             if copy:
-                value = deepcopy(dictionary.get(key))
+                value = get_lazy_copy(dictionary.get(key))
             else:
                 value = dictionary.get(key)
             found = True
@@ -568,6 +778,97 @@ def _multi_get_pop(keys, dictionary, value=None, pop=False, copy=False):
     return value
 
 
+def get_decimated(x, y, n_columns, mode="minmax", **kwargs):
+    """
+    Reduces the number of points in a series, while preserving its
+    appearance when drawn as a line.
+
+    In 'minmax' mode, the range of *x* is divided into *n_columns*
+    columns of equal width (typically one per pixel), and the first,
+    last, minimum, and maximum points of each column are retained, so
+    that the extremes of the series are preserved exactly. In 'lttb'
+    mode, *n_columns* points are selected using the
+    largest-triangle-three-buckets algorithm, which preserves the shape
+    of the series; buckets are processed in turn, but the points of
+    each bucket are compared all at once.
+
+    Arguments:
+      x (ndarray): x values, sorted in increasing order
+      y (ndarray): y values
+      n_columns (int): Number of columns
+      mode (str): 'minmax' or 'lttb'
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      (ndarray, ndarray): Decimated x and y; or x and y unchanged if x
+      is not sorted, or if the series is already small enough
+
+    Raises:
+      ValueError: *mode* is not 'minmax' or 'lttb'
+    """
+    import numpy as np
+
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n_columns = int(n_columns)
+    if mode not in ("minmax", "lttb"):
+        raise ValueError("myplotspec.get_decimated() does not support mode "
+                         "'{0}'; mode may be 'minmax' or 'lttb'.".format(mode))
+    if n_columns < 3 or x.size <= (4 if mode == "minmax" else 1) * n_columns:
+        return x, y
+    if not np.all(x[1:] >= x[:-1]):
+        return x, y
+
+    if mode == "minmax":
+        span = x[-1] - x[0]
+        if span > 0:
+            column = np.minimum(((x - x[0]) / span * n_columns).astype(
+                np.int64), n_columns - 1)
+        else:
+            column = np.zeros(x.size, np.int64)
+
+        # Since x is sorted, the points of each column are contiguous
+        starts = np.flatnonzero(np.r_[True, column[1:] != column[:-1]])
+        ends = np.r_[starts[1:], x.size] - 1
+        point_columns = np.repeat(np.arange(starts.size), ends - starts + 1)
+        nan = np.isnan(y)
+        indexes = [starts, ends]
+        for values, reduce in [(np.where(nan, np.inf, y), np.minimum),
+          (np.where(nan, -np.inf, y), np.maximum)]:
+            extrema = reduce.reduceat(values, starts)
+            matches = np.flatnonzero(values == extrema[point_columns])
+            first = np.r_[True, point_columns[matches][1:] !=
+                point_columns[matches][:-1]]
+            indexes.append(matches[first])
+        indexes = np.unique(np.concatenate(indexes))
+    else:
+        edges = np.linspace(1, x.size - 1, n_columns - 1).astype(np.int64)
+        indexes = np.empty(n_columns, np.int64)
+        indexes[0] = 0
+        indexes[-1] = x.size - 1
+        finite = ~np.isnan(y)
+        selected = 0
+        for i in range(n_columns - 2):
+            start, end = edges[i], edges[i + 1]
+            if i + 2 < edges.size:
+                next_finite = finite[end:edges[i + 2]]
+                if next_finite.any():
+                    next_x = x[end:edges[i + 2]][next_finite].mean()
+                    next_y = y[end:edges[i + 2]][next_finite].mean()
+                else:
+                    next_x, next_y = x[end], y[end]
+            else:
+                next_x, next_y = x[-1], y[-1]
+            area = np.abs((x[selected] - next_x) * (y[start:end] -
+                y[selected]) - (x[selected] - x[start:end]) * (next_y -
+                y[selected]))
+            area[np.isnan(area)] = -1
+            selected = start + np.argmax(area)
+            indexes[i + 1] = selected
+
+    return x[indexes], y[indexes]
+
+
 def pad_zero(ticks, digits=None, **kwargs):
     """
     Prepares list of tick labels, each with the same precision.
@@ -651,7 +952,7 @@ def get_edges(figure_or_subplots, absolute=False, **kwargs):
     return edges
 
 
-def get_font(fp=None, **kwargs):
+def get_font(fp=None, cache=True, **kwargs):
     """
     Generates font based on provided specification.
 
@@ -660,8 +961,14 @@ def get_font(fp=None, **kwargs):
     keyword arguments to pass to FontProperties. *fp* may also be a
     FontProperties, in which case it is returned without modification.
 
+    Fonts are interned by their normalized specification (see
+    :func:`get_style_cache_info`), so that e.g. '8b' and {'size': 8,
+    'weight': 'bold'} yield the same FontProperties; it should be copied
+    before it is modified.
+
     Arguments:
         fp (str, dict, FontProperties): Font specifications
+        cache (bool): Load from and store in cache
 
     Returns:
         (FontProperties): Font with given specifications
@@ -676,14 +983,74 @@ def get_font(fp=None, **kwargs):
         kwargs["weight"] = kwargs.get("weight",
           {"r": "regular", "b": "bold"}[fp[-1]])
     elif isinstance(fp, dict):
-        kwargs.update(fp)
+        kwargs.update(fp.items())
     else:
         raise TypeError(
           "Function myplotspec.get_font() does not support" + "input of "
                                                               "type {"
                                                               "0}".format(
             fp.__class__.__name__))
-    return FontProperties(**kwargs)
+
+    def generate_font():
+        return FontProperties(**kwargs)
+
+    key = tuple(sorted([(k, tuple(v) if isinstance(v, list) else v)
+        for k, v in kwargs.items()]))
+    try:
+        hash(key)
+    except TypeError:
+        return generate_font()
+    return _get_interned("font", key, generate_font, cache)
+
+
+def get_style_cache_info():
+    """
+    Reports the use of the caches of :func:`get_font` and
+    :func:`get_cmap`.
+
+    Returns:
+      dict: For each of 'font' and 'cmap', dict including number of
+      'hits', 'misses', and cached objects ('size')
+    """
+    return dict([(kind, dict(size=len(_style_cache[kind]),
+        **_style_cache_counts[kind])) for kind in _style_cache])
+
+
+def clear_style_cache():
+    """
+    Clears the caches of :func:`get_font` and :func:`get_cmap`, and
+    resets their counters.
+    """
+    for kind in _style_cache:
+        _style_cache[kind].clear()
+        _style_cache_counts[kind].update(hits=0, misses=0)
+
+
+def _get_interned(kind, key, generate, cache=True):
+    """
+    Loads a style resource from cache, or generates and stores it.
+
+    Arguments:
+      kind (str): 'font' or 'cmap'
+      key (tuple): Normalized specification of resource
+      generate (function): Generates resource, without arguments
+      cache (bool): Load from and store in cache
+
+    Returns:
+      object: Resource
+    """
+    if not cache:
+        return generate()
+    cached = _style_cache[kind]
+    counts = _style_cache_counts[kind]
+    if key in cached:
+        counts["hits"] += 1
+        return cached[key]
+    counts["misses"] += 1
+    if len(cached) >= 256:
+        cached.clear()
+    cached[key] = resource = generate()
+    return resource
 
 
 def get_figure_subplots(figure=None, subplots=None, index=None, nrows=None,
@@ -851,6 +1218,224 @@ def get_figure_subplots(figure=None, subplots=None, index=None, nrows=None,
 
 
 ################################### CLASSES ###################################
+class ReadOnlyDict(dict):
+    """
+    Dictionary that may not be modified.
+
+    Used to share cached data structures (e.g. compiled defaults and
+    presets) among many callers without risk of one caller's
+    modifications affecting the others. :func:`copy.copy` and
+    :func:`copy.deepcopy` return writable dicts.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("{0} may not be modified; use ".format(
+          self.__class__.__name__) + "myplotspec.get_writable() to obtain "
+                                     "a writable copy")
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+
+        return dict([(deepcopy(k, memo), deepcopy(v, memo)) for k, v in
+            self.items()])
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def __repr__(self):
+        return "{0}({1})".format(self.__class__.__name__, dict.__repr__(self))
+
+
+class ReadOnlyList(list):
+    """
+    List that may not be modified.
+
+    Counterpart of :class:`ReadOnlyDict` for lists nested within shared
+    data structures. Slices, :func:`copy.copy`, and
+    :func:`copy.deepcopy` return writable lists.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("{0} may not be modified; use ".format(
+          self.__class__.__name__) + "myplotspec.get_writable() to obtain "
+                                     "a writable copy")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = reverse = sort = _read_only
+    if hasattr(list, "clear"):
+        clear = _read_only
+    if hasattr(list, "__setslice__"):
+        __setslice__ = __delslice__ = _read_only
+
+    def copy(self):
+        return list(self)
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+
+        return [deepcopy(v, memo) for v in self]
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+    def __repr__(self):
+        return "{0}({1})".format(self.__class__.__name__, list.__repr__(self))
+
+
+class LayeredDict(dict):
+    """
+    Dictionary presenting several layered dictionaries as one.
+
+    Keys and values are resolved on construction from layers provided
+    in order of increasing priority, following the same rules as
+    :func:`merge_dicts`; where a key's values in successive layers are
+    dicts, they are represented by a nested :class:`LayeredDict`.
+    Rather than being copied, :class:`ReadOnlyDict` and
+    :class:`ReadOnlyList` values from the layers are shared, and are
+    replaced with writable copies only when first accessed. This
+    allows cached read-only defaults, presets, and YAML to be combined
+    with the arguments of each call without copying the parts that the
+    call does not modify. Other values are shared by reference, as in
+    :func:`merge_dicts`.
+
+    Operations implemented in C that read the dictionary's contents
+    directly, including unpacking with ``**``, see shared values that
+    have not yet been accessed; ``dict(layered.items())`` yields a dict
+    of copies.
+    """
+    __slots__ = ("_shared",)
+
+    def __init__(self, layers=()):
+        """
+        Initializes.
+
+        Arguments:
+          layers (list): Dicts in order of increasing priority
+        """
+        dict.__init__(self)
+        self._shared = set()
+
+        runs = {}
+        for layer in layers:
+            for key, value in dict.items(layer):
+                if (isinstance(value, dict) and key in runs and isinstance(
+                  runs[key][-1], dict)):
+                    runs[key].append(value)
+                else:
+                    runs[key] = [value]
+        for key, run in runs.items():
+            if len(run) > 1:
+                dict.__setitem__(self, key, LayeredDict(run))
+            else:
+                dict.__setitem__(self, key, run[0])
+                if isinstance(run[0], (ReadOnlyDict, ReadOnlyList)):
+                    self._shared.add(key)
+
+    @staticmethod
+    def _thaw(value):
+        if isinstance(value, ReadOnlyDict):
+            return LayeredDict([value])
+        elif isinstance(value, ReadOnlyList):
+            return [LayeredDict._thaw(v) for v in value]
+        return value
+
+    def _get(self, key):
+        value = dict.__getitem__(self, key)
+        if key in self._shared:
+            value = self._thaw(value)
+            dict.__setitem__(self, key, value)
+            self._shared.discard(key)
+        return value
+
+    def __getitem__(self, key):
+        return self._get(key)
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._shared.discard(key)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._shared.discard(key)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self._get(key)
+        return default
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self._get(key)
+        self[key] = default
+        return default
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self._get(key)
+            del self[key]
+            return value
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        if key in self._shared:
+            value = self._thaw(value)
+            self._shared.discard(key)
+        return key, value
+
+    def update(self, *args, **kwargs):
+        other = dict(*args, **kwargs)
+        dict.update(self, other)
+        self._shared.difference_update(other.keys())
+
+    def clear(self):
+        dict.clear(self)
+        self._shared.clear()
+
+    def values(self):
+        return [self._get(k) for k in list(self.keys())]
+
+    def items(self):
+        return [(k, self._get(k)) for k in list(self.keys())]
+
+    if hasattr(dict, "iteritems"):
+        def itervalues(self):
+            return iter(self.values())
+
+        def iteritems(self):
+            return iter(self.items())
+
+    def copy(self):
+        return LayeredDict([self])
+
+    def __copy__(self):
+        return LayeredDict([self])
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+
+        return dict([(deepcopy(k, memo), deepcopy(v, memo)) for k, v in
+            dict.items(self)])
+
+    def __reduce__(self):
+        return (self.__class__, ([dict(dict.items(self))],))
+
+    def __repr__(self):
+        return "{0}({1})".format(self.__class__.__name__, dict.__repr__(self))
+
+
 class OrderedSet(object):
     """
     """
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+#   myplotspec.asynchronous.py
+#
+#   Copyright (C) 2015-2017 Karl T Debiec
+#   All rights reserved.
+#
+#   This software may be modified and distributed under the terms of the
+#   BSD license. See the LICENSE file for details.
+"""
+Draws reports from within an :mod:`asyncio` event loop.
+
+Compiling the plan, loading datasets, and drawing and saving each
+figure are run in executors, so that the event loop remains responsive
+while a report is drawn. Control returns to the event loop between
+figures, at which point drawing may be cancelled. Figures are drawn one
+at a time, in order; pyplot should be used with a non-interactive
+backend (e.g. Agg), since figures are drawn outside the main thread.
+
+Unlike the rest of myplotspec, this module requires Python 3.7 or
+later, and is not imported by the package itself.
+"""
+################################### MODULES ###################################
+from __future__ import (absolute_import, division, print_function,
+    unicode_literals)
+
+if __name__ == "__main__":
+    __package__ = str("myplotspec")
+    import myplotspec
+from collections import namedtuple
+
+
+################################### CLASSES ###################################
+OutfileEvent = namedtuple("OutfileEvent", ["figure", "path", "complete",
+    "buffers"])
+OutfileEvent.__new__.__defaults__ = (None,)
+OutfileEvent.__doc__ = """
+Notification that a figure has been written to an outfile.
+
+Attributes:
+  figure (int): Index of figure written; None once a multi-page pdf is
+    closed
+  path (str): Absolute path to outfile; None if figure was rendered in
+    memory
+  complete (bool): True if outfile is complete; False if figure was
+    added as a page to a pdf that remains open for later figures
+  buffers (dict): If figure was rendered in memory, its bytes (see
+    :meth:`FigureManager.draw_report <myplotspec.FigureManager.
+    FigureManager.draw_report>`); otherwise None
+"""
+
+
+################################## FUNCTIONS ##################################
+async def iter_report_async(figure_manager, executor=None, io_executor=None,
+  **kwargs):
+    """
+    Draws a report, yielding an event as each outfile is written.
+
+    The report is drawn as by :meth:`FigureManager.draw_report
+    <myplotspec.FigureManager.FigureManager.draw_report>`, and accepts
+    the same arguments. It is prepared and finished (compiling the plan,
+    loading datasets, waiting for figures saved in the background, and
+    closing pdfs; see :meth:`~myplotspec.FigureManager.FigureManager.
+    prepare_report` and :meth:`~myplotspec.FigureManager.FigureManager.
+    finish_report`) in *io_executor*, and each figure is drawn by
+    :meth:`~myplotspec.FigureManager.FigureManager.draw_report_figure`
+    in *executor*. Pages of multi-page pdfs are reported as they are
+    added, and each pdf is reported again once it is closed after all
+    figures have been drawn. If figures are saved in the background
+    (``save_threads``), they are reported once all have been saved.
+    Outfiles are reported from the render plan, and so are not reported
+    if a plan cannot be compiled.
+
+    If the task iterating over events is cancelled, the figure being
+    drawn is completed, no further figures are drawn, and pdfs that are
+    open are closed. A consumer that stops iterating early (e.g. using
+    ``break``) must call the generator's ``aclose()`` for pdfs to be
+    closed promptly; otherwise they are closed only when the generator
+    is finalized. :func:`draw_report_async` does so.
+
+    Arguments:
+      figure_manager (FigureManager): Figure manager with which to draw
+      executor (Executor): Executor in which to draw figures; if None,
+        the event loop's default executor is used
+      io_executor (Executor): Executor in which to prepare and finish
+        report; if None, the event loop's default executor is used
+      kwargs (dict): Arguments accepted by :meth:`FigureManager.
+        draw_report <myplotspec.FigureManager.FigureManager.
+        draw_report>`
+
+    Yields:
+      OutfileEvent: Outfile written
+    """
+    import asyncio
+    from functools import partial
+    from os.path import abspath, expandvars
+    import six
+
+    loop = asyncio.get_running_loop()
+
+    async def run(run_executor, function, *args, **run_kw):
+        # If cancelled while function runs, allow it to finish before
+        # propagating cancellation, so that outfiles are not closed while
+        # a figure is being saved to them
+        future = loop.run_in_executor(run_executor, partial(function, *args,
+            **run_kw))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            await asyncio.wait([future])
+            raise
+
+    def get_events(i, figure_spec, outfiles):
+        if "buffers" in figure_spec:
+            return [OutfileEvent(i, None, True, figure_spec["buffers"])]
+        events = []
+        if "plan_node" in figure_spec:
+            for outfile in figure_spec["plan_node"].outfiles:
+                if not isinstance(outfile, six.string_types):
+                    continue
+                path = abspath(expandvars(outfile))
+                events.append(OutfileEvent(i, path, path not in outfiles))
+        return events
+
+    # Resolve arguments as draw_report would, and prepare report
+    if "draw_report" in figure_manager.get_unwrapped_methods():
+        report_kw = kwargs
+    else:
+        report_kw = await run(io_executor, figure_manager.draw_report,
+            resolve_only=True, **kwargs)
+    report = await run(io_executor, figure_manager.prepare_report,
+        **dict(report_kw.items()))
+    outfiles = report["outfiles"]
+
+    # Draw figures
+    finished = False
+    try:
+        pending = []
+        for i, figure_spec in report["figure_specs"].items():
+            await run(executor, figure_manager.draw_report_figure, report, i)
+            events = get_events(i, figure_spec, outfiles)
+            if report["writer"] is not None:
+                pending.extend(events)
+            else:
+                for event in events:
+                    yield event
+            await asyncio.sleep(0)
+
+        # Finish saving and close multi-page pdfs
+        paths = list(outfiles)
+        finished = True
+        await run(io_executor, figure_manager.finish_report, report)
+        for event in pending:
+            yield event
+        for path in paths:
+            yield OutfileEvent(None, path, True)
+    finally:
+        if not finished:
+            await run(io_executor, figure_manager.finish_report, report,
+                complete=False)
+
+
+async def draw_report_async(figure_manager, callback=None, **kwargs):
+    """
+    Draws a report from within an event loop.
+
+    Arguments:
+      figure_manager (FigureManager): Figure manager with which to draw
+      callback (function): Function called with each
+        :class:`OutfileEvent` as outfile is written; may be a coroutine
+        function
+      kwargs (dict): Arguments accepted by :func:`iter_report_async`
+
+    Returns:
+      list: :class:`OutfileEvent` of each outfile written
+    """
+    import asyncio
+
+    events = []
+    event_iter = iter_report_async(figure_manager, **kwargs)
+    try:
+        async for event in event_iter:
+            events.append(event)
+            if callback is not None:
+                result = callback(event)
+                if asyncio.iscoroutine(result):
+                    await result
+    finally:
+        await event_iter.aclose()
+    return events
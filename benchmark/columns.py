@@ -0,0 +1,143 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#   myplotspec.benchmark.columns.py
+#
+#   Copyright (C) 2015-2017 Karl T Debiec
+#   All rights reserved.
+#
+#   This software may be modified and distributed under the terms of the
+#   BSD license. See the LICENSE file for details.
+"""
+Measures the time spent reading a wide dataset when only a few of its
+columns are used.
+
+Generates a text file and an hdf5 file (if h5py is available) of random
+values with the given numbers of rows and columns, and times
+:meth:`Dataset.read <myplotspec.Dataset.Dataset.read>` of each, reading
+all columns and reading only the first few (``usecols``), which are
+parsed from text using :func:`read_csv <pandas.read_csv>`'s ``usecols``
+and read from hdf5 as a selection of columns.
+"""
+################################### MODULES ###################################
+from __future__ import (absolute_import, division, print_function,
+    unicode_literals)
+
+if __name__ == "__main__":
+    __package__ = str("myplotspec.benchmark")
+    import myplotspec.benchmark
+
+
+################################## FUNCTIONS ##################################
+def generate_dataset(workdir, n_rows=2000, n_columns=500, seed=0, **kwargs):
+    """
+    Generates a wide dataset.
+
+    Arguments:
+      workdir (str): Directory in which to write dataset
+      n_rows (int): Number of rows
+      n_columns (int): Number of columns, excluding index
+      seed (int): Seed of random number generator
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      (list, list): Paths to text file and hdf5 address (the latter
+      omitted if h5py is not available), and names of columns
+    """
+    from os.path import join
+    import numpy as np
+
+    try:
+        import h5py
+    except ImportError:
+        h5py = None
+
+    random = np.random.RandomState(seed)
+    time = np.arange(n_rows, dtype=np.float64) * 0.1
+    values = random.normal(size=(n_rows, n_columns))
+    columns = ["column_{0}".format(i) for i in range(n_columns)]
+
+    text_path = join(workdir, "wide.txt")
+    np.savetxt(text_path, np.column_stack((time, values)),
+        fmt=str("%.6f"), delimiter=str("  "),
+        header=str("  ".join(["time"] + columns)), comments=str("#"))
+    infiles = [text_path]
+
+    if h5py is not None:
+        hdf5_path = join(workdir, "wide.h5")
+        with h5py.File(hdf5_path, "w") as h5_file:
+            group = h5_file.create_group("wide")
+            group.create_dataset("values", data=values)
+            group.create_dataset("index", data=time)
+            group.attrs["columns"] = [np.bytes_(c) for c in columns]
+            group.attrs["index_name"] = np.bytes_("time")
+        infiles.append("{0}:/wide".format(hdf5_path))
+
+    return infiles, columns
+
+
+def measure(infile, usecols=None, repeat=3, **kwargs):
+    """
+    Measures the time required to read a dataset.
+
+    Arguments:
+      infile (str): Path to infile
+      usecols (list): Columns to read; if None, all are read
+      repeat (int): Number of reads; fastest is reported
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      (float, tuple): Time in milliseconds, and shape of DataFrame read
+    """
+    from timeit import default_timer
+    from ..Dataset import Dataset
+
+    reader = Dataset.__new__(Dataset)
+    times = []
+    for i in range(repeat):
+        start = default_timer()
+        dataframe = reader.read(infile=infile, usecols=usecols, verbose=0)
+        times.append(default_timer() - start)
+    return min(times) * 1000, dataframe.shape
+
+
+def main():
+    """
+    Provides command-line interface.
+    """
+    import argparse
+    from shutil import rmtree
+    from tempfile import mkdtemp
+
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-rows", type=int, default=2000, dest="n_rows",
+        help="Number of rows")
+    parser.add_argument("-columns", type=int, default=500, dest="n_columns",
+        help="Number of columns")
+    parser.add_argument("-used", type=int, default=2, dest="n_used",
+        help="Number of columns used")
+    parser.add_argument("-repeat", type=int, default=3,
+        help="Number of reads; fastest is reported")
+    arguments = vars(parser.parse_args())
+
+    workdir = mkdtemp(prefix="myplotspec_benchmark_")
+    try:
+        infiles, columns = generate_dataset(workdir, **arguments)
+        usecols = columns[:arguments["n_used"]]
+        print("{0:8s} {1:>8s} {2:>12s} {3:>12s}".format("format", "columns",
+            "shape", "read (ms)"))
+        for infile in infiles:
+            label = "hdf5" if ".h5" in infile else "text"
+            for used in [None, usecols]:
+                time, shape = measure(infile, usecols=used,
+                    repeat=arguments["repeat"])
+                print("{0:8s} {1:>8s} {2:>12s} {3:12.3f}".format(label,
+                    "all" if used is None else str(len(used)),
+                    "{0}x{1}".format(*shape), time))
+    finally:
+        rmtree(workdir)
+
+
+#################################### MAIN #####################################
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#   myplotspec.benchmark.get_yaml.py
+#
+#   Copyright (C) 2015-2017 Karl T Debiec
+#   All rights reserved.
+#
+#   This software may be modified and distributed under the terms of the
+#   BSD license. See the LICENSE file for details.
+"""
+Measures the time required to load yaml using :func:`myplotspec.get_yaml`.
+
+Compares PyYAML's pure-python and LibYAML-backed safe loaders with
+:func:`~myplotspec.get_yaml` with its cache disabled (cold) and enabled
+(warm), for a yaml file (by default ``test_big.yml``) loaded by path
+and by content, and for the presets of :class:`~myplotspec.FigureManager.
+FigureManager`.
+"""
+################################### MODULES ###################################
+from __future__ import (absolute_import, division, print_function,
+    unicode_literals)
+
+if __name__ == "__main__":
+    __package__ = str("myplotspec.benchmark")
+    import myplotspec.benchmark
+from .. import get_yaml
+from ..FigureManager import FigureManager
+
+
+################################## FUNCTIONS ##################################
+def measure(function, number=100, repeat=3, **kwargs):
+    """
+    Measures the time required to run a function.
+
+    Arguments:
+      function (function): Function to run, without arguments
+      number (int): Number of times to run function per repeat
+      repeat (int): Number of repeats; fastest is reported
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      float: Time per run in milliseconds
+    """
+    from timeit import repeat as timeit_repeat
+
+    return min(timeit_repeat(function, number=number,
+        repeat=repeat)) / number * 1000
+
+
+def load_file(infile, loader):
+    """
+    Loads a yaml file using PyYAML.
+
+    Arguments:
+      infile (str): Path to yaml file
+      loader (class): PyYAML loader
+
+    Returns:
+      output: Data structure specified by yaml file
+    """
+    import yaml
+
+    with open(infile, "r") as yaml_file:
+        return yaml.load(yaml_file, Loader=loader)
+
+
+def get_loaders():
+    """
+    Lists available PyYAML safe loaders.
+
+    Returns:
+      list: (name, loader class) tuple for each available loader
+    """
+    import yaml
+
+    loaders = [("SafeLoader", yaml.SafeLoader)]
+    if hasattr(yaml, "CSafeLoader"):
+        loaders.append(("CSafeLoader", yaml.CSafeLoader))
+    return loaders
+
+
+def main():
+    """
+    Provides command-line interface.
+    """
+    import argparse
+    from os.path import dirname, join
+    import yaml
+
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-infile", type=str,
+        default=join(dirname(dirname(__file__)), "test_big.yml"),
+        help="yaml file to load (default: %(default)s)")
+    parser.add_argument("-number", type=int, default=100,
+        help="Number of loads per repeat")
+    parser.add_argument("-repeat", type=int, default=3,
+        help="Number of repeats; fastest is reported")
+    arguments = vars(parser.parse_args())
+    infile = arguments.pop("infile")
+    with open(infile, "r") as yaml_file:
+        content = yaml_file.read()
+
+    for label, source in [("file", infile), ("string", content),
+        ("presets", FigureManager.available_presets)]:
+        print("{0} ({1} characters)".format(label,
+            len(content) if label == "file" else len(source)))
+        for name, loader in get_loaders():
+            if label == "file":
+                function = lambda: load_file(infile, loader)
+            else:
+                function = lambda: yaml.load(source, Loader=loader)
+            print("  {0:30s} {1:10.3f} ms".format("yaml.load ({0})".format(
+                name), measure(function, **arguments)))
+        print("  {0:30s} {1:10.3f} ms".format("get_yaml (cold)",
+            measure(lambda: get_yaml(source, cache=False), **arguments)))
+        get_yaml(source)
+        print("  {0:30s} {1:10.3f} ms".format("get_yaml (warm)",
+            measure(lambda: get_yaml(source), **arguments)))
+
+
+#################################### MAIN #####################################
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#   myplotspec.benchmark.import_time.py
+#
+#   Copyright (C) 2015-2017 Karl T Debiec
+#   All rights reserved.
+#
+#   This software may be modified and distributed under the terms of the
+#   BSD license. See the LICENSE file for details.
+"""
+Measures the time required to import myplotspec modules.
+
+Each import is run in a fresh interpreter using ``python -X importtime``,
+so that results are not influenced by modules already loaded into the
+current process. In addition to timing, checks that heavy dependencies
+(matplotlib, numpy, pandas, h5py, IPython, sklearn) are not loaded as a
+side effect of importing myplotspec or of displaying command-line help;
+these should be imported by the functions that use them, on first use.
+"""
+################################### MODULES ###################################
+from __future__ import (absolute_import, division, print_function,
+    unicode_literals)
+
+################################## VARIABLES ##################################
+modules = ["myplotspec", "myplotspec.Dataset", "myplotspec.FigureManager",
+    "myplotspec.axes", "myplotspec.legend", "myplotspec.text",
+    "myplotspec.manage_defaults_presets", "myplotspec.manage_kwargs",
+    "myplotspec.manage_output"]
+heavy_modules = ["matplotlib", "numpy", "pandas", "h5py", "IPython",
+    "sklearn"]
+help_statement = """
+import sys
+from myplotspec.FigureManager import FigureManager
+sys.argv = ["FigureManager.py", "--help"]
+try:
+    FigureManager().main()
+except SystemExit:
+    pass
+"""
+
+
+################################## FUNCTIONS ##################################
+def get_package_root():
+    """
+    Determines the directory that must be on the python path in order
+    to import myplotspec.
+
+    Returns:
+      str: Parent directory of the myplotspec package
+    """
+    from os.path import abspath, dirname
+
+    return dirname(dirname(dirname(abspath(__file__))))
+
+
+def run_importtime(statement, **kwargs):
+    """
+    Runs a statement in a fresh interpreter with ``-X importtime``.
+
+    Arguments:
+      statement (str): Python statement to run
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      list: (self time, cumulative time, module name) tuple for each
+      module imported, in microseconds
+    """
+    from os import environ, pathsep
+    from subprocess import PIPE, Popen
+    import sys
+
+    env = dict(environ)
+    env["PYTHONPATH"] = pathsep.join(
+        [get_package_root()] + [p for p in
+            env.get("PYTHONPATH", "").split(pathsep) if p != ""])
+    process = Popen([sys.executable, "-X", "importtime", "-c", statement],
+        stdout=PIPE, stderr=PIPE, env=env)
+    stdout, stderr = process.communicate()
+    if process.returncode != 0:
+        raise Exception("Statement '{0}' failed:\n{1}".format(statement,
+            stderr.decode("utf-8", "replace")))
+
+    imports = []
+    for line in stderr.decode("utf-8", "replace").splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        imports.append((int(fields[0]), int(fields[1]), fields[2].strip()))
+    return imports
+
+
+def measure(statement, module=None, repeat=5, **kwargs):
+    """
+    Measures the import time of a statement.
+
+    Arguments:
+      statement (str): Python statement to run
+      module (str, optional): Module whose cumulative import time to
+        report; if None, the sum of top-level imports is reported
+      repeat (int): Number of fresh interpreters to run; the fastest
+        is reported
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      (float, list): Import time in milliseconds, and names of heavy
+      modules loaded by the statement
+    """
+    best = None
+    for i in range(repeat):
+        imports = run_importtime(statement)
+        if module is not None:
+            time = [c for s, c, name in imports if name == module][-1]
+        else:
+            time = sum([c for s, c, name in imports if name == name.lstrip()])
+        if best is None or time < best:
+            best = time
+    loaded = sorted(set([name.split(".")[0] for s, c, name in imports
+        if name.strip().split(".")[0] in heavy_modules]))
+    return best / 1000, loaded
+
+
+def main():
+    """
+    Provides command-line interface.
+    """
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-budget", type=float, default=150.0,
+        metavar="MS", help="Maximum acceptable import time of each module "
+                           "(ms)")
+    parser.add_argument("-repeat", type=int, default=5,
+        help="Number of fresh interpreters to run for each module; fastest "
+             "is reported")
+    arguments = vars(parser.parse_args())
+    budget = arguments["budget"]
+    repeat = arguments["repeat"]
+
+    failures = []
+    print("{0:40s} {1:>10s}  {2}".format("module", "time (ms)",
+        "heavy modules loaded"))
+    for module in modules:
+        time, loaded = measure("import {0}".format(module), module=module,
+            repeat=repeat)
+        print("{0:40s} {1:10.1f}  {2}".format(module, time,
+            ", ".join(loaded)))
+        if time > budget:
+            failures.append("{0} took {1:.1f} ms to import; budget is "
+                            "{2:.1f} ms".format(module, time, budget))
+        if len(loaded) > 0:
+            failures.append("{0} loaded {1} at import".format(module,
+                ", ".join(loaded)))
+    time, loaded = measure(help_statement, repeat=repeat)
+    print("{0:40s} {1:10.1f}  {2}".format("FigureManager --help", time,
+        ", ".join(loaded)))
+    if len(loaded) > 0:
+        failures.append("FigureManager --help loaded {0}".format(
+            ", ".join(loaded)))
+
+    for failure in failures:
+        print("FAILED: {0}".format(failure))
+    sys.exit(1 if len(failures) > 0 else 0)
+
+
+#################################### MAIN #####################################
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#   myplotspec.benchmark.resolve_kwargs.py
+#
+#   Copyright (C) 2015-2017 Karl T Debiec
+#   All rights reserved.
+#
+#   This software may be modified and distributed under the terms of the
+#   BSD license. See the LICENSE file for details.
+"""
+Measures the time required to resolve keyword arguments from a large
+generated specification.
+
+Walks a generated figures/subplots/datasets specification in the same
+manner as :meth:`FigureManager.draw_report
+<myplotspec.FigureManager.FigureManager.draw_report>`, passing each
+node through :class:`~myplotspec.manage_defaults_presets.
+manage_defaults_presets` and :class:`~myplotspec.manage_kwargs.
+manage_kwargs`, but without drawing anything. The walk is timed with
+:class:`~myplotspec.manage_kwargs.manage_kwargs`'s cache enabled and
+disabled. Where :mod:`tracemalloc` is available, the peak memory
+allocated while resolving the spec with a warm cache is also reported.
+"""
+################################### MODULES ###################################
+from __future__ import (absolute_import, division, print_function,
+    unicode_literals)
+
+if __name__ == "__main__":
+    __package__ = str("myplotspec.benchmark")
+    import myplotspec.benchmark
+from ..FigureManager import FigureManager
+from ..manage_defaults_presets import manage_defaults_presets
+from ..manage_kwargs import manage_kwargs
+
+
+################################## FUNCTIONS ##################################
+def generate_spec(n_figures=10, n_subplots=9, n_datasets=10, **kwargs):
+    """
+    Generates a figures/subplots/datasets specification.
+
+    Includes 'all' blocks at each level, and selects presets at the
+    top level and for some figures, so that all layers of
+    :class:`~myplotspec.manage_kwargs.manage_kwargs` are exercised.
+
+    Arguments:
+      n_figures (int): Number of figures
+      n_subplots (int): Number of subplots per figure
+      n_datasets (int): Number of datasets per subplot
+      infile (str): Format of infile paths, formatted with figure,
+        subplot, and dataset indexes
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      dict: Specification
+    """
+    infile = kwargs.get("infile", "dataset_{0}_{1}_{2}.txt")
+    colors = ["blue", "red", "green", "purple", "yellow", "cyan"]
+    ncols = max(1, int(n_subplots ** 0.5))
+    nrows = -(-n_subplots // ncols)
+
+    spec = dict(presets=["notebook"], figures=dict(all=dict(
+        nrows=nrows, ncols=ncols, multiplot=True, sub_width=2.0,
+        sub_height=1.5, shared_xlabel="Time (ns)",
+        shared_ylabel="Measurement",
+        subplots=dict(all=dict(xticks=list(range(0, 11)),
+            yticks=[0.0, 0.5, 1.0], tick_params=dict(length=2),
+            datasets=dict(all=dict(plot_kw=dict(lw=1, alpha=0.8))))))))
+    for i in range(n_figures):
+        figure = spec["figures"][i] = dict(outfile="figure_{0}.pdf".format(i),
+            title="Figure {0}".format(i), subplots={})
+        if i % 2 == 1:
+            figure["presets"] = ["manuscript"]
+        for j in range(n_subplots):
+            subplot = figure["subplots"][j] = dict(
+                title="Subplot {0}".format(j), datasets={})
+            for k in range(n_datasets):
+                subplot["datasets"][k] = dict(infile=infile.format(i, j, k),
+                    label="Dataset {0}".format(k),
+                    color=colors[k % len(colors)])
+    return spec
+
+
+def get_resolver(cache_size=4096):
+    """
+    Generates a class that resolves keyword arguments from a spec.
+
+    Arguments:
+      cache_size (int): Passed to
+        :class:`~myplotspec.manage_kwargs.manage_kwargs`
+
+    Returns:
+      class: Resolver class, with the defaults and presets of
+      :class:`~myplotspec.FigureManager.FigureManager`
+    """
+
+    class SpecResolver(FigureManager):
+        """
+        Resolves keyword arguments of each figure, subplot, and dataset
+        of a spec.
+        """
+        defaults = """
+            draw_report:
+              verbose: 0
+            draw_figure:
+              fig_width: 6.0
+            draw_subplot:
+              legend: False
+            draw_dataset:
+              plot_kw:
+                zorder: 10
+        """
+
+        @manage_defaults_presets()
+        @manage_kwargs(cache_size=cache_size)
+        def draw_report(self, **kwargs):
+            count = 0
+            figure_specs = kwargs.pop("figures", {})
+            for i in sorted([int(i) for i in figure_specs if
+                str(i).isdigit()]):
+                count += self.draw_figure(yaml_spec=kwargs["yaml_spec"],
+                    presets=list(kwargs["presets"]),
+                    yaml_keys=[["figures", "all"], ["figures", i]])
+            return count
+
+        @manage_defaults_presets()
+        @manage_kwargs(cache_size=cache_size)
+        def draw_figure(self, **kwargs):
+            count = 0
+            subplot_specs = kwargs.pop("subplots", {})
+            for i in sorted([int(i) for i in subplot_specs if
+                str(i).isdigit()]):
+                count += self.draw_subplot(yaml_spec=kwargs["yaml_spec"],
+                    presets=list(kwargs["presets"]),
+                    yaml_keys=[key for key2 in
+                        [[key3 + ["subplots", "all"], key3 + ["subplots", i]]
+                            for key3 in kwargs["yaml_keys"]] for key in key2])
+            return count
+
+        @manage_defaults_presets()
+        @manage_kwargs(cache_size=cache_size)
+        def draw_subplot(self, **kwargs):
+            count = 0
+            dataset_specs = kwargs.pop("datasets", {})
+            for i in sorted([int(i) for i in dataset_specs if
+                str(i).isdigit()]):
+                count += self.draw_dataset(yaml_spec=kwargs["yaml_spec"],
+                    presets=list(kwargs["presets"]),
+                    yaml_keys=[key for key2 in
+                        [[key3 + ["datasets", "all"], key3 + ["datasets", i]]
+                            for key3 in kwargs["yaml_keys"]] for key in key2])
+            return count
+
+        @manage_defaults_presets()
+        @manage_kwargs(cache_size=cache_size)
+        def draw_dataset(self, **kwargs):
+            kwargs["plot_kw"]["color"] = kwargs.pop("color", None)
+            return 1
+
+    return SpecResolver
+
+
+def measure(spec, cache_size=4096, repeat=3, **kwargs):
+    """
+    Measures the time required to resolve a spec.
+
+    Arguments:
+      spec (dict): Spec to resolve
+      cache_size (int): Passed to
+        :class:`~myplotspec.manage_kwargs.manage_kwargs`
+      repeat (int): Number of times to resolve spec using the same
+        resolver; first (cold cache) and fastest (warm cache) times
+        are reported
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      (float, float, int, float): First and fastest times in seconds,
+      number of datasets resolved, and peak memory allocated in kB
+      during an additional run, or None if :mod:`tracemalloc` is not
+      available
+    """
+    from time import time
+
+    resolver = get_resolver(cache_size=cache_size)()
+    times = []
+    for i in range(repeat):
+        start = time()
+        count = resolver.draw_report(yaml_spec=spec)
+        times.append(time() - start)
+
+    try:
+        import tracemalloc
+    except ImportError:
+        peak = None
+    else:
+        tracemalloc.start()
+        resolver.draw_report(yaml_spec=spec)
+        peak = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+    return times[0], min(times), count, peak
+
+
+def main():
+    """
+    Provides command-line interface.
+    """
+    import argparse
+    from .. import get_read_only
+
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-figures", type=int, default=10, dest="n_figures",
+        help="Number of figures")
+    parser.add_argument("-subplots", type=int, default=9, dest="n_subplots",
+        help="Number of subplots per figure")
+    parser.add_argument("-datasets", type=int, default=10,
+        dest="n_datasets", help="Number of datasets per subplot")
+    parser.add_argument("-repeat", type=int, default=3,
+        help="Number of times to resolve spec")
+    arguments = vars(parser.parse_args())
+
+    # Resolve spec read-only, as when loaded from a yaml file, so that it
+    # may be cached between reports rather than copied for each
+    spec = get_read_only(generate_spec(**arguments))
+    print("{0:10s} {1:>10s} {2:>10s} {3:>10s} {4:>10s}".format("cache",
+        "first (s)", "best (s)", "datasets", "peak (kB)"))
+    for label, cache_size in [("disabled", 0), ("enabled", 4096)]:
+        first, best, count, peak = measure(spec, cache_size=cache_size,
+            repeat=arguments["repeat"])
+        print("{0:10s} {1:10.3f} {2:10.3f} {3:10d} {4:>10s}".format(label,
+            first, best, count, "-" if peak is None else "{0:.0f}".format(
+                peak)))
+
+
+#################################### MAIN #####################################
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#   myplotspec.benchmark.style_resources.py
+#
+#   Copyright (C) 2015-2017 Karl T Debiec
+#   All rights reserved.
+#
+#   This software may be modified and distributed under the terms of the
+#   BSD license. See the LICENSE file for details.
+"""
+Measures the time spent generating colors, fonts, and colormaps while
+drawing a report.
+
+Replays the calls to :func:`myplotspec.get_color`,
+:func:`myplotspec.get_font`, and :func:`myplotspec.get_cmap` made while
+formatting a report of the given size (fonts for the title, axis
+labels, tick labels, and legend of each subplot; a color and a colormap
+for each dataset), with the caches of :func:`~myplotspec.get_font` and
+:func:`~myplotspec.get_cmap` disabled and enabled, and reports the time
+per report and the cache counters from
+:func:`myplotspec.get_style_cache_info`.
+"""
+################################### MODULES ###################################
+from __future__ import (absolute_import, division, print_function,
+    unicode_literals)
+
+if __name__ == "__main__":
+    __package__ = str("myplotspec.benchmark")
+    import myplotspec.benchmark
+from .. import (clear_style_cache, get_cmap, get_color, get_font,
+    get_style_cache_info)
+
+################################## VARIABLES ##################################
+subplot_fonts = ["14b", "12b", "10b", "8r", "8r", "8r", "10b", "8r",
+    dict(size=8, weight="regular")]
+dataset_colors = ["blue", "red", "green", "purple", "yellow", "cyan",
+    "pastel.blue", "dark.red", [76, 114, 176], 0.5]
+
+
+################################## FUNCTIONS ##################################
+def draw_report(n_figures=10, n_subplots=9, n_datasets=10, cache=True,
+  **kwargs):
+    """
+    Replays the style resource calls made while drawing a report.
+
+    Arguments:
+      n_figures (int): Number of figures
+      n_subplots (int): Number of subplots per figure
+      n_datasets (int): Number of datasets per subplot
+      cache (bool): Use caches of :func:`~myplotspec.get_font` and
+        :func:`~myplotspec.get_cmap`
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      int: Number of calls made
+    """
+    count = 0
+    for i in range(n_figures):
+        for j in range(n_subplots):
+            for fp in subplot_fonts:
+                get_font(fp, cache=cache)
+                count += 1
+            for k in range(n_datasets):
+                color = dataset_colors[k % len(dataset_colors)]
+                get_color(color)
+                get_cmap(color, cache=cache)
+                count += 2
+    return count
+
+
+def measure(repeat=3, **kwargs):
+    """
+    Measures the time required to replay the calls of a report.
+
+    Arguments:
+      repeat (int): Number of reports; fastest is reported
+      kwargs (dict): Additional keyword arguments passed to
+        :func:`draw_report`
+
+    Returns:
+      (float, int): Time per report in milliseconds, and number of calls
+      per report
+    """
+    from time import time
+
+    times = []
+    for i in range(repeat):
+        start = time()
+        count = draw_report(**kwargs)
+        times.append(time() - start)
+    return min(times) * 1000, count
+
+
+def main():
+    """
+    Provides command-line interface.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-figures", type=int, default=10, dest="n_figures",
+        help="Number of figures")
+    parser.add_argument("-subplots", type=int, default=9, dest="n_subplots",
+        help="Number of subplots per figure")
+    parser.add_argument("-datasets", type=int, default=10,
+        dest="n_datasets", help="Number of datasets per subplot")
+    parser.add_argument("-repeat", type=int, default=3,
+        help="Number of reports; fastest is reported")
+    arguments = vars(parser.parse_args())
+
+    print("{0:10s} {1:>12s} {2:>10s} {3:>10s} {4:>10s}".format("cache",
+        "report (ms)", "calls", "hits", "misses"))
+    for label, cache in [("disabled", False), ("enabled", True)]:
+        clear_style_cache()
+        time, count = measure(cache=cache, **arguments)
+        info = get_style_cache_info()
+        print("{0:10s} {1:12.3f} {2:10d} {3:10d} {4:10d}".format(label,
+            time, count, sum([i["hits"] for i in info.values()]),
+            sum([i["misses"] for i in info.values()])))
+
+
+#################################### MAIN #####################################
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#   myplotspec.benchmark.suite.py
+#
+#   Copyright (C) 2015-2017 Karl T Debiec
+#   All rights reserved.
+#
+#   This software may be modified and distributed under the terms of the
+#   BSD license. See the LICENSE file for details.
+"""
+Measures the time required by each stage of drawing a generated report.
+
+Generates a report of the given size in a working directory: a text
+file of random walks for each dataset, an hdf5 file containing the same
+data at one address per dataset (if h5py is available), and a yaml
+specification (see :func:`~myplotspec.benchmark.resolve_kwargs.
+generate_spec`) that draws them. Then times:
+
+- :func:`myplotspec.get_yaml`, loading the specification without cache
+- :meth:`FigureManager.compile_report <myplotspec.FigureManager.
+  FigureManager.compile_report>`, which resolves the keyword arguments of
+  each figure, subplot, and dataset using :class:`~myplotspec.
+  manage_kwargs.manage_kwargs`
+- :meth:`Dataset.read <myplotspec.Dataset.Dataset.read>`, reading each
+  text file, and each hdf5 address
+- :meth:`Dataset.calc_pdist <myplotspec.Dataset.Dataset.calc_pdist>`,
+  for the first dataset
+- :meth:`FigureManager.draw_report <myplotspec.FigureManager.
+  FigureManager.draw_report>`, and the time spent within it saving
+  figures in :class:`~myplotspec.manage_output.manage_output`, as
+  recorded by :class:`~myplotspec.profiler.Profiler`
+- :meth:`FigureManager.draw_report <myplotspec.FigureManager.
+  FigureManager.draw_report>` with a
+  :class:`~myplotspec.shared_cache.SharedDatasetCache` (Python 3.8 or
+  later), including starting its manager and loading each text file
+  into it
+
+The fastest time of each is stored in a json file alongside the size of
+the report, and may be compared to a baseline stored by a previous run;
+times more than the threshold slower than the baseline, and stages
+timed in the baseline that fail, are flagged as regressions, and the
+exit status is then 1. Data are generated from a fixed random seed, so
+that runs with the same arguments are comparable.
+"""
+################################### MODULES ###################################
+from __future__ import (absolute_import, division, print_function,
+    unicode_literals)
+
+if __name__ == "__main__":
+    __package__ = str("myplotspec.benchmark")
+    import myplotspec.benchmark
+from .resolve_kwargs import generate_spec
+
+
+################################## FUNCTIONS ##################################
+def generate_report(workdir, n_figures=2, n_subplots=4, n_datasets=3,
+  n_rows=10000, seed=0, **kwargs):
+    """
+    Generates the datasets and specification of a report.
+
+    Arguments:
+      workdir (str): Directory in which to write datasets,
+        specification, and figures
+      n_figures (int): Number of figures
+      n_subplots (int): Number of subplots per figure
+      n_datasets (int): Number of datasets per subplot
+      n_rows (int): Number of rows per dataset
+      seed (int): Seed of random number generator
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      dict: Paths to specification ('spec'), text files ('text'), and
+      hdf5 addresses ('hdf5'; empty if h5py is not available)
+    """
+    from io import open
+    from os.path import join
+    import numpy as np
+    import yaml
+
+    try:
+        import h5py
+    except ImportError:
+        h5py = None
+
+    random = np.random.RandomState(seed)
+    time = np.arange(n_rows, dtype=np.float64) * 0.1
+    text_infiles = []
+    hdf5_infiles = []
+    hdf5_path = join(workdir, "datasets.h5")
+    h5_file = h5py.File(hdf5_path, "w") if h5py is not None else None
+    try:
+        for i in range(n_figures):
+            for j in range(n_subplots):
+                for k in range(n_datasets):
+                    value = np.cumsum(random.normal(size=n_rows)) * 0.01
+
+                    infile = join(workdir, "dataset_{0}_{1}_{2}.txt".format(
+                        i, j, k))
+                    np.savetxt(infile, np.column_stack((time, value)),
+                        fmt=str("%.6f"), delimiter=str("  "),
+                        header=str("time  value"), comments=str("#"))
+                    text_infiles.append(infile)
+
+                    if h5_file is not None:
+                        address = "{0}/{1}/{2}".format(i, j, k)
+                        group = h5_file.create_group(address)
+                        group.create_dataset("values", data=value[:, None])
+                        group.create_dataset("index", data=time)
+                        group.attrs["columns"] = [np.bytes_("value")]
+                        group.attrs["index_name"] = np.bytes_("time")
+                        hdf5_infiles.append("{0}:/{1}".format(hdf5_path,
+                            address))
+    finally:
+        if h5_file is not None:
+            h5_file.close()
+
+    spec = generate_spec(n_figures=n_figures, n_subplots=n_subplots,
+        n_datasets=n_datasets, infile=join(workdir,
+            "dataset_{0}_{1}_{2}.txt"))
+    for i in range(n_figures):
+        spec["figures"][i]["outfile"] = join(workdir,
+            "figure_{0}.png".format(i))
+    spec_path = join(workdir, "spec.yml")
+    with open(spec_path, "w", encoding="utf-8") as spec_file:
+        spec_file.write(yaml.safe_dump(spec, default_flow_style=False,
+            allow_unicode=True))
+
+    return dict(spec=spec_path, text=text_infiles, hdf5=hdf5_infiles)
+
+
+def measure(function, repeat=3, **kwargs):
+    """
+    Measures the time required to run a function.
+
+    Arguments:
+      function (function): Function to run, without arguments; may
+        return a dict of additional times in seconds, keyed by name
+      repeat (int): Number of runs; fastest is reported
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      dict: Fastest time in seconds of function (key None), and of each
+      additional time it returns
+    """
+    from timeit import default_timer
+
+    times = {}
+    for i in range(repeat):
+        start = default_timer()
+        additional = function()
+        elapsed = default_timer() - start
+        times[None] = min(times.get(None, elapsed), elapsed)
+        if isinstance(additional, dict):
+            for key, value in additional.items():
+                times[key] = min(times.get(key, value), value)
+    return times
+
+
+def run(infiles, repeat=3, **kwargs):
+    """
+    Times each stage of drawing a generated report.
+
+    Each stage is timed independently; a stage that fails (e.g. because
+    an optional dependency is missing) is reported as an error rather
+    than a time.
+
+    Arguments:
+      infiles (dict): Paths to specification and datasets, as returned
+        by :func:`generate_report`
+      repeat (int): Number of runs of each stage; fastest is reported
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      OrderedDict: Time in seconds of each stage, or error message
+    """
+    from collections import OrderedDict
+    from .. import get_yaml
+    from ..Dataset import Dataset
+    from ..FigureManager import FigureManager
+    from ..profiler import Profiler
+
+    spec = get_yaml(infiles["spec"])
+    reader = Dataset.__new__(Dataset)
+
+    def load_spec():
+        get_yaml(infiles["spec"], cache=False)
+
+    def resolve_kwargs():
+        FigureManager().compile_report(yaml_spec=spec, verbose=0)
+
+    def read_text():
+        for infile in infiles["text"]:
+            reader.read(infile=infile, verbose=0)
+
+    def read_hdf5():
+        for infile in infiles["hdf5"]:
+            reader.read(infile=infile, verbose=0)
+
+    def calc_pdist():
+        Dataset.calc_pdist(dataframe, verbose=0)
+
+    def draw_report():
+        with Profiler() as profiler:
+            FigureManager().draw_report(yaml_spec=spec, verbose=0)
+        return dict(manage_output=profiler.stages["manage_output"][1])
+
+    def draw_report_shared_cache():
+        from .. import load_dataset
+        from ..shared_cache import SharedDatasetCache
+
+        with SharedDatasetCache() as cache:
+            for infile in infiles["text"]:
+                load_dataset(dataset_cache=cache, infile=infile, verbose=0)
+            figure_manager = FigureManager(dataset_cache=cache)
+            figure_manager.draw_report(yaml_spec=spec, verbose=0)
+            if len(figure_manager.dataset_cache) != len(infiles["text"]):
+                raise ValueError("Shared cache holds {0} datasets, expected "
+                    "{1}".format(len(figure_manager.dataset_cache),
+                    len(infiles["text"])))
+
+    stages = [("get_yaml", load_spec), ("manage_kwargs", resolve_kwargs),
+        ("Dataset.read (text)", read_text)]
+    if len(infiles["hdf5"]) > 0:
+        stages.append(("Dataset.read (hdf5)", read_hdf5))
+    stages += [("Dataset.calc_pdist", calc_pdist),
+        ("draw_report", draw_report),
+        ("draw_report (shared)", draw_report_shared_cache)]
+
+    results = OrderedDict()
+    dataframe = None
+    for name, function in stages:
+        try:
+            if function is calc_pdist and dataframe is None:
+                dataframe = reader.read(infile=infiles["text"][0], verbose=0)
+            times = measure(function, repeat=repeat)
+        except Exception as error:
+            results[name] = "{0}: {1}".format(type(error).__name__, error)
+            continue
+        results[name] = times.pop(None)
+        for key, value in sorted(times.items()):
+            results[key] = value
+    return results
+
+
+def compare(results, baseline, threshold=0.2, **kwargs):
+    """
+    Compares results to a baseline.
+
+    Arguments:
+      results (dict): Time in seconds of each stage
+      baseline (dict): Time in seconds of each stage, from a previous
+        run
+      threshold (float): Fraction by which a stage must be slower than
+        the baseline to be flagged as a regression
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      list: (stage, time, baseline time, ratio, regression) for each
+      stage timed in baseline, and either timed or failed in results;
+      a stage that failed has the error message in place of its time
+      and None as its ratio, and is flagged as a regression
+    """
+    import six
+
+    comparison = []
+    for name, time in results.items():
+        base = baseline.get(name)
+        if not isinstance(base, float):
+            continue
+        if isinstance(time, six.string_types):
+            comparison.append((name, time, base, None, True))
+            continue
+        ratio = time / base if base > 0 else float("inf")
+        comparison.append((name, time, base, ratio, ratio > 1 + threshold))
+    return comparison
+
+
+def main():
+    """
+    Provides command-line interface.
+
+    Returns:
+      int: Exit status; 1 if any regressions were found, or if any stage
+      timed in the baseline failed, otherwise 0
+    """
+    import argparse
+    from io import open
+    from json import dumps, loads
+    from os import makedirs
+    from os.path import isdir
+    import platform
+    from shutil import rmtree
+    from tempfile import mkdtemp
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-figures", type=int, default=2, dest="n_figures",
+        help="Number of figures")
+    parser.add_argument("-subplots", type=int, default=4, dest="n_subplots",
+        help="Number of subplots per figure")
+    parser.add_argument("-datasets", type=int, default=3,
+        dest="n_datasets", help="Number of datasets per subplot")
+    parser.add_argument("-rows", type=int, default=10000, dest="n_rows",
+        help="Number of rows per dataset")
+    parser.add_argument("-seed", type=int, default=0,
+        help="Seed of random number generator")
+    parser.add_argument("-repeat", type=int, default=3,
+        help="Number of runs of each stage; fastest is reported")
+    parser.add_argument("-workdir", type=str,
+        help="Directory in which to generate report; if omitted, a "
+             "temporary directory is used and removed")
+    parser.add_argument("-outfile", type=str,
+        help="json file to which to write results")
+    parser.add_argument("-baseline", type=str,
+        help="json file of previous results with which to compare")
+    parser.add_argument("-threshold", type=float, default=0.2,
+        help="Fraction by which a stage must be slower than the baseline "
+             "to be flagged (default: %(default)s)")
+    arguments = vars(parser.parse_args())
+    size = dict([(k, arguments[k]) for k in ["n_figures", "n_subplots",
+        "n_datasets", "n_rows", "seed"]])
+
+    workdir = arguments["workdir"]
+    if workdir is None:
+        workdir = mkdtemp(prefix="myplotspec_benchmark_")
+    elif not isdir(workdir):
+        makedirs(workdir)
+    try:
+        infiles = generate_report(workdir, **size)
+        results = run(infiles, repeat=arguments["repeat"])
+    finally:
+        if arguments["workdir"] is None:
+            rmtree(workdir)
+
+    print("{0:24s} {1:>12s}".format("stage", "time (s)"))
+    for name, time in results.items():
+        if isinstance(time, float):
+            print("{0:24s} {1:12.4f}".format(name, time))
+        else:
+            print("{0:24s} {1:>12s}  {2}".format(name, "error", time))
+
+    if arguments["outfile"] is not None:
+        with open(arguments["outfile"], "w", encoding="utf-8") as outfile:
+            outfile.write(dumps(dict(size=size,
+                python=platform.python_version(),
+                platform=platform.platform(), results=results), indent=2,
+                ensure_ascii=False))
+
+    if arguments["baseline"] is None:
+        return 0
+    with open(arguments["baseline"], "r", encoding="utf-8") as infile:
+        baseline = loads(infile.read())
+    if baseline.get("size") != size:
+        print("Warning: baseline was generated for a report of different "
+              "size: {0}".format(baseline.get("size")))
+    regressions = 0
+    print("{0:24s} {1:>12s} {2:>12s} {3:>8s}".format("stage", "time (s)",
+        "baseline (s)", "ratio"))
+    for name, time, base, ratio, regression in compare(results,
+      baseline.get("results", {}), threshold=arguments["threshold"]):
+        if ratio is None:
+            print("{0:24s} {1:>12s} {2:12.4f} {3:>8s}  FAILED".format(name,
+                "error", base, "-"))
+        else:
+            print("{0:24s} {1:12.4f} {2:12.4f} {3:8.2f}{4}".format(name,
+                time, base, ratio, "  REGRESSION" if regression else ""))
+        regressions += regression
+    return 1 if regressions > 0 else 0
+
+
+#################################### MAIN #####################################
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
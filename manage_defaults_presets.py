@@ -97,9 +97,24 @@ class manage_defaults_presets(object):
             ...
         }
 
+    Defaults and presets applicable to the wrapped method are compiled
+    once for each class of host object and reused for subsequent calls,
+    as long as ``self.defaults`` and ``self.available_presets`` are
+    unchanged (see :meth:`get_stamp`); they are recompiled if either is
+    reassigned, or if either is a path to a YAML file that has been
+    modified. Defaults and presets provided as dicts that are not
+    read-only may be modified in place, and are therefore compiled
+    again on each call; :class:`~myplotspec.FigureManager.FigureManager`
+    stores them read-only. Since compiled defaults and presets are
+    shared among calls, they are passed to the wrapped method as
+    read-only :class:`~myplotspec.ReadOnlyDict` views, which
+    :func:`~myplotspec.merge_dicts` converts into writable dicts.
+
     Attributes:
       verbose (int): Level of verbose output
       debug (int): Level of debug output
+      compiled (dict): Compiled defaults and presets for each class of
+        host object
     """
 
     def __init__(self, verbose=1, debug=0):
@@ -112,6 +127,7 @@ class manage_defaults_presets(object):
         """
         self.verbose = verbose
         self.debug = debug
+        self.compiled = {}
 
     def __call__(self, method):
         """
@@ -141,7 +157,6 @@ class manage_defaults_presets(object):
               Return value of wrapped function
             """
             from copy import copy
-            from . import get_yaml
             from .debug import db_s
 
             db = max(in_kwargs.get("debug", 0), decorator.debug,
@@ -155,14 +170,14 @@ class manage_defaults_presets(object):
 
             out_args = copy(in_args)
             out_kwargs = copy(in_kwargs)
+            compiled = decorator.get_compiled(self)
 
             # Manage defaults
-            if hasattr(self, "defaults"):
-                in_defaults = get_yaml(self.defaults)
-                if method.__name__ in in_defaults:
+            if compiled["defaults_source"] is not None:
+                if compiled["defaults"] is not None:
                     if db >= 1:
                         db_s("defaults available", 1)
-                    out_kwargs["defaults"] = in_defaults[method.__name__]
+                    out_kwargs["defaults"] = compiled["defaults"]
                 else:
                     if db >= 1:
                         db_s("defaults unavailable for this method", 1)
@@ -171,26 +186,108 @@ class manage_defaults_presets(object):
                     db_s("defaults unavailable for this class", 1)
 
             # Manage presets
-            out_presets = {}
-            if hasattr(self, "available_presets"):
-                available_presets = get_yaml(self.available_presets)
-                for preset_name in sorted(available_presets):
-                    preset = available_presets[preset_name]
-                    if method.__name__ in preset:
-                        if db >= 1:
+            if compiled["presets_source"] is not None:
+                if db >= 1:
+                    for preset_name in compiled["preset_names"]:
+                        if preset_name in compiled["presets"]:
                             db_s("preset '{0}'".format(
                                 preset_name) + " available", 1)
-                        out_presets[preset_name] = preset[method.__name__]
-                    else:
-                        if db >= 1:
+                        else:
                             db_s("preset '{0}'".format(
                                 preset_name) + " unavailable for this method",
                                 1)
             else:
                 if db >= 1:
                     db_s("presets unavailable for this class", 1)
-            out_kwargs["available_presets"] = out_presets
+            out_kwargs["available_presets"] = compiled["presets"]
 
             return method(self, *out_args, **out_kwargs)
 
         return wrapped_method
+
+    def get_compiled(self, host):
+        """
+        Compiles defaults and presets applicable to the wrapped method.
+
+        Compiled defaults and presets are stored in :attr:`compiled`,
+        keyed by the class of the host object, and reused as long as
+        the stamps of the host's ``defaults`` and ``available_presets``
+        attributes are those from which they were compiled (see
+        :meth:`get_stamp`). They are compiled from read-only copies of
+        the host's attributes.
+
+        Arguments:
+          host (object): Host object of wrapped method
+
+        Returns:
+          dict: Sources from which defaults and presets were compiled
+          ('defaults_source' and 'presets_source'; None if host lacks
+          the attribute), read-only defaults for the wrapped method
+          ('defaults'; None if unavailable), read-only dict of presets
+          applicable to the wrapped method ('presets'), and sorted
+          names of all available presets ('preset_names')
+        """
+        from . import get_read_only, get_yaml
+
+        defaults_source = getattr(host, "defaults", None)
+        presets_source = getattr(host, "available_presets", None)
+        stamps = (self.get_stamp(defaults_source),
+            self.get_stamp(presets_source))
+        compiled = self.compiled.get(type(host))
+        if (compiled is not None and None not in stamps
+          and compiled["stamps"] == stamps):
+            return compiled
+
+        name = self.method.__name__
+        defaults = None
+        if defaults_source is not None:
+            all_defaults = get_yaml(defaults_source, read_only=True)
+            if name in all_defaults:
+                defaults = get_read_only(all_defaults[name])
+        presets = {}
+        preset_names = []
+        if presets_source is not None:
+            available_presets = get_yaml(presets_source, read_only=True)
+            preset_names = sorted(available_presets)
+            for preset_name in preset_names:
+                preset = available_presets[preset_name]
+                if name in preset:
+                    presets[preset_name] = preset[name]
+
+        compiled = dict(defaults_source=defaults_source,
+            presets_source=presets_source, stamps=stamps, defaults=defaults,
+            presets=get_read_only(presets), preset_names=preset_names)
+        self.compiled[type(host)] = compiled
+        return compiled
+
+    @staticmethod
+    def get_stamp(source):
+        """
+        Identifies the version of a source of defaults or presets.
+
+        Arguments:
+          source (str, dict): Path to YAML file, YAML string, or dict
+
+        Returns:
+          tuple: Stamp that differs if source may have changed; for a
+          path, the path, modification time, and size of the file; for
+          a YAML string, the string; for a read-only dict, its identity;
+          None if source is a dict that is not read-only, whose changes
+          cannot be detected
+        """
+        from os import stat
+        from os.path import abspath, isfile
+        import six
+        from . import ReadOnlyDict, ReadOnlyList
+
+        if source is None:
+            return ("none",)
+        elif isinstance(source, six.string_types):
+            if "\n" not in source and isfile(source):
+                info = stat(source)
+                return ("file", abspath(source), info.st_mtime,
+                    info.st_size)
+            return ("string", source)
+        elif isinstance(source, (ReadOnlyDict, ReadOnlyList)):
+            return ("read_only", id(source))
+        return None
@@ -100,21 +100,63 @@ class manage_kwargs(object):
     All of the above will override defaults provided in the function
     declaration itself.
 
+    If the argument ``resolve_only`` is True, the wrapped function is
+    not run; the accumulated keyword arguments are instead returned.
+    This may be used to inspect the arguments with which a function
+    would be run (e.g. by :meth:`FigureManager.compile_report
+    <myplotspec.FigureManager.FigureManager.compile_report>`). Wrapped
+    functions are marked with the attribute ``_mps_manage_kwargs``, so
+    that callers may check that ``resolve_only`` is supported.
+
+    Since the same defaults, presets, and YAML file are typically
+    passed to many calls (e.g. once for each dataset of a report), the
+    result of merging sources 1-3 is cached, keyed by the defaults,
+    available presets, and YAML file (by identity), selected presets,
+    and selected YAML keys. Defaults merged with presets, and the
+    individual nodes selected from the YAML file, are cached
+    separately, so that calls with different YAML keys may share them.
+    Only arguments provided at call time are merged on each call.
+    Sources are loaded using :func:`~myplotspec.get_yaml` with
+    ``read_only``, so that only read-only sources are cached; dicts
+    that are not already read-only are copied on each call, and may
+    therefore be modified between calls. The read-only YAML file is
+    passed on to the function as ``yaml_spec``, so that calls made by
+    the function with it (e.g. to draw each subplot of a figure) share
+    cache entries.
+
+    Arguments provided at call time are layered over the cached result
+    using :class:`~myplotspec.LayeredDict`, so nested dicts and lists
+    drawn from the cache are copied only if the function accesses them.
+
     Attributes:
       verbose (int): Level of verbose output
       debug (int): Level of debug output
+      cache_size (int): Maximum number of entries in each cache; caches
+        are cleared when exceeded; if 0, caching is disabled
+      cache (dict): Merged defaults, presets, and YAML
+      base_cache (dict): Merged defaults and presets
+      node_cache (dict): Nodes selected from YAML files
+      empty (ReadOnlyDict): Empty dict used in place of omitted
+        defaults, presets, and YAML file, so that they may share cache
+        entries
     """
+    from . import ReadOnlyDict
+
+    empty = ReadOnlyDict()
 
-    def __init__(self, verbose=0, debug=0):
+    def __init__(self, verbose=0, debug=0, cache_size=4096):
         """
         Stores arguments provided at decoration.
 
         Arguments:
           verbose (int): Level of verbose output
           debug (int): Level of debug output
+          cache_size (int): Maximum number of entries in each cache
         """
         self.verbose = verbose
         self.debug = debug
+        self.cache_size = cache_size
+        self.clear_cache()
 
     def __call__(self, function):
         """
@@ -143,11 +185,15 @@ class manage_kwargs(object):
             Returns:
               Return value of wrapped function
             """
-            from copy import deepcopy
             import six
-            from . import get_yaml, merge_dicts, multi_kw
+            from . import LayeredDict, get_yaml, multi_kw
             from .debug import db_s, db_kv
+            from .profiler import get_profiler
 
+            profiler = get_profiler()
+            if profiler is not None:
+                frame = profiler.begin("manage_kwargs")
+            empty = decorator.empty
             db = max(in_kwargs.get("debug", 0), decorator.debug,
                 self.debug if hasattr(self, "debug") else 0)
 
@@ -155,64 +201,41 @@ class manage_kwargs(object):
             if db >= 1:
                 db_s("Managing kwargs for function '{0}':".format(
                     function.__name__))
-            defaults = get_yaml(in_kwargs.pop("defaults", {}))
+            defaults = get_yaml(in_kwargs.pop("defaults", empty),
+                read_only=True)
             available_presets = get_yaml(
-                in_kwargs.pop("available_presets", {}))
+                in_kwargs.pop("available_presets", empty), read_only=True)
             selected_presets = multi_kw(["presets", "preset"], in_kwargs, [])
             if isinstance(selected_presets, six.string_types):
                 selected_presets = [selected_presets]
             elif selected_presets is None:
                 selected_presets = []
-            yaml_spec = get_yaml(in_kwargs.get("yaml_spec", {}))
+            yaml_spec = get_yaml(in_kwargs.get("yaml_spec", empty),
+                read_only=True)
             selected_yaml_keys = list(map(tuple,
                 in_kwargs.get("yaml_keys", [["__complete_file__"]])))
+            resolve_only = in_kwargs.pop("resolve_only", False)
             out_args = in_args
-            out_kwargs = {}
-
-            # Prepare selected yaml keys and determine presets
-            selected_yaml = {}
-            for selected_yaml_key in selected_yaml_keys:
-                node = yaml_spec
-                if selected_yaml_key != ("__complete_file__",):
-                    for key in selected_yaml_key:
-                        if node is None:
-                            node = {}
-                            break
-                        elif key in node.keys():
-                            node = node[key]
-                        elif str(key) in map(str, node.keys()):
-                            node = node[str(key)]
-                        else:
-                            node = {}
-                            break
-                if node is None:
-                    node = {}
-                node = deepcopy(node)
-                selected_yaml[selected_yaml_key] = node
-                if "presets" in node or "preset" in node:
-                    additional_presets = multi_kw(["presets", "preset"], node,
-                        [])
-                    if isinstance(additional_presets, six.string_types):
-                        additional_presets = [additional_presets]
-                    elif additional_presets is None:
-                        addition_presets = []
-                    for additional_preset in additional_presets:
-                        if additional_preset in selected_presets:
-                            selected_presets.remove(additional_preset)
-                        selected_presets.append(additional_preset)
+
+            # Merge defaults, presets, and yaml, or load from cache
+            resolved = decorator.get_resolved(defaults, available_presets,
+                selected_presets, yaml_spec, selected_yaml_keys)
+            selected_presets = list(resolved["presets"])
+            selected_yaml = resolved["yaml"]
             if db >= 1:
                 db_s("Selected presets that are available: '{0}'".format(
                     selected_presets))
 
             # Lowest priority: Defaults
             if db >= 1:
+                out_keys = set()
                 db_s("Low priority: Defaults", 1)
                 for key in sorted(defaults.keys()):
-                    if key in out_kwargs:
+                    if key in out_keys:
                         db_kv(key, defaults[key], 2, "*")
                     else:
                         db_kv(key, defaults[key], 2, "+")
-            out_kwargs = merge_dicts(out_kwargs, defaults)
+                out_keys.update(defaults.keys())
 
             # Low priority: Presets
             if db >= 1:
@@ -222,16 +245,13 @@ class manage_kwargs(object):
                     if selected_preset not in available_presets:
                         continue
                     for key in sorted(available_presets[selected_preset]):
-                        if key in out_kwargs:
+                        if key in out_keys:
                             db_kv(key, available_presets[selected_preset][key],
                                 3, "*")
                         else:
                             db_kv(key, available_presets[selected_preset][key],
                                 3, "+")
-            for selected_preset in selected_presets:
-                if selected_preset in available_presets:
-                    out_kwargs = merge_dicts(out_kwargs,
-                        available_presets[selected_preset])
+                    out_keys.update(available_presets[selected_preset].keys())
 
             # High priorty: Yaml
             if db >= 1:
@@ -239,15 +259,13 @@ class manage_kwargs(object):
                 for selected_yaml_key in selected_yaml_keys:
                     db_s(selected_yaml_key, 2)
                     for key in sorted(selected_yaml[selected_yaml_key]):
-                        if key in out_kwargs:
+                        if key in out_keys:
                             db_kv(key, selected_yaml[selected_yaml_key][key],
                                 3, "*")
                         else:
                             db_kv(key, selected_yaml[selected_yaml_key][key],
                                 3, "+")
-            for selected_yaml_key in selected_yaml_keys:
-                out_kwargs = merge_dicts(out_kwargs,
-                    selected_yaml[selected_yaml_key])
+                    out_keys.update(selected_yaml[selected_yaml_key].keys())
 
             # Highest priorty: Function call
             if db >= 1:
@@ -256,15 +274,181 @@ class manage_kwargs(object):
                     "method call",
                     1)
                 for key in sorted(in_kwargs.keys()):
-                    if key in out_kwargs:
+                    if key in out_keys:
                         db_kv(key, in_kwargs[key], 2, "*")
                     else:
                         db_kv(key, in_kwargs[key], 2, "+")
-            out_kwargs = merge_dicts(out_kwargs, in_kwargs)
+            out_kwargs = LayeredDict([resolved["kwargs"], in_kwargs])
             out_kwargs["presets"] = selected_presets
             out_kwargs["yaml_spec"] = yaml_spec
 
-            # Run function
-            return function(*out_args, **out_kwargs)
+            if profiler is not None:
+                profiler.end(frame)
+
+            # Run function; copy shared values, which would otherwise be
+            #   passed read-only, since ** bypasses LayeredDict's methods
+            if resolve_only:
+                return out_kwargs
+            return function(*out_args, **dict(out_kwargs.items()))
 
+        wrapped_function._mps_manage_kwargs = True
         return wrapped_function
+
+    def clear_cache(self):
+        """
+        Clears cached defaults, presets, and YAML.
+        """
+        self.cache = {}
+        self.base_cache = {}
+        self.node_cache = {}
+
+    def get_resolved(self, defaults, available_presets, selected_presets,
+            yaml_spec, selected_yaml_keys):
+        """
+        Merges defaults, presets, and YAML, or loads them from cache.
+
+        Arguments:
+          defaults (dict): Defaults
+          available_presets (dict): Available presets
+          selected_presets (list): Selected presets, in order of
+            increasing priority
+          yaml_spec (dict): YAML file
+          selected_yaml_keys (list): Selected keys within YAML file, in
+            order of increasing priority
+
+        Returns:
+          dict: Read-only merged keyword arguments ('kwargs'), selected
+          presets including those loaded from the YAML file
+          ('presets'), and read-only node of the YAML file for each
+          selected key ('yaml')
+        """
+        from . import get_read_only, merge_dicts
+
+        sources = (defaults, available_presets, yaml_spec)
+        key = (tuple(map(id, sources)), tuple(selected_presets),
+        tuple(selected_yaml_keys))
+        resolved = self.cache.get(key)
+        if resolved is not None and all(
+          [a is b for a, b in zip(resolved["sources"], sources)]):
+            return resolved
+
+        # Prepare selected yaml keys and determine presets
+        selected_presets = list(selected_presets)
+        selected_yaml = {}
+        for selected_yaml_key in selected_yaml_keys:
+            node, additional_presets = self.get_node(yaml_spec,
+                selected_yaml_key)
+            selected_yaml[selected_yaml_key] = node
+            for additional_preset in additional_presets:
+                if additional_preset in selected_presets:
+                    selected_presets.remove(additional_preset)
+                selected_presets.append(additional_preset)
+
+        # Merge in order of increasing priority
+        out_kwargs = self.get_base(defaults, available_presets,
+            selected_presets)
+        for selected_yaml_key in selected_yaml_keys:
+            out_kwargs = merge_dicts(out_kwargs,
+                selected_yaml[selected_yaml_key])
+
+        resolved = dict(sources=sources, kwargs=get_read_only(out_kwargs),
+            presets=tuple(selected_presets), yaml=selected_yaml)
+        self.store(self.cache, key, resolved)
+        return resolved
+
+    def get_base(self, defaults, available_presets, selected_presets):
+        """
+        Merges defaults and presets, or loads them from cache.
+
+        Arguments:
+          defaults (dict): Defaults
+          available_presets (dict): Available presets
+          selected_presets (list): Selected presets, in order of
+            increasing priority
+
+        Returns:
+          ReadOnlyDict: Merged defaults and presets
+        """
+        from . import get_read_only, merge_dicts
+
+        sources = (defaults, available_presets)
+        key = (tuple(map(id, sources)), tuple(selected_presets))
+        base = self.base_cache.get(key)
+        if base is not None and all(
+          [a is b for a, b in zip(base[0], sources)]):
+            return base[1]
+
+        out_kwargs = merge_dicts({}, defaults)
+        for selected_preset in selected_presets:
+            if selected_preset in available_presets:
+                out_kwargs = merge_dicts(out_kwargs,
+                    available_presets[selected_preset])
+        out_kwargs = get_read_only(out_kwargs)
+
+        self.store(self.base_cache, key, (sources, out_kwargs))
+        return out_kwargs
+
+    def get_node(self, yaml_spec, selected_yaml_key):
+        """
+        Selects a node from a YAML file, or loads it from cache.
+
+        Arguments:
+          yaml_spec (dict): YAML file
+          selected_yaml_key (tuple): Keys leading to node; if
+            ``('__complete_file__',)``, the complete file is selected
+
+        Returns:
+          (ReadOnlyDict, list): Node, excluding any presets it
+          specifies, and presets it specifies
+        """
+        import six
+        from . import get_read_only, multi_kw
+
+        key = (id(yaml_spec), selected_yaml_key)
+        cached = self.node_cache.get(key)
+        if cached is not None and cached[0] is yaml_spec:
+            return cached[1], cached[2]
+
+        node = yaml_spec
+        if selected_yaml_key != ("__complete_file__",):
+            for key_i in selected_yaml_key:
+                if node is None:
+                    node = {}
+                    break
+                elif key_i in node.keys():
+                    node = node[key_i]
+                elif str(key_i) in map(str, node.keys()):
+                    node = node[str(key_i)]
+                else:
+                    node = {}
+                    break
+        if node is None:
+            node = {}
+        additional_presets = []
+        if "presets" in node or "preset" in node:
+            node = dict(node)
+            additional_presets = multi_kw(["presets", "preset"], node, [])
+            if isinstance(additional_presets, six.string_types):
+                additional_presets = [additional_presets]
+            elif additional_presets is None:
+                additional_presets = []
+        node = get_read_only(node)
+
+        self.store(self.node_cache, key,
+            (yaml_spec, node, list(additional_presets)))
+        return node, additional_presets
+
+    def store(self, cache, key, value):
+        """
+        Stores a value in a cache, clearing the cache if it is full.
+
+        Arguments:
+          cache (dict): Cache
+          key (tuple): Key
+          value: Value
+        """
+        if self.cache_size <= 0:
+            return
+        if len(cache) >= self.cache_size:
+            cache.clear()
+        cache[key] = value
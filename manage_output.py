@@ -32,9 +32,45 @@ class manage_output(object):
     ``PdfPages.close()`` method of each outfile in ``outfiles`` is
     called.
 
+    Once it has been saved to each outfile, the figure is closed (i.e.
+    removed from pyplot's figure manager, which would otherwise retain
+    it and its data for the life of the process) unless
+    ``keep_figures`` is True; the closed figure remains usable, and is
+    returned.
+
+    If argument ``writer`` is provided, the figure is instead handed to
+    a :class:`FigureWriter` to be saved on a background thread, and the
+    wrapped function returns as soon as the writer has room for it; the
+    caller must then call :meth:`FigureWriter.close` before closing
+    ``outfiles``, and should not modify the returned figure.
+
+    When ``outfile`` is a list of several formats, the figure is drawn
+    only once for all raster formats (see :meth:`save`).
+
+    If argument ``buffers`` is provided, no outfiles are written;
+    instead the figure is rendered in memory in the format of each
+    outfile (given by its extension, e.g. 'figure.png', or by the
+    outfile itself, e.g. 'png'), and the bytes of each are stored in
+    ``buffers``, keyed by outfile as given (so that two outfiles of the
+    same format are kept apart). Pdf output is then a single page, and
+    ``outfiles`` is left untouched.
+
+    If argument ``rasterize_threshold`` is provided, artists containing
+    more points than the threshold are rasterized within vector outfiles
+    (see :meth:`rasterize`), while axes and text remain vector.
+
     .. todo:
         - Support show()
+
+    Attributes:
+      default_outfile (str): Outfile used if ``outfile`` is not provided
+      raster_formats (dict): Raster formats that may be encoded from a
+        rendered Agg buffer, and their names as understood by
+        :func:`matplotlib.image.imsave`
     """
+    default_outfile = "outfile.pdf"
+    raster_formats = {"png": "png", "jpg": "jpeg", "jpeg": "jpeg",
+        "tif": "tiff", "tiff": "tiff", "webp": "webp"}
 
     def __call__(self, function):
         """
@@ -61,26 +97,60 @@ class manage_output(object):
                 object
               outfiles (dict): Nascent dict of [outfile path]: PdfPages
               savefig_kw (dict): Keyword arguments passed to savefig()
+              keep_figures (bool): Do not close figure once saved; for
+                interactive use
+              writer (FigureWriter): Save figure on a background thread
+                using this writer, rather than before returning
+              buffers (dict): Render figure in memory in the format of
+                each outfile, rather than writing outfiles, and store
+                the resulting bytes in this dict, keyed by outfile
+              rasterize_threshold (int): Rasterize artists with more
+                than this number of points in vector outfiles; see
+                :meth:`rasterize`
               args (tuple): Arguments passed to function
               kwargs (dict): Keyword arguments passed to function
 
             Returns:
               Return value of wrapped function
             """
-            from os.path import abspath, expandvars
+            from io import BytesIO
+            from os.path import abspath, basename, expandvars, splitext
             import six
             import matplotlib
             from matplotlib.backends.backend_pdf import PdfPages
+            import matplotlib.pyplot as pyplot
+            from .memory import get_memory_report
+            from .profiler import get_profiler, span
 
             verbose = kwargs.get("verbose", 1)
             debug = kwargs.get("debug", 0)
             figure = function(*args, **kwargs)
-            outfile = kwargs.pop("outfile", "outfile.pdf")
+            profiler = get_profiler()
+            if profiler is not None:
+                frame = profiler.begin("manage_output")
+                figure_index = profiler.get_figure()
+            outfile = kwargs.pop("outfile", decorator.default_outfile)
             outfiles = kwargs.pop("outfiles", None)
             savefig_kw = kwargs.pop("savefig_kw", {})
+            keep_figures = kwargs.pop("keep_figures", False)
+            writer = kwargs.pop("writer", None)
+            buffers = kwargs.pop("buffers", None)
+            rasterize_threshold = kwargs.pop("rasterize_threshold", None)
+
+            # Rasterize heavy artists
+            if rasterize_threshold is not None:
+                rasterized = decorator.rasterize(figure, rasterize_threshold,
+                    verbose=verbose)
+            else:
+                rasterized = []
 
+            # Prepare outfiles; PdfPages are opened here rather than when
+            # the figure is saved, so that they may be closed by the
+            # caller once all figures have been saved
             if not isinstance(outfile, list):
                 outfile = [outfile]
+            targets = []
+            buffer_keys = []
             for of in outfile:
                 sf_kw = savefig_kw.copy()
                 if isinstance(of, matplotlib.backends.backend_pdf.PdfPages):
@@ -88,24 +158,384 @@ class manage_output(object):
                 elif isinstance(of, six.string_types):
                     of_path = abspath(expandvars(of))
 
-                if of_path.endswith("pdf"):
+                if buffers is not None:
+                    sf_kw["format"] = sf_kw.get("format",
+                        splitext(of_path)[1][1:] or basename(of_path)).lower()
+                    buffer_key = of if isinstance(of, six.string_types) \
+                      else of_path
+                    targets.append(("<{0} buffer>".format(buffer_key),
+                        BytesIO(), sf_kw, False))
+                    buffer_keys.append(buffer_key)
+                elif of_path.endswith("pdf"):
                     sf_kw["format"] = "pdf"
                     if outfiles is None:
-                        of_pdf = PdfPages(of_path)
-                        figure.savefig(of_pdf, **sf_kw)
-                        of_pdf.close()
+                        targets.append((of_path, PdfPages(of_path), sf_kw,
+                            True))
                     elif of_path in outfiles:
-                        of_pdf = outfiles[of_path]
-                        figure.savefig(of_pdf, **sf_kw)
+                        targets.append((of_path, outfiles[of_path], sf_kw,
+                            False))
                     else:
                         of_pdf = outfiles[of_path] = PdfPages(of_path)
-                        figure.savefig(of_pdf, **sf_kw)
+                        targets.append((of_path, of_pdf, sf_kw, False))
                 else:
-                    figure.savefig(of_path, **sf_kw)
+                    targets.append((of_path, of_path, sf_kw, False))
+
+            def save():
+                decorator.save(figure, targets, verbose=verbose,
+                    report_size=len(rasterized) > 0)
+                if buffers is not None:
+                    for key, (label, target, sf_kw, close) in zip(
+                      buffer_keys, targets):
+                        buffers[key] = target.getvalue()
 
-                if verbose:
-                    print("Figure saved to '{0}'.".format(of_path))
+            # Time spent saving on a background thread is attributed to
+            # the figure being saved, rather than that being drawn
+            def save_in_background():
+                if profiler is None:
+                    return save()
+                with span("manage_output", figure=figure_index):
+                    save()
+
+            # Pages are written to PdfPages as they are saved, so figure
+            # may be closed even if its pdf outfiles remain open; closing
+            # only removes figure from pyplot, and does not prevent it
+            # from being saved by writer
+            if writer is None:
+                save()
+                if not keep_figures:
+                    pyplot.close(figure)
+            else:
+                if not keep_figures:
+                    pyplot.close(figure)
+                if buffers is None:
+                    writer.submit(save_in_background,
+                        keys=[t[0] for t in targets])
+                else:
+                    writer.submit(save_in_background)
+            memory_report = get_memory_report()
+            if memory_report is not None:
+                memory_report.record_live_figures(len(pyplot.get_fignums()))
+            if profiler is not None:
+                profiler.end(frame)
 
             return figure
 
         return wrapped_function
+
+    def save(self, figure, targets, verbose=1, **kwargs):
+        """
+        Saves a figure to one or more outfiles.
+
+        Each vector format (e.g. pdf, svg) requires its own walk of the
+        figure's artists, and is saved using ``Figure.savefig()``. Raster
+        formats are drawn only once: the first raster outfile is saved
+        using ``Figure.savefig()``, and the Agg buffer rendered for it is
+        then encoded directly to each subsequent raster outfile. Since
+        all outfiles of a figure are saved with the same ``savefig_kw``,
+        they share the same dpi.
+
+        Arguments:
+          figure (Figure): Figure to save
+          targets (list): (path, path, file object, or PdfPages,
+            savefig keyword arguments, close PdfPages once saved) tuple
+            for each outfile
+          verbose (int): Level of verbose output; if 2 or more, the time
+            required to save each outfile and its size are output
+          report_size (bool): Output size of each outfile if verbose is
+            1
+          kwargs (dict): Additional keyword arguments
+        """
+        from os.path import getsize, splitext
+        from time import time
+        import six
+        from matplotlib.backends.backend_pdf import PdfPages
+        from .profiler import span
+
+        buffer = None
+        for of_path, target, sf_kw, close in targets:
+            start = time()
+            fmt = sf_kw.get("format", splitext(of_path)[1][1:]).lower()
+            reused = False
+            with span("savefig", outfile=of_path, format=fmt):
+                if not isinstance(target, PdfPages) and fmt in \
+                  self.raster_formats:
+                    if buffer is not None:
+                        reused = self.save_buffer(figure, buffer, target,
+                            fmt, sf_kw)
+                    if not reused:
+                        figure.savefig(target, **sf_kw)
+                        if buffer is None:
+                            buffer = self.get_buffer(figure)
+                else:
+                    figure.savefig(target, **sf_kw)
+                if close:
+                    target.close()
+
+            # Size of multi-page pdfs is not known until they are closed
+            size = ""
+            if isinstance(target, six.string_types) or close:
+                size = ", {0:.0f} kB".format(getsize(of_path) / 1024)
+            elif hasattr(target, "getvalue"):
+                size = ", {0:.0f} kB".format(len(target.getvalue()) / 1024)
+
+            if verbose >= 2:
+                print("Figure saved to '{0}' ({1}, {2:.3f} s{3}{4}).".format(
+                    of_path, fmt, time() - start,
+                    ", from rendered buffer" if reused else "", size))
+            elif verbose and kwargs.get("report_size", False) and size:
+                print("Figure saved to '{0}' ({1}).".format(of_path,
+                    size[2:]))
+            elif verbose:
+                print("Figure saved to '{0}'.".format(of_path))
+
+    def rasterize(self, figure, threshold, verbose=1, **kwargs):
+        """
+        Rasterizes artists with many points.
+
+        Each line, collection (e.g. scatter plot), or patch of each
+        subplot containing more than *threshold* points is marked to be
+        rasterized when saved to vector formats, at the dpi at which the
+        figure is saved; raster formats are unaffected. Where a subplot
+        has no rasterization zorder, it is set to the lowest zorder of
+        its remaining artists (including its axes, spines, and text),
+        so that the rasterized artists beneath them are combined into a
+        single image, while the axes and text remain vector.
+
+        Arguments:
+          figure (Figure): Figure
+          threshold (int): Maximum number of points of artists that are
+            not rasterized
+          verbose (int): Level of verbose output; if 1 or more, each
+            rasterized artist is listed
+          kwargs (dict): Additional keyword arguments
+
+        Returns:
+          list: (subplot, artist, number of points) tuple for each
+          rasterized artist
+        """
+        from matplotlib.collections import Collection
+        from matplotlib.lines import Line2D
+        from matplotlib.patches import Patch
+
+        rasterized = []
+        for i, subplot in enumerate(figure.axes):
+            heavy = []
+            light_zorders = []
+            for artist in subplot.get_children():
+                if artist is subplot.patch:
+                    continue
+                n_points = 0
+                if isinstance(artist, Line2D):
+                    n_points = len(artist.get_xydata())
+                elif isinstance(artist, Collection):
+                    n_points = max(len(artist.get_offsets()),
+                        sum([len(p.vertices) for p in artist.get_paths()]))
+                elif isinstance(artist, Patch):
+                    n_points = len(artist.get_path().vertices)
+                if n_points > threshold:
+                    artist.set_rasterized(True)
+                    heavy.append(artist)
+                    rasterized.append((subplot, artist, n_points))
+                    if verbose >= 1:
+                        print("Rasterized {0} '{1}' on subplot {2} ({3} "
+                              "points).".format(type(artist).__name__,
+                            artist.get_label(), i, n_points))
+                elif artist.get_visible():
+                    light_zorders.append(artist.get_zorder())
+            if (len(heavy) > 0 and len(light_zorders) > 0
+              and subplot.get_rasterization_zorder() is None):
+                subplot.set_rasterization_zorder(min(light_zorders))
+
+        return rasterized
+
+    def get_buffer(self, figure):
+        """
+        Copies the Agg buffer most recently rendered for a figure.
+
+        Arguments:
+          figure (Figure): Figure, which has just been saved to a raster
+            format
+
+        Returns:
+          ndarray: RGBA buffer, or None if figure was not rendered by
+          Agg on its own canvas
+        """
+        import numpy as np
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        canvas = figure.canvas
+        if not isinstance(canvas, FigureCanvasAgg) or getattr(canvas,
+          "renderer", None) is None:
+            return None
+        buffer = np.array(canvas.buffer_rgba())
+        if buffer.ndim != 3:
+            return None
+        return buffer
+
+    def save_buffer(self, figure, buffer, outfile, fmt, savefig_kw):
+        """
+        Encodes a rendered Agg buffer to a raster outfile.
+
+        Mirrors the encoding performed by matplotlib's Agg backend. Jpeg
+        outfiles are flattened onto a white background here, rather than
+        by setting ``savefig.facecolor`` within ``rc_context()``, which
+        would change the process-wide ``rcParams`` while other figures
+        are drawn on the main thread.
+
+        Arguments:
+          figure (Figure): Figure from which buffer was rendered
+          buffer (ndarray): RGBA buffer, as returned by
+            :meth:`get_buffer`
+          outfile (str, file): Path to outfile, or file object
+          fmt (str): Format of outfile; key of :attr:`raster_formats`
+          savefig_kw (dict): Keyword arguments with which buffer was
+            rendered
+
+        Returns:
+          bool: True if outfile was saved; False if this version of
+          matplotlib cannot encode buffer, in which case outfile should
+          be saved using ``Figure.savefig()``
+        """
+        import numpy as np
+        import matplotlib
+        from matplotlib.image import imsave
+
+        dpi = savefig_kw.get("dpi", matplotlib.rcParams["savefig.dpi"])
+        if dpi == "figure":
+            dpi = figure.dpi
+        if self.raster_formats[fmt] == "jpeg":
+            alpha = buffer[:, :, 3:4].astype(np.uint32)
+            flattened = np.empty_like(buffer)
+            flattened[:, :, :3] = (buffer[:, :, :3] * alpha
+                + 255 * (255 - alpha) + 127) // 255
+            flattened[:, :, 3] = 255
+            buffer = flattened
+        try:
+            imsave(outfile, buffer, format=self.raster_formats[fmt],
+                origin="upper", dpi=dpi, metadata=savefig_kw.get("metadata"),
+                pil_kwargs=savefig_kw.get("pil_kwargs"))
+        except TypeError:
+            return False
+        return True
+
+
+class FigureWriter(object):
+    """
+    Saves figures on background threads.
+
+    Passed to functions decorated with :class:`manage_output` as
+    argument ``writer``, so that figures may be compressed and written
+    to disk while the next figure is drawn. Saves are held in a bounded
+    queue, so that no more than ``max_queued`` figures are waiting to be
+    saved at once; once it is full, :meth:`submit` blocks until a
+    thread is available. Saves that share an outfile (e.g. pages of the
+    same pdf) are performed in the order in which they were submitted.
+    Exceptions raised while saving are raised again by :meth:`wait`
+    and :meth:`close`.
+
+    Attributes:
+      n_threads (int): Number of threads
+      queue (Queue): Saves waiting for a thread
+      exceptions (list): Information describing each exception raised
+        while saving, as returned by :func:`sys.exc_info`
+    """
+
+    def __init__(self, n_threads=2, max_queued=None):
+        """
+        Initializes and starts threads.
+
+        Arguments:
+          n_threads (int): Number of threads
+          max_queued (int, optional): Maximum number of saves waiting
+            for a thread; by default, *n_threads*
+        """
+        from threading import Thread
+        from six.moves.queue import Queue
+
+        if max_queued is None:
+            max_queued = n_threads
+        self.n_threads = n_threads
+        self.queue = Queue(max_queued)
+        self.exceptions = []
+        self._last_saves = {}
+        self._threads = []
+        for i in range(n_threads):
+            thread = Thread(target=self._work,
+                name="FigureWriter-{0}".format(i))
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, save, keys=None):
+        """
+        Queues a save.
+
+        Arguments:
+          save (function): Function that saves figure, without arguments
+          keys (list, optional): Paths to outfiles written by *save*;
+            *save* will not start until earlier saves to the same paths
+            have completed
+        """
+        from threading import Event
+
+        done = Event()
+        preceding = []
+        for key in keys if keys is not None else []:
+            if key in self._last_saves:
+                preceding.append(self._last_saves[key])
+            self._last_saves[key] = done
+        self.queue.put((save, preceding, done))
+
+    def wait(self):
+        """
+        Waits for all queued saves to complete.
+
+        Raises:
+          Exception: First exception raised while saving, if any
+        """
+        import six
+
+        self.queue.join()
+        self._last_saves.clear()
+        if len(self.exceptions) > 0:
+            exc_info = self.exceptions[0]
+            del self.exceptions[:]
+            six.reraise(*exc_info)
+
+    def close(self):
+        """
+        Waits for all queued saves to complete and stops threads.
+
+        Raises:
+          Exception: First exception raised while saving, if any
+        """
+        for thread in self._threads:
+            self.queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self.wait()
+
+    def _work(self):
+        """
+        Performs queued saves until stopped by :meth:`close`.
+        """
+        from sys import exc_info
+
+        while True:
+            task = self.queue.get()
+            if task is None:
+                self.queue.task_done()
+                return
+            save, preceding, done = task
+            try:
+                # Preceding saves were queued earlier, and so have
+                # already been started by another thread
+                for event in preceding:
+                    event.wait()
+                save()
+            except Exception:
+                self.exceptions.append(exc_info())
+            finally:
+                done.set()
+                self.queue.task_done()
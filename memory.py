@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+#   myplotspec.memory.py
+#
+#   Copyright (C) 2015-2017 Karl T Debiec
+#   All rights reserved.
+#
+#   This software may be modified and distributed under the terms of the
+#   BSD license. See the LICENSE file for details.
+"""
+Records the memory used while drawing a report.
+"""
+################################### MODULES ###################################
+from __future__ import (absolute_import, division, print_function,
+    unicode_literals)
+
+if __name__ == "__main__":
+    __package__ = str("myplotspec")
+    import myplotspec
+
+################################## VARIABLES ##################################
+_memory_report = None
+
+
+################################### CLASSES ###################################
+class MemoryReport(object):
+    """
+    Records the memory used while drawing a report.
+
+    Three sources of memory use are recorded: the peak memory allocated
+    while drawing each figure, measured using :mod:`tracemalloc` (not
+    available in Python 2); the number of figures still open in pyplot
+    after each figure has been saved by
+    :class:`~myplotspec.manage_output.manage_output`; and the memory
+    used by the DataFrames, Series, and arrays held by each entry of a
+    dataset cache, measured using :meth:`DataFrame.memory_usage
+    <pandas.DataFrame.memory_usage>` with ``deep=True``.
+
+    Tracing allocations slows drawing considerably, so reports should be
+    recorded only when investigating memory use.
+
+    Attributes:
+      figures (OrderedDict): Peak memory allocated while drawing
+        ('peak', in bytes) and number of open figures once saved
+        ('live_figures') for each figure, keyed by figure index
+      datasets (list): (cache key, bytes) of each entry of dataset
+        cache
+      figure (int): Index of figure being drawn
+    """
+
+    def __init__(self):
+        """
+        Initializes.
+        """
+        from collections import OrderedDict
+
+        self.figures = OrderedDict()
+        self.datasets = []
+        self.figure = None
+        self._started_tracing = False
+
+    def start(self):
+        """
+        Activates this report, and begins tracing allocations if they are
+        not already being traced.
+
+        Returns:
+          MemoryReport: This report
+        """
+        global _memory_report
+
+        if _memory_report is not None and _memory_report is not self:
+            raise RuntimeError("Another memory report is already active")
+        try:
+            import tracemalloc
+        except ImportError:
+            tracemalloc = None
+        if tracemalloc is not None and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        _memory_report = self
+        return self
+
+    def stop(self):
+        """
+        Deactivates this report, and stops tracing allocations if tracing
+        was begun by :meth:`start`.
+        """
+        global _memory_report
+
+        if self._started_tracing:
+            import tracemalloc
+
+            tracemalloc.stop()
+            self._started_tracing = False
+        if _memory_report is self:
+            _memory_report = None
+
+    def begin_figure(self, figure):
+        """
+        Begins recording the memory used to draw a figure.
+
+        Arguments:
+          figure (int): Figure index
+        """
+        self.figure = figure
+        self.figures[figure] = dict(peak=None, live_figures=None,
+            baseline=None)
+        try:
+            import tracemalloc
+        except ImportError:
+            return
+        if tracemalloc.is_tracing():
+            self.figures[figure]["baseline"] = \
+                tracemalloc.get_traced_memory()[0]
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+
+    def end_figure(self, figure):
+        """
+        Records the peak memory allocated while drawing a figure.
+
+        Before Python 3.9, the peak may not be reset between figures, so
+        that the peak of each figure is that of the report so far.
+
+        Arguments:
+          figure (int): Figure index
+        """
+        try:
+            import tracemalloc
+        except ImportError:
+            tracemalloc = None
+        record = self.figures[figure]
+        baseline = record.pop("baseline", None)
+        if (tracemalloc is not None and tracemalloc.is_tracing()
+          and baseline is not None):
+            record["peak"] = max(tracemalloc.get_traced_memory()[1] -
+                baseline, 0)
+        self.figure = None
+
+    def record_live_figures(self, count):
+        """
+        Records the number of figures open in pyplot once the current
+        figure has been saved.
+
+        Arguments:
+          count (int): Number of open figures
+        """
+        if self.figure in self.figures:
+            self.figures[self.figure]["live_figures"] = count
+
+    def record_datasets(self, dataset_cache):
+        """
+        Records the memory used by each entry of a dataset cache.
+
+        Arguments:
+          dataset_cache (dict): Dataset cache
+        """
+        self.datasets = [(key, get_size(dataset)) for key, dataset in
+            dataset_cache.items()]
+
+    def print_summary(self):
+        """
+        Prints the memory used by each figure and each cached dataset.
+        """
+        mb = 1024.0 ** 2
+
+        print("Memory per figure:")
+        print("{0:>6s}{1:>12s}{2:>14s}".format("figure", "peak (MB)",
+            "live figures"))
+        for figure, record in self.figures.items():
+            print("{0:>6s}{1:>12s}{2:>14s}".format(str(figure),
+                "-" if record["peak"] is None else "{0:.1f}".format(
+                    record["peak"] / mb),
+                "-" if record["live_figures"] is None else str(
+                    record["live_figures"])))
+
+        print("Dataset cache ({0} entries, {1:.1f} MB):".format(
+            len(self.datasets), sum([d[1] for d in self.datasets]) / mb))
+        for key, size in sorted(self.datasets, key=lambda d: -d[1]):
+            print("{0:12.1f}  {1}".format(size / mb, get_label(key)))
+
+
+################################## FUNCTIONS ##################################
+def get_memory_report():
+    """
+    Returns the active memory report.
+
+    Returns:
+      MemoryReport: Active memory report, or None
+    """
+    return _memory_report
+
+
+def get_size(value, depth=1):
+    """
+    Measures the memory used by the data held by a value.
+
+    Counts DataFrames and Series (including the contents of object
+    columns) and numpy arrays that are either *value* itself, or are
+    attributes of, or items within lists or dicts held by, *value*, to
+    the given depth. A dataset's reference to the cache in which it is
+    stored (attribute ``dataset_cache``) is not followed.
+
+    Arguments:
+      value: Value; typically a dataset
+      depth (int): Depth of attributes and items to search
+
+    Returns:
+      int: Size in bytes
+    """
+    import sys
+
+    pd = sys.modules.get("pandas")
+    np = sys.modules.get("numpy")
+
+    if pd is not None and isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    elif pd is not None and isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    elif np is not None and isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    elif depth < 0:
+        return 0
+
+    if isinstance(value, dict):
+        children = list(value.values())
+    elif isinstance(value, (list, tuple)):
+        children = value
+    elif hasattr(value, "__dict__"):
+        children = [v for k, v in vars(value).items() if k !=
+            "dataset_cache"]
+    else:
+        return 0
+    return sum([get_size(child, depth - 1) for child in children])
+
+
+def get_label(cache_key):
+    """
+    Formats a key of a dataset cache.
+
+    Arguments:
+      cache_key (tuple): Cache key, typically as returned by
+        :meth:`Dataset.get_cache_key
+        <myplotspec.Dataset.Dataset.get_cache_key>`
+
+    Returns:
+      str: Name of dataset class and infile, if present in key;
+      otherwise key, truncated to 60 characters
+    """
+    if (isinstance(cache_key, tuple) and len(cache_key) >= 2
+      and isinstance(cache_key[0], type)):
+        return "{0} '{1}'".format(cache_key[0].__name__, cache_key[1])
+    label = str(cache_key)
+    return label if len(label) <= 60 else label[:57] + "..."
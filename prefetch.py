@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+#   myplotspec.prefetch.py
+#
+#   Copyright (C) 2015-2017 Karl T Debiec
+#   All rights reserved.
+#
+#   This software may be modified and distributed under the terms of the
+#   BSD license. See the LICENSE file for details.
+"""
+Loads datasets on background threads, before or ahead of drawing.
+"""
+################################### MODULES ###################################
+from __future__ import (absolute_import, division, print_function,
+    unicode_literals)
+
+if __name__ == "__main__":
+    __package__ = str("myplotspec")
+    import myplotspec
+
+
+################################### CLASSES ###################################
+class DatasetPrefetcher(object):
+    """
+    Loads datasets on background threads ahead of drawing.
+
+    Datasets are requested in the order in which they will be drawn,
+    and are loaded into a dataset cache by one or more threads. Loading
+    proceeds at most *lookahead* datasets ahead of the last dataset
+    drawn, so that the datasets held in memory awaiting drawing remain
+    bounded. When drawing reaches a dataset, :meth:`wait` is called with
+    its cache key: if the dataset is being loaded, it waits until
+    loading is complete, after which the dataset is found in the cache;
+    if loading has not begun, the dataset is left to be loaded by the
+    caller.
+
+    Datasets that fail to load in the background are ignored, so that
+    they are loaded again by the caller, and any error is raised there.
+
+    Attributes:
+      load (function): Function that loads a dataset into the cache,
+        called with the keyword arguments of each request
+      requests (list): (cache key, keyword arguments) of each dataset,
+        in the order in which they will be drawn, omitting duplicate
+        keys
+      positions (dict): Position of each cache key within
+        :attr:`requests`
+      lookahead (int): Maximum number of datasets loaded ahead of the
+        last dataset drawn
+      loaded (dict): Event set once each requested dataset has been
+        loaded or has failed to load, keyed by cache key
+    """
+
+    def __init__(self, load, requests, n_threads=2, lookahead=8):
+        """
+        Initializes, and starts threads.
+
+        Arguments:
+          load (function): Function that loads a dataset into the cache
+          requests (list): (cache key, keyword arguments) of each
+            dataset, in the order in which they will be drawn
+          n_threads (int): Number of threads
+          lookahead (int): Maximum number of datasets loaded ahead of
+            the last dataset drawn
+        """
+        from threading import Condition, Event, Thread
+
+        self.load = load
+        self.requests = []
+        self.positions = {}
+        self.loaded = {}
+        for key, kwargs in requests:
+            if key is None or key in self.positions:
+                continue
+            self.positions[key] = len(self.requests)
+            self.requests.append((key, kwargs))
+            self.loaded[key] = Event()
+        self.lookahead = max(lookahead, 1)
+        self._condition = Condition()
+        self._issued = 0
+        self._drawn = 0
+        self._closed = False
+        self._threads = []
+        for i in range(n_threads):
+            thread = Thread(target=self._work,
+                name="DatasetPrefetcher-{0}".format(i))
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def wait(self, key):
+        """
+        Waits for a dataset to be loaded, if it is being loaded.
+
+        Arguments:
+          key (tuple): Cache key of dataset
+
+        Returns:
+          bool: True if dataset was loaded in the background (or failed
+          to load); False if it was not requested or loading had not
+          begun, in which case it should be loaded by the caller
+        """
+        position = self.positions.get(key)
+        if position is None:
+            return False
+        with self._condition:
+            if position >= self._drawn:
+                self._drawn = position + 1
+                self._condition.notify_all()
+            issued = position < self._issued
+            if not issued:
+                self._issued = position + 1
+        if issued:
+            self.loaded[key].wait()
+        return issued
+
+    def close(self):
+        """
+        Stops issuing requests, and waits for datasets being loaded.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self):
+        """
+        Loads requested datasets until all have been issued or prefetcher
+        is closed.
+        """
+        while True:
+            with self._condition:
+                while (not self._closed and self._issued < len(self.requests)
+                  and self._issued >= self._drawn + self.lookahead):
+                    self._condition.wait()
+                if self._closed or self._issued >= len(self.requests):
+                    return
+                key, kwargs = self.requests[self._issued]
+                self._issued += 1
+            try:
+                self.load(**kwargs)
+            except Exception:
+                pass
+            finally:
+                self.loaded[key].set()
+
+
+################################## FUNCTIONS ##################################
+def preload_datasets(load, requests, n_threads=4, **kwargs):
+    """
+    Loads datasets in parallel.
+
+    Requests are deduplicated by cache key. Requests whose infiles are
+    within the same hdf5 file are loaded one after another on the same
+    thread, within a :class:`~myplotspec.Dataset.HDF5FileHolder`, so
+    that each hdf5 file is opened only once; other requests are each
+    loaded separately. Datasets that fail to load are ignored, so that
+    they are loaded again when drawn, and any error is raised then.
+
+    Arguments:
+      load (function): Function that loads a dataset into the cache,
+        called with the keyword arguments of each request
+      requests (list): (cache key, keyword arguments) of each dataset
+      n_threads (int): Number of threads
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      (int, int): Number of datasets loaded, and number of hdf5 files
+      from which they were loaded
+    """
+    from collections import OrderedDict
+    from multiprocessing.pool import ThreadPool
+    from .Dataset import HDF5FileHolder
+
+    # Deduplicate requests and group by hdf5 file
+    groups = OrderedDict()
+    seen = set()
+    for key, request_kw in requests:
+        if key is None or key in seen:
+            continue
+        seen.add(key)
+        path = get_hdf5_path(**request_kw)
+        group_key = ("hdf5", path) if path is not None else ("other", key)
+        groups.setdefault(group_key, []).append(request_kw)
+
+    def load_group(group):
+        loaded = 0
+        with HDF5FileHolder():
+            for request_kw in group:
+                try:
+                    load(**request_kw)
+                except Exception:
+                    continue
+                loaded += 1
+        return loaded
+
+    pool = ThreadPool(max(min(n_threads, len(groups)), 1))
+    try:
+        loaded = sum(pool.map(load_group, list(groups.values())))
+    finally:
+        pool.close()
+        pool.join()
+    return loaded, len([k for k in groups if k[0] == "hdf5"])
+
+
+def get_hdf5_path(**kwargs):
+    """
+    Determines the hdf5 file from which a dataset is loaded.
+
+    Arguments:
+      infile[s] (str, list): Path(s) to infile(s); hdf5 infiles are in
+        the form ``/path/to/file.h5:/address/within/file``
+      kwargs (dict): Additional keyword arguments
+
+    Returns:
+      str: Path to hdf5 file, with environment variables expanded, if
+      all infiles are within the same hdf5 file; otherwise None
+    """
+    from os.path import expandvars
+    import re
+    import six
+    from . import multi_get_merged
+
+    re_h5 = re.compile(
+      r"^(?P<path>(.+)\.(h5|hdf5))((:)?(/)?(?P<address>.+))?$",
+      flags=re.UNICODE)
+
+    paths = set()
+    for infile in multi_get_merged(["infile", "infiles"], kwargs):
+        match = re_h5.match(infile) if isinstance(infile,
+            six.string_types) else None
+        if match is None:
+            return None
+        paths.add(expandvars(match.groupdict()["path"]))
+    return paths.pop() if len(paths) == 1 else None
+
+
+def get_cache_key(cls=None, **kwargs):
+    """
+    Generates the key with which a dataset is stored in a dataset cache.
+
+    Arguments:
+      cls (class, str): Dataset class; see
+        :func:`~myplotspec.get_dataset_class`
+      kwargs (dict): Keyword arguments with which dataset is loaded
+
+    Returns:
+      tuple: Cache key, as generated by the class's
+      :meth:`~myplotspec.Dataset.Dataset.get_cache_key`; None if the
+      class does not support caching, or if the key is not hashable
+    """
+    from . import get_dataset_class
+
+    cls = get_dataset_class(cls)
+    if cls is None or not hasattr(cls, "get_cache_key"):
+        return None
+    try:
+        key = cls.get_cache_key(**kwargs)
+        hash(key)
+    except TypeError:
+        return None
+    return key
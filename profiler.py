@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+#   myplotspec.profiler.py
+#
+#   Copyright (C) 2015-2017 Karl T Debiec
+#   All rights reserved.
+#
+#   This software may be modified and distributed under the terms of the
+#   BSD license. See the LICENSE file for details.
+"""
+Records the time spent in each stage of drawing a report.
+
+Stages of drawing are instrumented using :func:`span`; while no
+:class:`Profiler` is active, :func:`span` returns a shared span that
+does nothing, so that instrumented code costs only a function call and
+a comparison.
+"""
+################################### MODULES ###################################
+from __future__ import (absolute_import, division, print_function,
+    unicode_literals)
+
+if __name__ == "__main__":
+    __package__ = str("myplotspec")
+    import myplotspec
+
+################################## VARIABLES ##################################
+_profiler = None
+
+
+################################### CLASSES ###################################
+class Profiler(object):
+    """
+    Records the time spent in each stage of drawing a report.
+
+    Time is recorded in spans, each of which belongs to a stage (e.g.
+    'draw_figure'). Spans opened on the same thread are nested within
+    one another; the total time of a span includes the spans nested
+    within it, while its self time does not. Each span belongs to the
+    figure given by its ``figure`` tag, or otherwise to the figure of
+    the span within which it is nested. Time is aggregated for each
+    stage, and for each stage of each figure.
+
+    If ``trace`` is True, each span is additionally stored as an event,
+    so that the complete timeline of a report, including spans that
+    overlap on different threads, may be written using
+    :meth:`write_trace` and inspected in a trace viewer.
+
+    Attributes:
+      stages (OrderedDict): [calls, total time, self time] of each
+        stage, in seconds
+      figures (OrderedDict): [calls, total time, self time] of each
+        stage of each figure, keyed by figure index (None for spans
+        outside any figure) and then by stage
+      events (list): (stage, start time, elapsed time, thread, tags) of
+        each span, if ``trace`` is True; otherwise None
+      threads (dict): Names of threads on which spans were opened
+      stage_order (list): Order in which stages are listed in summary
+      stage_labels (dict): Short labels of stages, used in the header of
+        the per-figure summary
+      start_time (float): Time at which profiler was started
+      stop_time (float): Time at which profiler was stopped
+    """
+    stage_order = ["draw_report", "draw_figure", "draw_subplot",
+        "draw_dataset", "load_dataset", "calc_pdist", "manage_kwargs",
+        "manage_output", "savefig"]
+    stage_labels = {"draw_report": "report", "draw_figure": "figure",
+        "draw_subplot": "subplot", "draw_dataset": "dataset",
+        "load_dataset": "load", "calc_pdist": "pdist",
+        "manage_kwargs": "kwargs", "manage_output": "output",
+        "savefig": "savefig"}
+
+    def __init__(self, trace=False):
+        """
+        Initializes.
+
+        Arguments:
+          trace (bool): Store each span, so that a trace may be written
+        """
+        from collections import OrderedDict
+        from threading import Lock, local
+        from timeit import default_timer
+
+        self.clock = default_timer
+        self.stages = OrderedDict()
+        self.figures = OrderedDict()
+        self.events = [] if trace else None
+        self.threads = {}
+        self.start_time = None
+        self.stop_time = None
+        self._local = local()
+        self._lock = Lock()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        """
+        Activates this profiler, so that spans are recorded.
+
+        Returns:
+          Profiler: This profiler
+        """
+        global _profiler
+
+        if _profiler is not None and _profiler is not self:
+            raise RuntimeError("Another profiler is already active")
+        self.start_time = self.clock()
+        _profiler = self
+        return self
+
+    def stop(self):
+        """
+        Deactivates this profiler.
+        """
+        global _profiler
+
+        self.stop_time = self.clock()
+        if _profiler is self:
+            _profiler = None
+
+    def begin(self, stage, **tags):
+        """
+        Opens a span on the current thread.
+
+        Arguments:
+          stage (str): Stage to which span belongs
+          tags (dict): Tags of span; 'figure' sets the figure to which
+            span belongs
+
+        Returns:
+          list: Span, to be passed to :meth:`end`
+        """
+        stack = self.get_stack()
+        figure = tags.get("figure", stack[-1][3] if stack else None)
+        frame = [stage, self.clock(), 0.0, figure, tags]
+        stack.append(frame)
+        return frame
+
+    def end(self, frame):
+        """
+        Closes a span, and any spans left open within it.
+
+        Arguments:
+          frame (list): Span, as returned by :meth:`begin`
+        """
+        end = self.clock()
+        stack = self.get_stack()
+        while len(stack) > 0:
+            if stack.pop() is frame:
+                break
+        elapsed = end - frame[1]
+        if len(stack) > 0:
+            stack[-1][2] += elapsed
+        self.record(frame[0], frame[3], elapsed, elapsed - frame[2])
+        if self.events is not None:
+            self.events.append((frame[0], frame[1], elapsed,
+                self._local.ident, frame[4]))
+
+    def record(self, stage, figure, elapsed, self_elapsed):
+        """
+        Adds the time of a span to the totals of its stage and figure.
+
+        Arguments:
+          stage (str): Stage
+          figure (int): Figure index, or None
+          elapsed (float): Total time, in seconds
+          self_elapsed (float): Self time, in seconds
+        """
+        from collections import OrderedDict
+
+        with self._lock:
+            if figure not in self.figures:
+                self.figures[figure] = OrderedDict()
+            for totals in (self.stages, self.figures[figure]):
+                if stage not in totals:
+                    totals[stage] = [0, 0.0, 0.0]
+                totals[stage][0] += 1
+                totals[stage][1] += elapsed
+                totals[stage][2] += self_elapsed
+
+    def get_stack(self):
+        """
+        Lists the open spans of the current thread.
+
+        Returns:
+          list: Open spans, outermost first
+        """
+        from threading import current_thread
+
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            thread = current_thread()
+            stack = self._local.stack = []
+            self._local.ident = thread.ident
+            with self._lock:
+                self.threads[thread.ident] = thread.name
+        return stack
+
+    def get_figure(self):
+        """
+        Determines the figure of the innermost open span of the current
+        thread.
+
+        Returns:
+          int: Figure index, or None
+        """
+        stack = self.get_stack()
+        return stack[-1][3] if stack else None
+
+    def get_stages(self):
+        """
+        Lists recorded stages, in the order in which they are summarized.
+
+        Returns:
+          list: Stages
+        """
+        return [s for s in self.stage_order if s in self.stages] + [s for s
+            in self.stages if s not in self.stage_order]
+
+    def print_summary(self):
+        """
+        Prints the time spent in each stage, and in each stage of each
+        figure.
+
+        Self times of spans run on background threads (e.g. figures
+        saved by a :class:`~.manage_output.FigureWriter`) overlap those
+        on the main thread, so that percentages may add up to more than
+        100.
+        """
+        stages = self.get_stages()
+        stop_time = self.stop_time if self.stop_time is not None else \
+            self.clock()
+        wall = max(stop_time - self.start_time, 1e-9)
+
+        print("Profile ({0:.3f} s):".format(wall))
+        print("{0:16s}{1:>8s}{2:>12s}{3:>12s}{4:>8s}".format("stage", "calls",
+            "total (s)", "self (s)", "self %"))
+        for stage in stages:
+            calls, total, self_total = self.stages[stage]
+            print("{0:16s}{1:8d}{2:12.3f}{3:12.3f}{4:8.1f}".format(stage,
+                calls, total, self_total, 100 * self_total / wall))
+
+        print("Self time per figure (s):")
+        print("{0:>6s}{1:>10s}".format("figure", "total") + "".join(
+            ["{0:>8s}".format(self.stage_labels.get(s, s)[:7]) for s in
+                stages]))
+        for figure, totals in self.figures.items():
+            print("{0:>6s}{1:10.3f}".format("-" if figure is None else
+                str(figure), sum([t[2] for t in totals.values()])) + "".join(
+                ["{0:8.3f}".format(totals[s][2]) if s in totals else
+                    "{0:>8s}".format("") for s in stages]))
+
+    def get_trace(self):
+        """
+        Formats recorded spans as Chrome trace events.
+
+        Each span is a complete ('X') event named for its stage, whose
+        arguments are the span's tags (e.g. figure index, infile, or
+        outfile); each thread is named using a metadata ('M') event.
+        Times are in microseconds from the start of the profiler.
+
+        Returns:
+          dict: Trace, in the Trace Event Format understood by
+          ``chrome://tracing`` and Perfetto
+        """
+        from os import getpid
+        import six
+
+        if self.events is None:
+            raise ValueError("Profiler was not initialized with trace=True")
+
+        def get_json_safe(value):
+            if isinstance(value, (list, tuple)):
+                return [get_json_safe(v) for v in value]
+            elif value is None or isinstance(value, (bool, float,
+              six.integer_types, six.string_types)):
+                return value
+            return six.text_type(value)
+
+        pid = getpid()
+        trace_events = []
+        for ident, name in sorted(self.threads.items(),
+          key=lambda t: t[0] or 0):
+            trace_events.append(dict(name="thread_name", ph="M", pid=pid,
+                tid=ident, args=dict(name=name)))
+        for stage, start, elapsed, ident, tags in sorted(self.events,
+          key=lambda e: e[1]):
+            trace_events.append(dict(name=stage, cat=stage, ph="X",
+                ts=(start - self.start_time) * 1e6, dur=elapsed * 1e6,
+                pid=pid, tid=ident, args=dict([(k, get_json_safe(v)) for k, v
+                    in tags.items()])))
+        return dict(traceEvents=trace_events, displayTimeUnit="ms")
+
+    def write_trace(self, outfile):
+        """
+        Writes recorded spans to a Chrome trace file.
+
+        Arguments:
+          outfile (str): Path to outfile; may contain environment
+            variables
+        """
+        from io import open
+        from json import dumps
+        from os.path import expandvars
+
+        with open(expandvars(outfile), "w", encoding="utf-8") as trace_file:
+            trace_file.write(dumps(self.get_trace(), ensure_ascii=False))
+
+
+class _Span(object):
+    """
+    Span recorded by a profiler, for use as a context manager.
+    """
+    __slots__ = ("profiler", "stage", "tags", "frame")
+
+    def __init__(self, profiler, stage, tags):
+        self.profiler = profiler
+        self.stage = stage
+        self.tags = tags
+        self.frame = None
+
+    def __enter__(self):
+        self.frame = self.profiler.begin(self.stage, **self.tags)
+        return self
+
+    def __exit__(self, *args):
+        self.profiler.end(self.frame)
+        return False
+
+
+class _NullSpan(object):
+    """
+    Span that records nothing, used while no profiler is active.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+_null_span = _NullSpan()
+
+
+################################## FUNCTIONS ##################################
+def get_profiler():
+    """
+    Returns the active profiler.
+
+    Returns:
+      Profiler: Active profiler, or None
+    """
+    return _profiler
+
+
+def span(stage, **tags):
+    """
+    Records the time spent within a ``with`` block in the active
+    profiler.
+
+    Arguments:
+      stage (str): Stage to which block belongs
+      tags (dict): Tags of span; 'figure' sets the figure to which span
+        belongs
+
+    Returns:
+      Context manager that records the block if a profiler is active,
+      and otherwise does nothing
+    """
+    if _profiler is None:
+        return _null_span
+    return _Span(_profiler, stage, tags)
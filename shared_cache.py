@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+#   myplotspec.shared_cache.py
+#
+#   Copyright (C) 2015-2017 Karl T Debiec
+#   All rights reserved.
+#
+#   This software may be modified and distributed under the terms of the
+#   BSD license. See the LICENSE file for details.
+"""
+Shares a dataset cache between processes.
+
+Unlike the rest of myplotspec, this module requires Python 3.8 or later
+(:mod:`multiprocessing.shared_memory`), and is not imported by the
+package itself.
+"""
+################################### MODULES ###################################
+from __future__ import (absolute_import, division, print_function,
+    unicode_literals)
+
+if __name__ == "__main__":
+    __package__ = str("myplotspec")
+    import myplotspec
+from collections.abc import MutableMapping
+
+
+################################### CLASSES ###################################
+class SharedDatasetCache(MutableMapping):
+    """
+    Dataset cache whose datasets are shared between processes.
+
+    May be used in place of the dict :attr:`FigureManager.dataset_cache
+    <myplotspec.FigureManager.FigureManager.dataset_cache>` (e.g.
+    ``FigureManager(dataset_cache=SharedDatasetCache())``), and passed to
+    worker processes, either as an argument or by pickling. When a
+    dataset is stored, the values of each numeric column and index of
+    each DataFrame it holds as an attribute, and each numeric array it
+    holds as an attribute, are copied into a
+    :class:`~multiprocessing.shared_memory.SharedMemory` block. The
+    names of the blocks, together with the dataset's class, remaining
+    attributes, and non-numeric columns, are stored in a dict held by a
+    :class:`~multiprocessing.managers.SyncManager`. A process that looks
+    up a dataset that it has not loaded itself reconstructs it without
+    calling its constructor, from arrays backed by the shared blocks, so
+    that its data are neither read again nor copied.
+
+    Datasets whose attributes cannot be pickled are cached only within
+    the process that loaded them. Arrays backed by shared blocks are
+    writable, and changes made to them are seen by every process. A
+    dataset stored again by the process that stored it replaces the
+    shared entry; if another process stored the same key first, its
+    entry is kept, and its dataset is used in place of the one stored.
+
+    The process that creates the cache owns it; once all processes are
+    finished with the cache, the owner should call :meth:`unlink` (or
+    use the cache as a context manager), which frees the shared blocks
+    and shuts down the manager. Other processes may call :meth:`close`
+    to detach from the blocks.
+
+    Attributes:
+      entries (DictProxy): Description of each shared dataset, keyed by
+        cache key, each pickled (see :meth:`encode`)
+      local (dict): Datasets stored or reconstructed in this process,
+        keyed by cache key
+      owner (bool): Whether this process created the cache
+    """
+
+    def __init__(self, manager=None):
+        """
+        Initializes, and starts manager.
+
+        Arguments:
+          manager (SyncManager): Started manager in which to hold
+            descriptions of datasets; if None, a manager is started,
+            and shut down by :meth:`unlink`
+        """
+        if manager is None:
+            from multiprocessing import Manager
+
+            self._manager = Manager()
+            manager = self._manager
+        else:
+            self._manager = None
+        self.entries = manager.dict()
+        self.local = {}
+        self.owner = True
+        self._blocks = {}
+        self._written = {}
+
+    def __getstate__(self):
+        return dict(entries=self.entries)
+
+    def __setstate__(self, state):
+        self.entries = state["entries"]
+        self.local = {}
+        self.owner = False
+        self._manager = None
+        self._blocks = {}
+        self._written = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        if self.owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def __contains__(self, key):
+        return key in self.local or self.encode(key) in self.entries
+
+    def __getitem__(self, key):
+        import pickle
+
+        if key in self.local:
+            return self.local[key]
+        entry = pickle.loads(self.entries[self.encode(key)])
+        dataset = self.local[key] = self.reconstruct(entry)
+        return dataset
+
+    def __setitem__(self, key, dataset):
+        import pickle
+
+        self.local[key] = dataset
+        try:
+            entry = self.share(dataset)
+        except Exception:
+            return
+
+        # If this process stored the key before, replace its entry and
+        # free its blocks; if another process stored the key first, keep
+        # its entry, free the blocks created here, and use its dataset,
+        # so that every process sees the same data
+        encoded_key = self.encode(key)
+        encoded = pickle.dumps(entry, protocol=-1)
+        previous = self._written.pop(encoded_key, None)
+        if previous is not None:
+            stored = self.entries.get(encoded_key)
+            if stored is None or stored == previous:
+                self.entries[encoded_key] = encoded
+                self._written[encoded_key] = encoded
+                for name in self.get_block_names(pickle.loads(previous)):
+                    self.unlink_block(name)
+                return
+        stored = self.entries.setdefault(encoded_key, encoded)
+        if stored == encoded:
+            self._written[encoded_key] = encoded
+        else:
+            for name in self.get_block_names(entry):
+                self.unlink_block(name)
+            del self.local[key]
+
+    def __delitem__(self, key):
+        import pickle
+
+        in_local = key in self.local
+        self.local.pop(key, None)
+        self._written.pop(self.encode(key), None)
+        entry = self.entries.pop(self.encode(key), None)
+        if entry is None and not in_local:
+            raise KeyError(key)
+        if entry is not None:
+            for name in self.get_block_names(pickle.loads(entry)):
+                self.unlink_block(name)
+
+    def __iter__(self):
+        import pickle
+
+        keys = [pickle.loads(k) for k in self.entries.keys()]
+        return iter(keys + [k for k in self.local if k not in keys])
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+    @staticmethod
+    def encode(key):
+        """
+        Encodes a cache key as a key of :attr:`entries`.
+
+        Keys and descriptions of datasets are stored in :attr:`entries`
+        pickled, so that the manager does not need to import the classes
+        of datasets.
+
+        Arguments:
+          key (tuple): Cache key
+
+        Returns:
+          bytes: Pickled key
+        """
+        import pickle
+
+        return pickle.dumps(key, protocol=-1)
+
+    def share(self, dataset):
+        """
+        Copies the data of a dataset into shared blocks.
+
+        Arguments:
+          dataset (object): Dataset
+
+        Returns:
+          dict: Description of dataset, from which it may be
+          reconstructed by :meth:`reconstruct`
+        """
+        import pickle
+        import numpy as np
+        import pandas as pd
+
+        attrs = {}
+        frames = {}
+        arrays = {}
+        for name, value in vars(dataset).items():
+            if name == "dataset_cache":
+                continue
+            elif isinstance(value, pd.DataFrame):
+                frames[name] = value
+            elif (isinstance(value, np.ndarray)
+              and value.dtype.kind in "biufc"):
+                arrays[name] = value
+            else:
+                attrs[name] = value
+
+        # Fail before creating blocks if dataset cannot be pickled
+        pickle.dumps((type(dataset), attrs), protocol=-1)
+
+        entry = dict(cls=type(dataset), attrs=attrs, frames={}, arrays={})
+        created = []
+        try:
+            for name, dataframe in frames.items():
+                columns = []
+                for i in range(dataframe.shape[1]):
+                    values = dataframe.iloc[:, i].values
+                    if (isinstance(values, np.ndarray)
+                      and values.dtype.kind in "biufc"):
+                        columns.append(self.create_block(values, created))
+                    else:
+                        columns.append(("values", values))
+                index = dataframe.index
+                if (not isinstance(index, pd.MultiIndex)
+                  and isinstance(index.values, np.ndarray)
+                  and index.values.dtype.kind in "biufc"):
+                    index = (self.create_block(index.values, created),
+                        index.name)
+                entry["frames"][name] = dict(columns=dataframe.columns,
+                    values=columns, index=index)
+            for name, array in arrays.items():
+                entry["arrays"][name] = self.create_block(array, created)
+            pickle.dumps(entry["frames"], protocol=-1)
+        except Exception:
+            for name in created:
+                self.unlink_block(name)
+            raise
+        return entry
+
+    def reconstruct(self, entry):
+        """
+        Reconstructs a dataset from arrays backed by shared blocks.
+
+        Arguments:
+          entry (dict): Description of dataset, as returned by
+          :meth:`share`
+
+        Returns:
+          object: Dataset
+        """
+        from collections import OrderedDict
+        import pandas as pd
+
+        cls = entry["cls"]
+        dataset = cls.__new__(cls)
+        for name, value in entry["attrs"].items():
+            setattr(dataset, name, value)
+        for name, frame in entry["frames"].items():
+            data = OrderedDict()
+            for i, column in enumerate(frame["values"]):
+                if column[0] == "values":
+                    data[i] = column[1]
+                else:
+                    data[i] = self.attach_block(column)
+            index = frame["index"]
+            if isinstance(index, tuple):
+                index = pd.Index(self.attach_block(index[0]), name=index[1],
+                    copy=False)
+            dataframe = pd.DataFrame(data, index=index, copy=False)
+            dataframe.columns = frame["columns"]
+            setattr(dataset, name, dataframe)
+        for name, block in entry["arrays"].items():
+            setattr(dataset, name, self.attach_block(block))
+        dataset.dataset_cache = self
+        return dataset
+
+    def create_block(self, array, created):
+        """
+        Copies an array into a new shared block.
+
+        Arguments:
+          array (ndarray): Array
+          created (list): Names of blocks created; name of new block is
+            appended
+
+        Returns:
+          tuple: ('block', name, dtype, shape) of new block
+        """
+        import numpy as np
+        from multiprocessing.shared_memory import SharedMemory
+
+        array = np.ascontiguousarray(array)
+        block = SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._untrack(block)
+        created.append(block.name)
+        self._blocks[block.name] = block
+        shared = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        shared[...] = array
+        return ("block", block.name, array.dtype.str, array.shape)
+
+    def attach_block(self, descriptor):
+        """
+        Constructs an array backed by a shared block.
+
+        Arguments:
+          descriptor (tuple): ('block', name, dtype, shape) of block, as
+            returned by :meth:`create_block`
+
+        Returns:
+          ndarray: Array backed by block
+        """
+        import numpy as np
+
+        label, name, dtype, shape = descriptor
+        return np.ndarray(shape, dtype=np.dtype(dtype),
+            buffer=self.get_block(name).buf)
+
+    def get_block(self, name):
+        """
+        Attaches to a shared block, if not already attached.
+
+        Arguments:
+          name (str): Name of block
+
+        Returns:
+          SharedMemory: Block
+        """
+        from multiprocessing.shared_memory import SharedMemory
+
+        if name not in self._blocks:
+            block = SharedMemory(name=name)
+            self._untrack(block)
+            self._blocks[name] = block
+        return self._blocks[name]
+
+    def unlink_block(self, name):
+        """
+        Frees a shared block; its memory is released once every process
+        has detached from it.
+
+        Arguments:
+          name (str): Name of block
+        """
+        try:
+            block = self.get_block(name)
+        except FileNotFoundError:
+            return
+        try:
+            from multiprocessing import resource_tracker
+        except ImportError:
+            resource_tracker = None
+        if resource_tracker is not None:
+            # SharedMemory.unlink unregisters block from resource tracker
+            resource_tracker.register(block._name, "shared_memory")
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def get_block_names(entry):
+        """
+        Lists the shared blocks of a dataset.
+
+        Arguments:
+          entry (dict): Description of dataset, as returned by
+            :meth:`share`
+
+        Returns:
+          list: Names of blocks
+        """
+        descriptors = list(entry["arrays"].values())
+        for frame in entry["frames"].values():
+            descriptors += list(frame["values"])
+            if isinstance(frame["index"], tuple):
+                descriptors.append(frame["index"][0])
+        return [d[1] for d in descriptors if d[0] == "block"]
+
+    def close(self):
+        """
+        Forgets datasets held by this process, and detaches from shared
+        blocks.
+
+        Blocks whose arrays remain referenced outside the cache cannot be
+        detached, and remain attached until the process exits.
+        """
+        self.local.clear()
+        for name, block in list(self._blocks.items()):
+            try:
+                block.close()
+            except BufferError:
+                continue
+            del self._blocks[name]
+
+    def unlink(self):
+        """
+        Frees all shared blocks, and shuts down manager if it was started
+        by this cache.
+        """
+        import pickle
+
+        if self.owner:
+            names = set()
+            for entry in self.entries.values():
+                names.update(self.get_block_names(pickle.loads(entry)))
+            self.entries.clear()
+            self._written.clear()
+            for name in names:
+                self.unlink_block(name)
+            self.close()
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    @staticmethod
+    def _untrack(block):
+        """
+        Stops the resource tracker from freeing a block when the process
+        that created or attached to it exits; blocks are instead freed by
+        :meth:`unlink`.
+
+        Arguments:
+          block (SharedMemory): Block
+        """
+        try:
+            from multiprocessing import resource_tracker
+        except ImportError:
+            return
+        try:
+            resource_tracker.unregister(block._name, "shared_memory")
+        except Exception:
+            pass